@@ -0,0 +1,68 @@
+"""
+Benchmark de disco dos salvamentos automáticos: JSON com data x autosaves deduplicados
+
+Uso: python benchmarks/bench_autosaves.py [construções] [minutos]
+Padrão: cidade com 100 mil construções, 60 minutos de jogo com um autosave a
+cada 30 s; entre dois autosaves a cidade ganha 20 construções e 20 melhorias.
+"""
+
+import sys
+import os
+import time
+import tempfile
+from datetime import datetime, timedelta
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from models.cidade import Cidade
+from core.salvamento import GerenciadorSalvamento
+from core.autosaves import ArmazemAutosaves
+
+NOMES = ["Painel Solar", "Ciclovia", "Parque Público", "Usina Reciclagem", "Parque Eólico"]
+
+
+def tamanho_pasta(pasta):
+    return sum(os.path.getsize(os.path.join(raiz, arquivo))
+               for raiz, _, arquivos in os.walk(pasta) for arquivo in arquivos)
+
+
+def main():
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    minutos = int(sys.argv[2]) if len(sys.argv) > 2 else 60
+    pasta = tempfile.mkdtemp(prefix="ecocity_autosaves_")
+    cidade = Cidade("Benchmark")
+    cidade.historico = None
+    cidade.recursos.dinheiro = 10**12
+    cidade.construir_em_lote([(nome, quantidade // len(NOMES)) for nome in NOMES])
+
+    json_datado = GerenciadorSalvamento(os.path.join(pasta, "json"))
+    sem_retencao = ArmazemAutosaves(os.path.join(pasta, "dedup"), ultimos=10**6)
+    com_retencao = ArmazemAutosaves(os.path.join(pasta, "retencao"))
+    tempos = {"json": 0.0, "dedup": 0.0}
+    inicio = datetime(2024, 1, 1, 12, 0)
+    for passo in range(minutos * 2):
+        for _ in range(30):
+            cidade.atualizar_estado()
+        cidade.construir_em_lote([(NOMES[passo % len(NOMES)], 20)])
+        for i in range(20):
+            cidade.melhorar_construcao((passo * 7919 + i * 104729) % len(cidade.construcoes))
+        quando = inicio + timedelta(seconds=30 * passo)
+
+        antes = time.perf_counter()
+        json_datado.gravar_save(json_datado.montar_dados_save(cidade), f"Benchmark_{passo:04d}.json", indent=None)
+        tempos["json"] += time.perf_counter() - antes
+        antes = time.perf_counter()
+        com_retencao.salvar(cidade, quando)
+        tempos["dedup"] += time.perf_counter() - antes
+        sem_retencao.salvar(cidade, quando)
+
+    kb = 1024
+    print(f"{len(cidade.construcoes):,} construções, {minutos * 2} autosaves em {minutos} min de jogo")
+    print(f"  JSON com data (atual):        {tamanho_pasta(json_datado.pasta_saves) / kb:11,.1f} KB"
+          f" | {tempos['json'] / (minutos * 2) * 1000:7.1f} ms por autosave")
+    print(f"  deduplicado, sem retenção:    {tamanho_pasta(sem_retencao.pasta) / kb:11,.1f} KB")
+    print(f"  deduplicado, com retenção:    {tamanho_pasta(com_retencao.pasta) / kb:11,.1f} KB"
+          f" | {tempos['dedup'] / (minutos * 2) * 1000:7.1f} ms por autosave")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Benchmark de listagem, busca e poda: pasta de saves x banco SQLite
+
+Uso: python benchmarks/bench_banco_saves.py [saves]
+Padrão: 5000 saves de 20 cidades, cada um com 200 construções.
+"""
+
+import sys
+import os
+import json
+import time
+import tempfile
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from models.cidade import Cidade
+from core.salvamento import GerenciadorSalvamento
+from core.banco_saves import BancoSaves
+
+
+def medir(funcao):
+    inicio = time.perf_counter()
+    resultado = funcao()
+    return time.perf_counter() - inicio, resultado
+
+
+def main():
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    pasta = tempfile.mkdtemp(prefix="ecocity_banco_")
+    cidades = []
+    for i in range(20):
+        cidade = Cidade(f"Cidade {i}", ["Fácil", "Médio", "Difícil"][i % 3])
+        cidade.recursos.dinheiro = 10**7
+        cidade.construir_em_lote([("Painel Solar", 150), ("Ciclovia", 50)])
+        cidades.append(cidade)
+
+    arquivos = GerenciadorSalvamento(os.path.join(pasta, "json"))
+    banco = BancoSaves(os.path.join(pasta, "banco"))
+    for i in range(quantidade):
+        cidade = cidades[i % len(cidades)]
+        cidade.tempo_jogo = i
+        # Direto no arquivo: gravar_save reescreveria o manifesto a cada save
+        with open(os.path.join(arquivos.pasta_saves, f"save_{i:06d}.json"), 'w', encoding='utf-8') as f:
+            json.dump(arquivos.montar_dados_save(cidade), f, separators=(',', ':'))
+    tempo_migracao, _ = medir(lambda: banco.migrar_pasta(arquivos.pasta_saves))
+
+    pasta_fria, _ = medir(arquivos.listar_saves)
+    pasta_manifesto, _ = medir(arquivos.listar_saves)
+    pasta_busca, _ = medir(lambda: [s for s in arquivos.listar_saves()
+                                    if s['cidade'] == "Cidade 7" and s['tempo_jogo'] >= quantidade // 2])
+    banco_lista, _ = medir(banco.listar_saves)
+    banco_busca, _ = medir(lambda: banco.buscar_saves(cidade="Cidade 7", ciclo_minimo=quantidade // 2))
+    banco_poda, apagados = medir(lambda: banco.podar_saves(manter_por_cidade=10))
+
+    print(f"{quantidade:,} saves (migração para o banco: {tempo_migracao:.2f}s)")
+    print(f"  pasta: listar sem manifesto {pasta_fria * 1000:8.1f}ms | com manifesto {pasta_manifesto * 1000:8.1f}ms"
+          f" | buscar {pasta_busca * 1000:8.1f}ms")
+    print(f"  banco: listar {banco_lista * 1000:8.1f}ms | buscar {banco_busca * 1000:8.1f}ms"
+          f" | podar ({apagados:,} saves) {banco_poda * 1000:8.1f}ms")
+    banco.fechar()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Benchmark de memória: construções com protótipo compartilhado x cópias completas
+
+Uso: python benchmarks/bench_catalogo_construcoes.py [quantidade]
+"""
+
+import sys
+import os
+import time
+import tracemalloc
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from models.construcao import Construcao, CATALOGO_CONSTRUCOES
+
+
+class ConstrucaoCopia:
+    """Layout antigo: cada construção repete todos os dados do catálogo"""
+
+    def __init__(self, nome, tipo, custo, impacto_emissao, impacto_satisfacao, requisitos=None):
+        self.nome = nome
+        self.tipo = tipo
+        self.custo = custo
+        self.impacto_emissao = impacto_emissao
+        self.impacto_satisfacao = impacto_satisfacao
+        self.nivel = 1
+        self.requisitos = requisitos or []
+
+
+def medir(criar, quantidade):
+    """Retorna (bytes por construção, segundos) para criar ``quantidade`` construções"""
+    prototipos = list(CATALOGO_CONSTRUCOES.values())
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    construcoes = [criar(prototipos[i % len(prototipos)]) for i in range(quantidade)]
+    duracao = time.perf_counter() - inicio
+    memoria, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del construcoes
+    return memoria / quantidade, duracao
+
+
+def copia_completa(prototipo):
+    return ConstrucaoCopia(prototipo.nome, prototipo.tipo, prototipo.custo,
+                           prototipo.impacto_emissao, prototipo.impacto_satisfacao,
+                           list(prototipo.requisitos))
+
+
+def main():
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    print(f"🏗️ {quantidade:,} construções colocadas")
+
+    antes, tempo_antes = medir(copia_completa, quantidade)
+    depois, tempo_depois = medir(Construcao.de_prototipo, quantidade)
+
+    print(f"   Cópia completa:          {antes:6.1f} bytes/construção ({tempo_antes:.2f}s)")
+    print(f"   Protótipo compartilhado: {depois:6.1f} bytes/construção ({tempo_depois:.2f}s)")
+    print(f"   Redução: {100 * (1 - depois / antes):.0f}%")
+
+
+if __name__ == "__main__":
+    main()
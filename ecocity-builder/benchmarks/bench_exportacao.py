@@ -0,0 +1,55 @@
+"""
+Benchmark de exportação: linhas por segundo e memória ao exportar uma partida longa
+
+Uso: python benchmarks/bench_exportacao.py [ciclos] [pasta] [--sem-csv]
+Por padrão exporta 10 milhões de ciclos para uma pasta temporária. O pico de
+memória do processo (RSS) é medido a cada milhão de linhas e deve ficar
+estável, já que o exportador só guarda um bloco por vez.
+"""
+
+import sys
+import os
+import time
+import resource
+import tempfile
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from models.cidade import Cidade
+from core.exportacao import ExportadorHistorico
+
+
+def pico_memoria_mb():
+    # ru_maxrss é em KB no Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main():
+    argumentos = [a for a in sys.argv[1:] if not a.startswith('--')]
+    ciclos = int(argumentos[0]) if argumentos else 10_000_000
+    pasta = argumentos[1] if len(argumentos) > 1 else tempfile.mkdtemp(prefix="ecocity_export_")
+    gravar_csv = '--sem-csv' not in sys.argv
+
+    cidade = Cidade("Benchmark")
+    cidade.historico = None
+    for nome in ("Painel Solar", "Ciclovia", "Parque Público"):
+        cidade.adicionar_construcao(nome)
+
+    inicio = time.perf_counter()
+    with ExportadorHistorico(pasta, gravar_csv=gravar_csv) as exportador:
+        for ciclo in range(1, ciclos + 1):
+            cidade.atualizar_estado()
+            if cidade.populacao > 1e12:
+                cidade.populacao = 100  # o crescimento de 1% por ciclo estoura o float em ~70 mil ciclos
+            exportador.registrar(cidade)
+            if ciclo % 1_000_000 == 0:
+                print(f"   {ciclo:>12,} linhas | pico de memória {pico_memoria_mb():.1f} MB")
+    segundos = time.perf_counter() - inicio
+
+    tamanho = sum(os.path.getsize(os.path.join(pasta, arquivo)) for arquivo in os.listdir(pasta))
+    print(f"📤 {exportador.linhas:,} linhas em {segundos:.1f}s ({exportador.linhas / segundos:,.0f} linhas/s)")
+    print(f"   {tamanho / 1024 ** 2:.1f} MB em {pasta}")
+    print(f"   Pico de memória: {pico_memoria_mb():.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Benchmark de formatos de save: tamanho e tempo de gravar/ler JSON x binário (.ecob)
+
+Uso: python benchmarks/bench_formato_saves.py [construções ...]
+Padrão: cidades com 1 mil, 10 mil, 100 mil e 1 milhão de construções.
+"Ler" é produzir o dicionário do save (json.load x ler_dados_binario);
+"carregar" é reconstruir a cidade inteira com carregar_jogo.
+"""
+
+import sys
+import os
+import json
+import time
+import tempfile
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from models.cidade import Cidade
+from core.salvamento import GerenciadorSalvamento
+from core.formato_binario import ler_dados_binario
+
+NOMES = ["Painel Solar", "Ciclovia", "Parque Público", "Usina Reciclagem", "Parque Eólico"]
+
+
+def criar_cidade(quantidade):
+    cidade = Cidade("Benchmark")
+    cidade.historico = None
+    cidade.recursos.dinheiro = 10**12
+    por_tipo = quantidade // len(NOMES)
+    cidade.construir_em_lote([(nome, por_tipo + (i < quantidade % len(NOMES))) for i, nome in enumerate(NOMES)])
+    for posicao in range(0, quantidade, 3):
+        cidade.melhorar_construcao(posicao)
+    return cidade
+
+
+def medir(funcao):
+    inicio = time.perf_counter()
+    funcao()
+    return time.perf_counter() - inicio
+
+
+def ler_json(caminho):
+    with open(caminho, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def main():
+    tamanhos = [int(a) for a in sys.argv[1:]] or [1_000, 10_000, 100_000, 1_000_000]
+    pasta = tempfile.mkdtemp(prefix="ecocity_saves_")
+    formatos = [
+        ("JSON (indent=2)", GerenciadorSalvamento(pasta), "c.json", ler_json),
+        (".ecob", GerenciadorSalvamento(pasta, comprimir=False), "c_bruto.ecob", ler_dados_binario),
+        (".ecob + zlib", GerenciadorSalvamento(pasta), "c_zlib.ecob", ler_dados_binario),
+    ]
+
+    print(f"{'construções':>12} | {'formato':<16} | {'tamanho':>10} | {'gravar':>8} | {'ler':>8} | {'carregar':>8}")
+    for quantidade in tamanhos:
+        cidade = criar_cidade(quantidade)
+        for nome, gerenciador, arquivo, ler in formatos:
+            caminho = os.path.join(pasta, arquivo)
+            gravar = medir(lambda: gerenciador.salvar_jogo(cidade, arquivo))
+            leitura = medir(lambda: ler(caminho))
+            carga = medir(lambda: gerenciador.carregar_jogo(arquivo))
+            tamanho = os.path.getsize(caminho) / 1024
+            print(f"{quantidade:>12,} | {nome:<16} | {tamanho:>8,.1f}KB | {gravar:>7.3f}s | {leitura:>7.3f}s"
+                  f" | {carga:>7.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Benchmark de memória dos modelos: bytes por objeto com __dict__ x __slots__
+
+Uso: python benchmarks/bench_memoria_modelos.py [quantidade]
+"""
+
+import sys
+import os
+import tracemalloc
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from models.base import Recurso
+from models.construcao import Construcao, obter_prototipo
+from models.eventos import EventoClimatico, TipoEvento
+from models.tecnologia import Tecnologia, TipoTecnologia
+
+
+def com_dict(cls):
+    """Cria uma fábrica que copia os atributos para um objeto comum (layout antigo)"""
+    classe_dict = type(f"{cls.__name__}ComDict", (), {})
+
+    def copiar(objeto):
+        copia = classe_dict()
+        for nome in cls.__slots__:
+            setattr(copia, nome, getattr(objeto, nome))
+        return copia
+    return copiar
+
+
+def medir(criar, quantidade):
+    """Retorna os bytes alocados por objeto vivo"""
+    tracemalloc.start()
+    objetos = [criar(i) for i in range(quantidade)]
+    memoria, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objetos
+    return memoria / quantidade
+
+
+MODELOS = {
+    'Recurso': (Recurso, lambda i: Recurso(1000.0 + i, 50.5, 70)),
+    'Construcao': (Construcao, lambda i: Construcao.de_prototipo(obter_prototipo("Painel Solar"))),
+    'Tecnologia': (Tecnologia, lambda i: Tecnologia(f"Tec {i}", TipoTecnologia.ENERGIA, 800, 10,
+                                                    beneficios={'reducao_emissao': -10})),
+    'EventoClimatico': (EventoClimatico, lambda i: EventoClimatico(TipoEvento.SECA, 1.2)),
+}
+
+
+def main():
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    print(f"📦 {quantidade:,} objetos por modelo (bytes por objeto)")
+    print(f"   {'Modelo':<16} {'__dict__':>10} {'__slots__':>10} {'Redução':>8}")
+
+    for nome, (cls, criar) in MODELOS.items():
+        copiar = com_dict(cls)
+        antes = medir(lambda i: copiar(criar(i)), quantidade)
+        depois = medir(criar, quantidade)
+        print(f"   {nome:<16} {antes:10.1f} {depois:10.1f} {100 * (1 - depois / antes):7.0f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Benchmark de reprodução: ciclos por segundo ao refazer uma partida gravada
+
+Uso: python benchmarks/bench_replay.py [ciclos] [registro.json]
+Sem arquivo, grava uma partida de exemplo com a semente 42.
+"""
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from models.cidade import Cidade
+from core.sessao import SessaoJogo
+from core.replay import RegistroComandos, reproduzir
+
+
+def gravar_partida_exemplo(ciclos):
+    """Partida com construções, pesquisas e melhorias espalhadas no tempo"""
+    registro = RegistroComandos()
+    sessao = SessaoJogo(Cidade("Benchmark"), semente=42, registro=registro)
+    construcoes = ["Painel Solar", "Ciclovia", "Parque Público", "Usina Reciclagem", "Parque Eólico"]
+    pesquisas = ["Energia Solar Avançada", "Agricultura Vertical", "Materiais Sustentáveis",
+                 "Veículos Elétricos", "Smart Grid", "Captura de Carbono"]
+
+    for ciclo in range(ciclos):
+        if ciclo % 7 == 0:
+            sessao.executar_comando('construir', construcoes[ciclo % len(construcoes)])
+        if ciclo % 97 == 0 and pesquisas:
+            sessao.executar_comando('pesquisar', pesquisas[(ciclo // 97) % len(pesquisas)])
+        if ciclo % 53 == 0 and sessao.cidade.construcoes:
+            sessao.executar_comando('melhorar', ciclo % len(sessao.cidade.construcoes))
+        sessao.avancar_ciclo()
+    return registro, sessao.cidade.get_estatisticas()
+
+
+def main():
+    ciclos = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    if len(sys.argv) > 2:
+        registro, esperado = RegistroComandos.carregar(sys.argv[2]), None
+    else:
+        registro, esperado = gravar_partida_exemplo(ciclos)
+
+    resultado = reproduzir(registro)
+    print(f"🔁 {resultado['ciclos']:,} ciclos, {len(registro.comandos):,} comandos")
+    print(f"   {resultado['segundos']:.2f}s ({resultado['ticks_por_segundo']:,.0f} ciclos/s)")
+    if esperado is not None:
+        igual = resultado['estatisticas'] == esperado
+        print(f"   Estado final idêntico à partida gravada: {'sim' if igual else 'NÃO'}")
+
+
+if __name__ == "__main__":
+    main()
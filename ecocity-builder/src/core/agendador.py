@@ -0,0 +1,75 @@
+# [file name]: src/core/agendador.py
+# [file content begin]
+class AgendadorSimulacao:
+    """Agendador de passo fixo para a simulação
+
+    O tempo real de cada quadro é somado a um acumulador (multiplicado pela
+    velocidade atual) e convertido em quantos ticks de tamanho fixo forem
+    necessários. Assim a velocidade da simulação não depende do FPS e um
+    quadro travado não faz o jogo perder tempo simulado.
+    """
+
+    VELOCIDADES = [1, 2, 10, 100]
+
+    def __init__(self, passo_ms=1000, max_ticks_por_quadro=10, atraso_maximo_ms=None):
+        self.passo_ms = passo_ms
+        self.max_ticks_por_quadro = max_ticks_por_quadro
+        # Atraso acima deste limite é descartado para evitar a "espiral da morte"
+        if atraso_maximo_ms is None:
+            atraso_maximo_ms = passo_ms * 60
+        self.atraso_maximo_ms = atraso_maximo_ms
+
+        self.acumulador = 0.0
+        self.velocidade = 1
+        self.pausado = False
+        self.total_ticks = 0
+        self.tempo_descartado_ms = 0.0
+
+    def atualizar(self, delta_ms, executar_tick):
+        """Executa os ticks pendentes e retorna quantos foram executados"""
+        if self.pausado:
+            return 0
+
+        self.acumulador += delta_ms * self.velocidade
+
+        ticks = 0
+        while self.acumulador >= self.passo_ms and ticks < self.max_ticks_por_quadro:
+            executar_tick()
+            self.acumulador -= self.passo_ms
+            ticks += 1
+        self.total_ticks += ticks
+
+        # O que sobrar continua no acumulador para os próximos quadros
+        if self.acumulador > self.atraso_maximo_ms:
+            self.tempo_descartado_ms += self.acumulador - self.atraso_maximo_ms
+            self.acumulador = self.atraso_maximo_ms
+
+        return ticks
+
+    def definir_velocidade(self, velocidade):
+        """Define o multiplicador de velocidade (1x, 2x, 10x, 100x...)"""
+        if velocidade <= 0:
+            raise ValueError("A velocidade deve ser positiva")
+        self.velocidade = velocidade
+
+    def proxima_velocidade(self):
+        """Avança para a próxima velocidade da lista, voltando ao início no fim"""
+        if self.velocidade in self.VELOCIDADES:
+            indice = (self.VELOCIDADES.index(self.velocidade) + 1) % len(self.VELOCIDADES)
+        else:
+            indice = 0
+        self.velocidade = self.VELOCIDADES[indice]
+        return self.velocidade
+
+    def alternar_pausa(self):
+        """Pausa ou retoma a simulação"""
+        self.pausado = not self.pausado
+        return self.pausado
+
+    def get_interpolacao(self):
+        """Fração do próximo tick já acumulada (0.0 a 1.0), útil para animações"""
+        return min(1.0, self.acumulador / self.passo_ms)
+
+    def __str__(self):
+        return "⏸️ Pausado" if self.pausado else f"⏩ {self.velocidade}x"
+# [file content end]
@@ -0,0 +1,223 @@
+# [file name]: src/core/autosaves.py
+# [file content begin]
+"""
+Salvamentos automáticos deduplicados, com retenção e coleta de lixo.
+
+Cada autosave é um manifesto pequeno (``<cidade>_<data>.autosave``, JSON)
+com o que muda a cada ciclo (tempo, população, recursos) e os hashes das
+seções guardadas em ``objetos/``: as tecnologias com a tabela de nomes, e
+as construções em pedaços de tamanho fixo, cada um um bloco do formato
+binário (core/formato_binario.py), comprimidos com zlib. Um
+objeto é gravado uma vez por conteúdo: entre dois autosaves seguidos só os
+pedaços com construções novas ou melhoradas são novos.
+
+Depois de cada autosave, a retenção mantém os ``ultimos`` mais recentes
+de cada cidade mais o mais recente de cada hora (``por_hora`` horas) e de
+cada dia (``por_dia`` dias); os demais manifestos são apagados e a coleta
+de lixo remove os objetos que nenhum manifesto usa.
+"""
+import hashlib
+import json
+import os
+import zlib
+from datetime import datetime
+from itertools import islice
+
+from core.formato_binario import codificar_bloco, decodificar_bloco
+from core.salvamento import SalvamentoEmSegundoPlano, metadados_save
+
+EXTENSAO_AUTOSAVE = ".autosave"
+VERSAO_AUTOSAVE = 1
+CONSTRUCOES_POR_PEDACO = 4096
+
+
+class ArmazemAutosaves(SalvamentoEmSegundoPlano):
+    """Autosaves deduplicados por conteúdo em ``pasta``
+
+    ``salvar_em_segundo_plano`` funciona como o do GerenciadorSalvamento: a
+    cidade é bifurcada na thread do chamador e codificar, gravar, aplicar a
+    retenção e coletar o lixo ficam para uma thread de trabalho. Como tudo
+    roda nessa thread, a coleta de lixo nunca vê um autosave pela metade.
+    """
+    nome_thread = "autosave"
+
+    def __init__(self, pasta=os.path.join("saves", "autosaves"), ultimos=10, por_hora=24, por_dia=7,
+                 construcoes_por_pedaco=CONSTRUCOES_POR_PEDACO):
+        self.pasta = pasta
+        self.pasta_objetos = os.path.join(pasta, "objetos")
+        self.ultimos = ultimos
+        self.por_hora = por_hora
+        self.por_dia = por_dia
+        self.construcoes_por_pedaco = construcoes_por_pedaco
+        os.makedirs(self.pasta_objetos, exist_ok=True)
+        self._iniciar_segundo_plano()
+
+    def caminho_objeto(self, hash_objeto):
+        return os.path.join(self.pasta_objetos, hash_objeto[:2], hash_objeto)
+
+    def _gravar_objeto(self, bruto):
+        """Grava o objeto se ainda não existir; retorna o hash"""
+        hash_objeto = hashlib.sha256(bruto).hexdigest()
+        caminho = self.caminho_objeto(hash_objeto)
+        if not os.path.exists(caminho):
+            os.makedirs(os.path.dirname(caminho), exist_ok=True)
+            temporario = caminho + ".tmp"
+            with open(temporario, 'wb') as f:
+                f.write(zlib.compress(bruto, 6))
+            os.replace(temporario, caminho)
+        return hash_objeto
+
+    def _ler_objeto(self, hash_objeto):
+        with open(self.caminho_objeto(hash_objeto), 'rb') as f:
+            bruto = zlib.decompress(f.read())
+        if hashlib.sha256(bruto).hexdigest() != hash_objeto:
+            raise ValueError(f"Objeto corrompido: {hash_objeto}")
+        return bruto
+
+    def salvar(self, cidade, quando=None):
+        """Grava um autosave de ``cidade`` e aplica a retenção; retorna (sucesso, mensagem)"""
+        from models.construcao import CATALOGO_CONSTRUCOES
+        quando = quando or datetime.now()
+        try:
+            nomes = list(CATALOGO_CONSTRUCOES)
+            posicoes = {nome: i for i, nome in enumerate(nomes)}
+            info = json.dumps({'tecnologias_desbloqueadas': cidade.tecnologias_desbloqueadas,
+                               'nomes_construcoes': nomes}, ensure_ascii=False, separators=(',', ':'))
+            total = len(cidade.construcoes)
+            iterador = iter(cidade.construcoes)
+            pedacos = []
+            for _ in range(0, total, self.construcoes_por_pedaco):
+                pares = ((construcao.prototipo.nome, construcao.nivel)
+                         for construcao in islice(iterador, self.construcoes_por_pedaco))
+                pedaco = codificar_bloco(pares, posicoes)
+                pedacos.append(self._gravar_objeto(pedaco))
+
+            manifesto = {
+                'versao': VERSAO_AUTOSAVE,
+                'cidade': {
+                    'nome': cidade.nome,
+                    'dificuldade': cidade.dificuldade,
+                    'populacao': cidade.populacao,
+                    'tempo_jogo': cidade.tempo_jogo
+                },
+                'recursos': cidade.recursos.to_dict(),
+                'metadata': {'data_salvamento': quando.isoformat(), 'versao_jogo': '1.0'},
+                'info': self._gravar_objeto(info.encode('utf-8')),
+                'total': total,
+                'construcoes': pedacos
+            }
+            nome_arquivo = f"{cidade.nome}_{quando.strftime('%Y%m%d_%H%M%S_%f')}{EXTENSAO_AUTOSAVE}"
+            caminho = os.path.join(self.pasta, nome_arquivo)
+            with open(caminho + ".tmp", 'w', encoding='utf-8') as f:
+                json.dump(manifesto, f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(caminho + ".tmp", caminho)
+        except Exception as e:
+            return False, f"Erro ao salvar: {e}"
+
+        try:
+            if self.aplicar_retencao():
+                self.coletar_lixo()
+        except OSError as e:
+            return True, f"Jogo salvo em {nome_arquivo} (retenção falhou: {e})"
+        return True, f"Jogo salvo em {nome_arquivo}"
+
+    def salvar_em_segundo_plano(self, cidade):
+        """Agenda um autosave de uma cópia da cidade; retorna False se já houver um em andamento"""
+        if not self._livre_para_agendar():
+            return False
+        self._agendar(self.salvar, cidade.bifurcar())
+        return True
+
+    def _manifestos(self):
+        """Dicionário arquivo -> manifesto de todos os autosaves da pasta"""
+        manifestos = {}
+        for arquivo in os.listdir(self.pasta):
+            if not arquivo.endswith(EXTENSAO_AUTOSAVE):
+                continue
+            try:
+                with open(os.path.join(self.pasta, arquivo), 'r', encoding='utf-8') as f:
+                    manifestos[arquivo] = json.load(f)
+            except (OSError, ValueError):
+                continue
+        return manifestos
+
+    def listar(self):
+        """Resumo dos autosaves, do mais recente ao mais antigo"""
+        saves = [metadados_save(arquivo, manifesto) for arquivo, manifesto in self._manifestos().items()]
+        saves.sort(key=lambda x: x['data_salvamento'], reverse=True)
+        return saves
+
+    def aplicar_retencao(self):
+        """Apaga os autosaves fora da política de retenção; retorna os arquivos apagados"""
+        por_cidade = {}
+        for save in self.listar():
+            por_cidade.setdefault(save['cidade'], []).append(save)
+
+        apagados = []
+        for saves in por_cidade.values():
+            manter = {save['arquivo'] for save in saves[:self.ultimos]}
+            for formato, limite in (('%Y%m%d%H', self.por_hora), ('%Y%m%d', self.por_dia)):
+                periodos = set()
+                for save in saves:  # do mais recente ao mais antigo: o primeiro de cada período fica
+                    periodo = datetime.fromisoformat(save['data_salvamento']).strftime(formato)
+                    if periodo in periodos:
+                        continue
+                    if len(periodos) == limite:
+                        break
+                    periodos.add(periodo)
+                    manter.add(save['arquivo'])
+            for save in saves:
+                if save['arquivo'] not in manter:
+                    os.remove(os.path.join(self.pasta, save['arquivo']))
+                    apagados.append(save['arquivo'])
+        return apagados
+
+    def coletar_lixo(self):
+        """Remove objetos que nenhum manifesto usa; retorna quantos foram removidos"""
+        usados = set()
+        for manifesto in self._manifestos().values():
+            usados.add(manifesto['info'])
+            usados.update(manifesto['construcoes'])
+
+        removidos = 0
+        for prefixo in os.listdir(self.pasta_objetos):
+            pasta_prefixo = os.path.join(self.pasta_objetos, prefixo)
+            for arquivo in os.listdir(pasta_prefixo):
+                if arquivo not in usados:  # inclui .tmp deixados por uma queda
+                    os.remove(os.path.join(pasta_prefixo, arquivo))
+                    removidos += 1
+        return removidos
+
+    def carregar(self, nome_arquivo):
+        """Recria a cidade de um autosave; retorna (sucesso, cidade, mensagem)"""
+        from core.carregamento import montar_cidade
+        from models.construcao import CATALOGO_CONSTRUCOES, Construcao
+        from models.lista_compartilhada import ListaCompartilhada
+        try:
+            with open(os.path.join(self.pasta, nome_arquivo), 'r', encoding='utf-8') as f:
+                manifesto = json.load(f)
+            if manifesto.get('versao', 0) > VERSAO_AUTOSAVE:
+                raise ValueError(f"Versão de autosave não suportada: {manifesto['versao']}")
+            info = json.loads(self._ler_objeto(manifesto['info']).decode('utf-8'))
+            prototipos = [CATALOGO_CONSTRUCOES.get(nome) for nome in info['nomes_construcoes']]
+
+            construcoes = []
+            for hash_pedaco in manifesto['construcoes']:
+                indices, niveis = decodificar_bloco(self._ler_objeto(hash_pedaco))
+                for indice, nivel in zip(indices, niveis):
+                    prototipo = prototipos[indice]
+                    if prototipo is None:
+                        raise ValueError(f"Construção desconhecida: {info['nomes_construcoes'][indice]}")
+                    construcao = Construcao.de_prototipo(prototipo)
+                    construcao.nivel = nivel
+                    construcoes.append(construcao)
+            if len(construcoes) != manifesto['total']:
+                raise ValueError(f"Autosave com {len(construcoes)} construções, esperadas {manifesto['total']}")
+
+            dados = {'cidade': dict(manifesto['cidade'],
+                                    tecnologias_desbloqueadas=info['tecnologias_desbloqueadas']),
+                     'recursos': manifesto['recursos'], 'metadata': manifesto['metadata']}
+            return True, montar_cidade(dados, ListaCompartilhada(construcoes)), "Jogo carregado com sucesso!"
+        except Exception as e:
+            return False, None, f"Erro ao carregar: {e}"
+# [file content end]
@@ -0,0 +1,239 @@
+# [file name]: src/core/banco_saves.py
+# [file content begin]
+"""
+Saves em um banco SQLite (sqlite3 da biblioteca padrão).
+
+Cada save é uma linha da tabela ``saves``: os metadados da lista de saves
+em colunas indexadas (cidade, dificuldade, população, ciclo e data) e o
+conteúdo em um BLOB, na última coluna, para que consultas de metadados não
+passem pelas páginas do conteúdo. Listar, buscar e podar são uma consulta
+cada, sem abrir nenhum save.
+"""
+import codecs
+import io
+import json
+import os
+import sqlite3
+import threading
+
+from core.formato_binario import (ASSINATURA, EXTENSAO_BINARIA, escrever_dados_binario,
+                                  ler_metadados_binario)
+from core.salvamento import GerenciadorSalvamento, metadados_save
+
+NOME_BANCO = "saves.db"
+VERSAO_BANCO = 1
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS saves (
+    id INTEGER PRIMARY KEY,
+    arquivo TEXT NOT NULL UNIQUE,
+    cidade TEXT NOT NULL,
+    dificuldade TEXT NOT NULL,
+    populacao INTEGER NOT NULL,
+    ciclo INTEGER NOT NULL,
+    data_salvamento TEXT NOT NULL,
+    dados BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_saves_cidade_data ON saves (cidade, data_salvamento);
+CREATE INDEX IF NOT EXISTS idx_saves_dificuldade ON saves (dificuldade);
+CREATE INDEX IF NOT EXISTS idx_saves_populacao ON saves (populacao);
+CREATE INDEX IF NOT EXISTS idx_saves_ciclo ON saves (ciclo);
+CREATE INDEX IF NOT EXISTS idx_saves_data ON saves (data_salvamento);
+"""
+
+COLUNAS_METADADOS = "arquivo, cidade, dificuldade, populacao, data_salvamento, ciclo"
+
+
+def _metadados_de_linha(linha):
+    arquivo, cidade, dificuldade, populacao, data_salvamento, ciclo = linha
+    return {
+        'arquivo': arquivo,
+        'cidade': cidade,
+        'dificuldade': dificuldade,
+        'populacao': populacao,
+        'data_salvamento': data_salvamento,
+        'tempo_jogo': ciclo
+    }
+
+
+class BancoSaves(GerenciadorSalvamento):
+    """GerenciadorSalvamento que guarda os saves em ``<pasta_saves>/saves.db``
+
+    A interface é a mesma (salvar_jogo, salvar_em_segundo_plano,
+    listar_saves, carregar_jogo, deletar_save); ``arquivo`` passa a ser a
+    chave do save no banco. O BLOB tem os bytes que iriam para o arquivo,
+    então o formato continua vindo da extensão do nome; o padrão aqui é o
+    binário (.ecob). Segmentos de diário continuam como arquivos na pasta.
+
+    Uma gravação é uma transação, então um save nunca fica pela metade. A
+    conexão é compartilhada com a thread de salvamento em segundo plano,
+    protegida por uma trava.
+    """
+
+    def __init__(self, pasta_saves="saves", formato="binario", comprimir=True, nome_banco=NOME_BANCO):
+        super().__init__(pasta_saves, formato, comprimir)
+        self.caminho_banco = os.path.join(pasta_saves, nome_banco)
+        self._trava_banco = threading.Lock()
+        self.conexao = sqlite3.connect(self.caminho_banco, check_same_thread=False)
+        # WAL: leituras não esperam a gravação de um save; NORMAL não sincroniza o disco a cada transação
+        self.conexao.execute("PRAGMA journal_mode=WAL")
+        self.conexao.execute("PRAGMA synchronous=NORMAL")
+        with self.conexao:
+            versao = self.conexao.execute("PRAGMA user_version").fetchone()[0]
+            if versao > VERSAO_BANCO:
+                raise ValueError(f"Versão de banco de saves não suportada: {versao}")
+            self.conexao.executescript(ESQUEMA)
+            self.conexao.execute(f"PRAGMA user_version={VERSAO_BANCO}")
+
+    def fechar(self):
+        """Espera saves em segundo plano e fecha o banco"""
+        resultados = self.aguardar_salvamentos()
+        with self._trava_banco:
+            self.conexao.close()
+        return resultados
+
+    def _inserir(self, metadados, conteudo):
+        self.conexao.execute(
+            f"INSERT OR REPLACE INTO saves ({COLUNAS_METADADOS}, dados) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (metadados['arquivo'], metadados['cidade'], metadados['dificuldade'], metadados['populacao'],
+             metadados['data_salvamento'], metadados['tempo_jogo'], conteudo))
+
+    def _gravar_atomico(self, nome_arquivo, escrever, metadados, binario=False):
+        """Grava com ``escrever(arquivo)`` em memória e insere a linha em uma transação"""
+        try:
+            buffer = io.BytesIO() if binario else io.StringIO()
+            escrever(buffer)
+            conteudo = buffer.getvalue()
+            if not binario:
+                conteudo = conteudo.encode('utf-8')
+            with self._trava_banco, self.conexao:
+                self._inserir(metadados, conteudo)
+            return True, f"Jogo salvo em {nome_arquivo}"
+        except Exception as e:
+            return False, f"Erro ao salvar: {e}"
+
+    def listar_saves(self):
+        """Lista todos os saves, do mais recente ao mais antigo"""
+        return self.buscar_saves()
+
+    def buscar_saves(self, cidade=None, dificuldade=None, populacao_minima=None, populacao_maxima=None,
+                     ciclo_minimo=None, ciclo_maximo=None, desde=None, ate=None, limite=None):
+        """Saves que atendem a todos os filtros dados, do mais recente ao mais antigo
+
+        ``desde`` e ``ate`` são datas ISO (como em 'data_salvamento'),
+        comparadas como texto.
+        """
+        filtros = [("cidade = ?", cidade), ("dificuldade = ?", dificuldade),
+                   ("populacao >= ?", populacao_minima), ("populacao <= ?", populacao_maxima),
+                   ("ciclo >= ?", ciclo_minimo), ("ciclo <= ?", ciclo_maximo),
+                   ("data_salvamento >= ?", desde), ("data_salvamento <= ?", ate)]
+        condicoes = [condicao for condicao, valor in filtros if valor is not None]
+        parametros = [valor for _, valor in filtros if valor is not None]
+        consulta = f"SELECT {COLUNAS_METADADOS} FROM saves"
+        if condicoes:
+            consulta += " WHERE " + " AND ".join(condicoes)
+        consulta += " ORDER BY data_salvamento DESC"
+        if limite is not None:
+            consulta += " LIMIT ?"
+            parametros.append(limite)
+        with self._trava_banco:
+            return [_metadados_de_linha(linha) for linha in self.conexao.execute(consulta, parametros)]
+
+    def podar_saves(self, manter_por_cidade=None, antes_de=None, cidade=None):
+        """Apaga saves antigos em uma única instrução; retorna quantos foram apagados
+
+        ``manter_por_cidade`` mantém os N mais recentes de cada cidade;
+        ``antes_de`` apaga os salvos antes dessa data ISO; com os dois, só o
+        que cai nas duas regras é apagado. ``cidade`` limita a poda a uma
+        cidade.
+        """
+        if manter_por_cidade is None and antes_de is None:
+            return 0
+        condicoes = []
+        parametros = []
+        if manter_por_cidade is not None:
+            condicoes.append("id IN (SELECT id FROM (SELECT id, ROW_NUMBER() OVER "
+                             "(PARTITION BY cidade ORDER BY data_salvamento DESC) AS ordem FROM saves) "
+                             "WHERE ordem > ?)")
+            parametros.append(manter_por_cidade)
+        if antes_de is not None:
+            condicoes.append("data_salvamento < ?")
+            parametros.append(antes_de)
+        if cidade is not None:
+            condicoes.append("cidade = ?")
+            parametros.append(cidade)
+        with self._trava_banco, self.conexao:
+            return self.conexao.execute("DELETE FROM saves WHERE " + " AND ".join(condicoes), parametros).rowcount
+
+    def compactar(self):
+        """Devolve ao sistema o espaço de saves apagados (VACUUM)"""
+        with self._trava_banco:
+            self.conexao.execute("VACUUM")
+
+    def _ler_save(self, nome_arquivo):
+        """Lê o BLOB aos poucos (blobopen), sem trazer o save inteiro para a memória"""
+        from core.carregamento import ler_binario_em_fluxo, ler_json_em_fluxo
+        with self._trava_banco:
+            linha = self.conexao.execute("SELECT id FROM saves WHERE arquivo = ?", (nome_arquivo,)).fetchone()
+            if linha is None:
+                raise FileNotFoundError(f"Save não encontrado: {nome_arquivo}")
+            with self.conexao.blobopen("saves", "dados", linha[0], readonly=True) as blob:
+                binario = blob.read(len(ASSINATURA)) == ASSINATURA
+                blob.seek(0)
+                if binario:
+                    return ler_binario_em_fluxo(blob)
+                return ler_json_em_fluxo(codecs.getreader('utf-8')(blob))
+
+    def deletar_save(self, nome_arquivo):
+        """Deleta um save"""
+        try:
+            with self._trava_banco, self.conexao:
+                apagados = self.conexao.execute("DELETE FROM saves WHERE arquivo = ?", (nome_arquivo,)).rowcount
+            if not apagados:
+                return False, f"Erro ao deletar: save {nome_arquivo} não encontrado"
+            return True, "Save deletado com sucesso"
+        except Exception as e:
+            return False, f"Erro ao deletar: {e}"
+
+    def migrar_pasta(self, pasta, remover_originais=False):
+        """Importa os saves .json e .ecob de ``pasta`` para o banco
+
+        Saves JSON são convertidos para o formato binário (o nome passa a
+        terminar em .ecob); os binários entram como estão. Snapshots de
+        diário ficam na pasta. Tudo entra em uma transação; retorna uma
+        lista de (arquivo, sucesso, mensagem) na ordem dos arquivos.
+        """
+        arquivos = sorted(arquivo for arquivo in os.listdir(pasta)
+                          if arquivo.endswith(('.json', EXTENSAO_BINARIA)) and not arquivo.startswith('.'))
+        resultados = []
+        importados = []
+        with self._trava_banco, self.conexao:
+            for arquivo in arquivos:
+                caminho = os.path.join(pasta, arquivo)
+                try:
+                    if arquivo.endswith(EXTENSAO_BINARIA):
+                        nome = arquivo
+                        dados = ler_metadados_binario(caminho)
+                        with open(caminho, 'rb') as f:
+                            conteudo = f.read()
+                    else:
+                        with open(caminho, 'r', encoding='utf-8') as f:
+                            dados = json.load(f)
+                        if 'diario' in dados:
+                            resultados.append((arquivo, False, "Snapshot de diário não é migrado"))
+                            continue
+                        nome = arquivo[:-len('.json')] + EXTENSAO_BINARIA
+                        buffer = io.BytesIO()
+                        escrever_dados_binario(buffer, dados, self.comprimir)
+                        conteudo = buffer.getvalue()
+                    self._inserir(metadados_save(nome, dados), conteudo)
+                    importados.append(caminho)
+                    resultados.append((arquivo, True, f"Migrado como {nome}"))
+                except Exception as e:
+                    resultados.append((arquivo, False, f"Erro ao migrar: {e}"))
+
+        if remover_originais:
+            for caminho in importados:
+                os.remove(caminho)
+        return resultados
+# [file content end]
@@ -0,0 +1,200 @@
+# [file name]: src/core/carregamento.py
+# [file content begin]
+"""
+Carregamento completo de saves, em fluxo.
+
+As construções são recriadas a partir dos protótipos do catálogo (com o
+nível salvo) à medida que os registros são lidos, em blocos; o arquivo
+nunca é lido inteiro e não fica um dicionário por construção na memória.
+Nos saves binários os registros já vêm em arrays; nos JSON, ``FluxoJSON``
+decodifica um registro por vez com ``json.JSONDecoder.raw_decode``.
+"""
+import json
+
+from models.base import Recurso
+from models.cidade import Cidade
+from models.construcao import CATALOGO_CONSTRUCOES, Construcao, PrototipoConstrucao, TipoConstrucao
+from models.indice_construcoes import IndiceConstrucoes
+from models.lista_compartilhada import ListaCompartilhada
+
+TAMANHO_LEITURA = 1 << 16
+TAMANHO_BLOCO = 4096  # construções acrescentadas à lista por vez
+
+
+def construcao_de_registro(registro):
+    """Construção a partir do dicionário salvo (get_beneficios)
+
+    Construções do catálogo compartilham o protótipo; as que não estão nele
+    (saves de outras versões) são recriadas com os valores do arquivo, que
+    já são os do nível salvo.
+    """
+    nivel = registro.get('nivel', 1)
+    prototipo = CATALOGO_CONSTRUCOES.get(registro['nome'])
+    if prototipo is None:
+        prototipo = PrototipoConstrucao.de_nivel(registro['nome'], TipoConstrucao(registro['tipo']), nivel,
+                                                 registro['custo'], registro['impacto_emissao'],
+                                                 registro['impacto_satisfacao'])
+    construcao = Construcao.de_prototipo(prototipo)
+    construcao.nivel = nivel
+    return construcao
+
+
+class FluxoJSON:
+    """Percorre um documento JSON lendo o arquivo aos poucos
+
+    ``chaves()`` itera as chaves de um objeto (o valor de cada uma deve ser
+    lido antes da próxima), ``itens()`` os elementos de um array e
+    ``valor()`` decodifica um valor inteiro.
+    """
+
+    def __init__(self, arquivo):
+        self.arquivo = arquivo
+        self.decodificador = json.JSONDecoder()
+        self.buffer = ''
+        self.posicao = 0
+        self.fim = False
+
+    def _encher(self, tamanho=None):
+        pedaco = self.arquivo.read(tamanho or TAMANHO_LEITURA)
+        if not pedaco:
+            self.fim = True
+            return False
+        self.buffer = self.buffer[self.posicao:] + pedaco
+        self.posicao = 0
+        return True
+
+    def _proximo(self):
+        # Próximo caractere que não é espaço, sem consumi-lo
+        while True:
+            while self.posicao < len(self.buffer) and self.buffer[self.posicao] in ' \t\r\n':
+                self.posicao += 1
+            if self.posicao < len(self.buffer):
+                return self.buffer[self.posicao]
+            if not self._encher():
+                raise ValueError("JSON truncado")
+
+    def _consumir(self, esperado):
+        if self._proximo() != esperado:
+            raise ValueError(f"JSON inválido: esperado '{esperado}'")
+        self.posicao += 1
+
+    def valor(self):
+        self._proximo()
+        tamanho = TAMANHO_LEITURA
+        while True:
+            try:
+                valor, fim = self.decodificador.raw_decode(self.buffer, self.posicao)
+            except json.JSONDecodeError:
+                valor, fim = None, None
+            # Um valor que termina no fim do buffer pode estar cortado (ex.: um número)
+            if fim is not None and (fim < len(self.buffer) or self.fim):
+                self.posicao = fim
+                return valor
+            if not self._encher(tamanho):
+                if fim is None:
+                    raise ValueError("JSON inválido ou truncado")
+                self.posicao = fim
+                return valor
+            tamanho *= 2  # valores grandes: leituras crescentes evitam redecodificar muitas vezes
+
+    def chaves(self):
+        self._consumir('{')
+        if self._proximo() == '}':
+            self.posicao += 1
+            return
+        while True:
+            chave = self.valor()
+            self._consumir(':')
+            yield chave  # o chamador lê o valor antes de pedir a próxima chave
+            if self._proximo() == ',':
+                self.posicao += 1
+                continue
+            self._consumir('}')
+            return
+
+    def itens(self):
+        self._consumir('[')
+        if self._proximo() == ']':
+            self.posicao += 1
+            return
+        while True:
+            yield self.valor()
+            if self._proximo() == ',':
+                self.posicao += 1
+                continue
+            self._consumir(']')
+            return
+
+
+def _acrescentar_em_blocos(construcoes, indice, fonte):
+    bloco = []
+    for construcao in fonte:
+        indice.registrar(construcao)
+        bloco.append(construcao)
+        if len(bloco) == TAMANHO_BLOCO:
+            construcoes.extend(bloco)
+            bloco = []
+    construcoes.extend(bloco)
+
+
+def ler_json_em_fluxo(arquivo):
+    """(dados sem construções, lista de construções, índice) de um save JSON"""
+    fluxo = FluxoJSON(arquivo)
+    dados = {}
+    construcoes = ListaCompartilhada()
+    indice = IndiceConstrucoes()
+    for chave in fluxo.chaves():
+        if chave != 'cidade':
+            dados[chave] = fluxo.valor()
+            continue
+        dados_cidade = dados['cidade'] = {}
+        for chave_cidade in fluxo.chaves():
+            if chave_cidade == 'construcoes':
+                _acrescentar_em_blocos(construcoes, indice, map(construcao_de_registro, fluxo.itens()))
+            else:
+                dados_cidade[chave_cidade] = fluxo.valor()
+    return dados, construcoes, indice
+
+
+def ler_binario_em_fluxo(arquivo):
+    """(dados sem construções, lista de construções, índice) de um save binário"""
+    from core.formato_binario import LeitorBinario
+    leitor = LeitorBinario(arquivo)
+    prototipos = [CATALOGO_CONSTRUCOES.get(nome) for nome in leitor.nomes]
+
+    def construir():
+        de_prototipo = Construcao.de_prototipo
+        for indices, niveis in leitor.blocos():
+            for indice, nivel in zip(indices, niveis):
+                prototipo = prototipos[indice]
+                if prototipo is None:
+                    raise ValueError(f"Construção desconhecida: {leitor.nomes[indice]}")
+                construcao = de_prototipo(prototipo)
+                construcao.nivel = nivel
+                yield construcao
+
+    construcoes = ListaCompartilhada()
+    indice = IndiceConstrucoes()
+    _acrescentar_em_blocos(construcoes, indice, construir())
+    return leitor.dados, construcoes, indice
+
+
+def montar_cidade(dados, construcoes, indice=None):
+    """Cidade com o estado salvo: recursos, tempo, tecnologias e construções
+
+    Os recursos salvos já incluem os efeitos das construções e tecnologias,
+    então nada é reaplicado.
+    """
+    dados_cidade = dados['cidade']
+    cidade = Cidade(dados_cidade['nome'], dados_cidade['dificuldade'])
+    cidade.populacao = dados_cidade['populacao']
+    cidade.tempo_jogo = dados_cidade['tempo_jogo']
+    cidade.tecnologias_desbloqueadas = dados_cidade['tecnologias_desbloqueadas']
+    cidade.recursos = Recurso.from_dict(dados['recursos'])
+    cidade.construcoes = construcoes
+    if indice is None:
+        cidade.reconstruir_indice()
+    else:
+        cidade.indice = indice
+    return cidade
+# [file content end]
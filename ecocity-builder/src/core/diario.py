@@ -0,0 +1,184 @@
+# [file name]: src/core/diario.py
+# [file content begin]
+"""
+Diário de saves: um snapshot completo mais um log só de acréscimos.
+
+A cada ciclo (ou a cada poucos segundos) só o que mudou é acrescentado ao
+diário, uma linha JSON por entrada: tempo, população e recursos, as
+construções novas, as melhoradas e as tecnologias desbloqueadas. De tempos
+em tempos o diário é compactado em segundo plano: um novo snapshot é gravado
+e os trechos que ele já cobre são apagados. Carregar é ler o snapshot e
+aplicar o que veio depois.
+
+O diário é dividido em segmentos (``<nome>.diario.<n>``). Ao compactar, o
+segmento atual é fechado e o snapshot guarda o número do próximo; os
+antigos só são apagados depois que o snapshot foi trocado com sucesso,
+então uma queda no meio da compactação não perde nada.
+"""
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+
+class DiarioSalvamento:
+    """Diário de uma cidade na pasta de um GerenciadorSalvamento
+
+    ``registrar(cidade)`` é chamado a cada ciclo; a cada
+    ``entradas_por_compactacao`` entradas (ou ao chamar ``compactar``) um
+    snapshot é gravado por uma thread de trabalho. Criar o diário grava o
+    snapshot inicial e descarta segmentos antigos com o mesmo nome. O
+    snapshot é um save comum (``<nome>_diario.json``): aparece na lista de
+    saves, e ``carregar_jogo`` aplica o diário ao abri-lo.
+    """
+
+    def __init__(self, gerenciador, cidade, nome=None, entradas_por_compactacao=300):
+        self.gerenciador = gerenciador
+        self.nome = nome or cidade.nome
+        self.entradas_por_compactacao = entradas_por_compactacao
+        self.entradas = 0  # entradas desde a última compactação
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="diario")
+        self._compactacao = None
+
+        anteriores = segmentos_diario(gerenciador.pasta_saves, self.nome)
+        self.segmento = anteriores[-1] + 1 if anteriores else 1
+        sucesso, mensagem = self._compactar(cidade, self.segmento)
+        if not sucesso:
+            raise OSError(mensagem)
+        self._arquivo = self._abrir_segmento()
+        self._marcar_base(cidade)
+
+    @property
+    def arquivo_snapshot(self):
+        return f"{self.nome}_diario.json"
+
+    def _abrir_segmento(self):
+        return open(caminho_segmento(self.gerenciador.pasta_saves, self.nome, self.segmento),
+                    'a', encoding='utf-8')
+
+    def _marcar_base(self, cidade):
+        # O que já está no snapshot/diário; a próxima entrada registra só o que vier depois
+        self._construcoes = len(cidade.construcoes)
+        self._tecnologias = len(cidade.tecnologias_desbloqueadas)
+        cidade.alteracoes = set()
+
+    def registrar(self, cidade):
+        """Acrescenta ao diário o que mudou desde a última entrada"""
+        entrada = {'t': cidade.tempo_jogo, 'p': cidade.populacao, 'r': cidade.recursos.to_dict()}
+
+        construcoes = cidade.construcoes
+        total = len(construcoes)
+        if cidade.alteracoes:
+            entrada['m'] = [[posicao, construcoes[posicao].get_beneficios()]
+                            for posicao in sorted(cidade.alteracoes) if posicao < self._construcoes]
+            cidade.alteracoes.clear()
+        if total > self._construcoes:
+            entrada['n'] = [construcoes[i].get_beneficios() for i in range(self._construcoes, total)]
+            self._construcoes = total
+
+        tecnologias = cidade.tecnologias_desbloqueadas
+        if len(tecnologias) > self._tecnologias:
+            entrada['tec'] = tecnologias[self._tecnologias:]
+            self._tecnologias = len(tecnologias)
+
+        self._arquivo.write(json.dumps(entrada, ensure_ascii=False, separators=(',', ':')) + '\n')
+        self._arquivo.flush()
+        self.entradas += 1
+        if self.entradas >= self.entradas_por_compactacao:
+            self.compactar(cidade)
+
+    def compactar(self, cidade):
+        """Troca de segmento e grava um snapshot em segundo plano
+
+        A cidade precisa estar no estado da última entrada registrada. Na
+        thread do chamador só acontecem a troca de arquivo e
+        ``cidade.bifurcar()``. Retorna False se uma compactação ainda estiver
+        em andamento (o diário só cresce um pouco mais até a próxima).
+        """
+        if self._compactacao is not None and not self._compactacao.done():
+            return False
+        self._arquivo.close()
+        self.segmento += 1
+        self._arquivo = self._abrir_segmento()
+        self.entradas = 0
+        self._compactacao = self._executor.submit(self._compactar, cidade.bifurcar(), self.segmento)
+        return True
+
+    def _gravar_snapshot(self, cidade, segmento):
+        dados = self.gerenciador.montar_dados_save(cidade)
+        dados['diario'] = {'nome': self.nome, 'segmento': segmento}
+        return self.gerenciador.gravar_save(dados, self.arquivo_snapshot, indent=None)
+
+    def _compactar(self, copia, segmento):
+        sucesso, mensagem = self._gravar_snapshot(copia, segmento)
+        if sucesso:
+            for antigo in segmentos_diario(self.gerenciador.pasta_saves, self.nome):
+                if antigo < segmento:
+                    os.remove(caminho_segmento(self.gerenciador.pasta_saves, self.nome, antigo))
+        return sucesso, mensagem
+
+    def aguardar_compactacao(self):
+        """Espera a compactação em andamento e retorna (sucesso, mensagem), ou None"""
+        if self._compactacao is None:
+            return None
+        return self._compactacao.result()
+
+    def fechar(self):
+        self._arquivo.close()
+        self._executor.shutdown(wait=True)
+
+
+def caminho_segmento(pasta, nome, segmento):
+    return os.path.join(pasta, f"{nome}.diario.{segmento}")
+
+
+def segmentos_diario(pasta, nome):
+    """Números dos segmentos de diário de ``nome`` existentes na pasta, em ordem"""
+    prefixo = f"{nome}.diario."
+    segmentos = []
+    for arquivo in os.listdir(pasta):
+        if arquivo.startswith(prefixo) and arquivo[len(prefixo):].isdigit():
+            segmentos.append(int(arquivo[len(prefixo):]))
+    return sorted(segmentos)
+
+
+def aplicar_entrada(dados, entrada, converter=None):
+    """Aplica uma entrada do diário ao dicionário de um save
+
+    Com ``converter`` (ex.: construcao_de_registro), as construções do
+    diário são convertidas antes de entrar na lista.
+    """
+    cidade = dados['cidade']
+    cidade['tempo_jogo'] = entrada['t']
+    cidade['populacao'] = entrada['p']
+    dados['recursos'] = entrada['r']
+    for posicao, construcao in entrada.get('m', ()):
+        cidade['construcoes'][posicao] = construcao if converter is None else converter(construcao)
+    novas = entrada.get('n', ())
+    cidade['construcoes'].extend(novas if converter is None else map(converter, novas))
+    cidade['tecnologias_desbloqueadas'].extend(entrada.get('tec', ()))
+
+
+def aplicar_diario(pasta, dados, converter=None):
+    """Aplica ao snapshot ``dados`` os segmentos gravados depois dele
+
+    Uma última linha incompleta (queda no meio da escrita) é ignorada.
+    """
+    diario = dados.pop('diario')
+    for segmento in segmentos_diario(pasta, diario['nome']):
+        if segmento < diario['segmento']:
+            continue
+        with open(caminho_segmento(pasta, diario['nome'], segmento), 'r', encoding='utf-8') as f:
+            for linha in f:
+                try:
+                    entrada = json.loads(linha)
+                except ValueError:
+                    break
+                aplicar_entrada(dados, entrada, converter)
+    return dados
+
+
+def carregar_dados_diario(gerenciador, nome):
+    """Dicionário do save (formato de montar_dados_save): snapshot + diário depois dele"""
+    with open(os.path.join(gerenciador.pasta_saves, f"{nome}_diario.json"), 'r', encoding='utf-8') as f:
+        return aplicar_diario(gerenciador.pasta_saves, json.load(f))
+# [file content end]
@@ -0,0 +1,129 @@
+# [file name]: src/core/exportacao.py
+# [file content begin]
+"""
+Exportação em fluxo das métricas por ciclo de uma partida.
+
+Cada ciclo vira uma linha com as métricas da cidade e a contagem de
+construções por tipo. As linhas ficam em buffers de tamanho fixo e, a cada
+bloco completo, são gravadas em um CSV e em um arquivo ``.npy`` por coluna
+(formato do numpy, legível com ``numpy.load`` ou ``mmap_mode='r'``). A
+memória usada não depende do número de ciclos exportados.
+"""
+import csv
+import os
+import struct
+import sys
+from array import array
+
+from models.construcao import TipoConstrucao
+
+# Cabeçalho .npy v1.0 de tamanho fixo: reescrito no lugar ao fechar, com o total de linhas
+TAMANHO_CABECALHO_NPY = 128
+DESCRITORES_NPY = {'q': '<i8', 'd': '<f8'}
+
+COLUNAS_CIDADE = (
+    ('tempo_jogo', 'q'),
+    ('populacao', 'd'),
+    ('dinheiro', 'd'),
+    ('emissao_carbono', 'd'),
+    ('satisfacao', 'd'),
+    ('total_construcoes', 'q'),
+)
+COLUNAS_TIPOS = tuple((f"construcoes_{tipo.name.lower()}", 'q') for tipo in TipoConstrucao)
+COLUNAS = COLUNAS_CIDADE + COLUNAS_TIPOS
+
+
+def cabecalho_npy(tipo, linhas):
+    """Cabeçalho .npy (v1.0) de um vetor com ``linhas`` valores do tipo ``tipo``"""
+    descricao = "{'descr': '%s', 'fortran_order': False, 'shape': (%d,), }" % (DESCRITORES_NPY[tipo], linhas)
+    espaco = TAMANHO_CABECALHO_NPY - 10 - len(descricao) - 1
+    return b'\x93NUMPY\x01\x00' + struct.pack('<H', TAMANHO_CABECALHO_NPY - 10) + \
+        descricao.encode('latin1') + b' ' * espaco + b'\n'
+
+
+class ExportadorHistorico:
+    """Grava as métricas de cada ciclo em ``pasta`` (historico.csv + <coluna>.npy)
+
+    ``registrar(cidade)`` é chamado uma vez por ciclo, pela SessaoJogo, pelo
+    jogo ou por qualquer laço sem interface. A cada ``tamanho_bloco`` linhas
+    o buffer é descarregado nos arquivos; ``fechar`` grava o que sobrou e
+    atualiza o número de linhas dos ``.npy``. Também funciona com ``with``.
+    """
+
+    def __init__(self, pasta, tamanho_bloco=65536, gravar_csv=True, gravar_npy=True):
+        self.pasta = pasta
+        self.tamanho_bloco = tamanho_bloco
+        self.linhas = 0  # linhas já gravadas em disco
+        self.fechado = False
+        os.makedirs(pasta, exist_ok=True)
+
+        self.buffers = [array(tipo) for _, tipo in COLUNAS]
+        self._colunas_cidade = self.buffers[:len(COLUNAS_CIDADE)]
+        self._colunas_tipos = list(zip(TipoConstrucao, self.buffers[len(COLUNAS_CIDADE):]))
+
+        self._arquivo_csv = None
+        self._escritor_csv = None
+        if gravar_csv:
+            self._arquivo_csv = open(os.path.join(pasta, "historico.csv"), 'w', newline='', encoding='utf-8')
+            self._escritor_csv = csv.writer(self._arquivo_csv)
+            self._escritor_csv.writerow([nome for nome, _ in COLUNAS])
+
+        self._arquivos_npy = []
+        if gravar_npy:
+            for nome, tipo in COLUNAS:
+                arquivo = open(os.path.join(pasta, f"{nome}.npy"), 'w+b')
+                arquivo.write(cabecalho_npy(tipo, 0))
+                self._arquivos_npy.append((arquivo, tipo))
+
+    def registrar(self, cidade):
+        """Acrescenta o estado atual da cidade como uma linha"""
+        if self.fechado:
+            raise ValueError("Exportador já fechado")
+        recursos = cidade.recursos
+        valores = (cidade.tempo_jogo, cidade.populacao, recursos.dinheiro,
+                   recursos.emissao_carbono, recursos.satisfacao_populacional,
+                   len(cidade.construcoes))
+        for buffer, valor in zip(self._colunas_cidade, valores):
+            buffer.append(valor)
+        por_tipo = cidade.indice.por_tipo
+        for tipo, buffer in self._colunas_tipos:
+            buffer.append(por_tipo[tipo])
+
+        if len(self.buffers[0]) >= self.tamanho_bloco:
+            self.descarregar()
+
+    def descarregar(self):
+        """Grava as linhas em buffer e esvazia os buffers"""
+        pendentes = len(self.buffers[0])
+        if not pendentes:
+            return
+        if self._escritor_csv is not None:
+            self._escritor_csv.writerows(zip(*self.buffers))
+        for (arquivo, _), buffer in zip(self._arquivos_npy, self.buffers):
+            if sys.byteorder == 'big':
+                buffer.byteswap()  # .npy gravado sempre em little-endian
+            buffer.tofile(arquivo)
+        for buffer in self.buffers:
+            del buffer[:]
+        self.linhas += pendentes
+
+    def fechar(self):
+        """Grava o restante, corrige os cabeçalhos .npy e fecha os arquivos"""
+        if self.fechado:
+            return
+        self.descarregar()
+        for arquivo, tipo in self._arquivos_npy:
+            arquivo.seek(0)
+            arquivo.write(cabecalho_npy(tipo, self.linhas))
+            arquivo.close()
+        if self._arquivo_csv is not None:
+            self._arquivo_csv.close()
+        self.fechado = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.fechar()
+        return False
+# [file content end]
@@ -0,0 +1,291 @@
+# [file name]: src/core/formato_binario.py
+# [file content begin]
+"""
+Formato binário de save (.ecob) e conversão de pastas de saves JSON.
+
+Layout (little-endian):
+
+- cabeçalho fixo (``CABECALHO``): assinatura ``ECOB``, versão, flags,
+  tempo de jogo, recursos, total de construções e tamanho dos metadados;
+- metadados em JSON (nome, dificuldade, população, tecnologias, metadata e
+  a tabela de nomes de construções usada pelos registros);
+- blocos de construções: um contador uint32 seguido de dois arrays de
+  largura fixa, o índice do nome (uint16) e o nível (uint8) de cada
+  construção; um contador 0 encerra o arquivo.
+
+Custo e impactos não são gravados: vêm do protótipo do catálogo para o
+nível. Com a flag ``FLAG_ZLIB``, tudo depois do cabeçalho é comprimido com
+zlib em fluxo, então o cabeçalho continua legível sem descomprimir nada.
+"""
+import json
+import os
+import struct
+import sys
+import zlib
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+EXTENSAO_BINARIA = ".ecob"
+ASSINATURA = b'ECOB'
+VERSAO_BINARIA = 1
+FLAG_ZLIB = 1
+
+# assinatura, versão, flags, tempo_jogo, dinheiro, emissão, satisfação, construções, tamanho dos metadados
+CABECALHO = struct.Struct('<4sHHqdddQI')
+CONTADOR_BLOCO = struct.Struct('<I')
+TAMANHO_BLOCO = 65536  # construções por bloco
+TAMANHO_LEITURA = 1 << 16
+
+
+def _little_endian(valores):
+    if sys.byteorder == 'big':
+        valores.byteswap()
+    return valores
+
+
+def codificar_bloco(pares, posicoes):
+    """Bytes de um bloco de (nome, nível): os índices (uint16) seguidos dos níveis (uint8)
+
+    ``posicoes`` dá o índice de cada nome na tabela de nomes.
+    """
+    indices = array('H')
+    niveis = array('B')
+    for nome, nivel in pares:
+        indice = posicoes.get(nome)
+        if indice is None:
+            raise ValueError(f"Construção desconhecida: {nome}")
+        indices.append(indice)
+        niveis.append(nivel)
+    return _little_endian(indices).tobytes() + niveis.tobytes()
+
+
+def decodificar_bloco(bruto):
+    """(índices, níveis) de um bloco, como arrays"""
+    quantidade = len(bruto) // 3
+    indices = array('H')
+    indices.frombytes(bruto[:2 * quantidade])
+    niveis = array('B')
+    niveis.frombytes(bruto[2 * quantidade:])
+    return _little_endian(indices), niveis
+
+
+class _Saida:
+    """Escreve no arquivo, comprimindo se pedido"""
+
+    def __init__(self, arquivo, comprimir):
+        self.arquivo = arquivo
+        self.compressor = zlib.compressobj(6) if comprimir else None
+
+    def escrever(self, dados):
+        if self.compressor is not None:
+            dados = self.compressor.compress(dados)
+        self.arquivo.write(dados)
+
+    def fechar(self):
+        if self.compressor is not None:
+            self.arquivo.write(self.compressor.flush())
+
+
+class _Entrada:
+    """Lê exatamente n bytes do arquivo, descomprimindo aos poucos se preciso"""
+
+    def __init__(self, arquivo, comprimido):
+        self.arquivo = arquivo
+        self.descompressor = zlib.decompressobj() if comprimido else None
+        self.buffer = bytearray()
+
+    def ler(self, n):
+        if self.descompressor is None:
+            dados = self.arquivo.read(n)
+        else:
+            while len(self.buffer) < n:
+                entrada = self.descompressor.unconsumed_tail or self.arquivo.read(TAMANHO_LEITURA)
+                if not entrada:
+                    self.buffer += self.descompressor.flush()
+                    break
+                self.buffer += self.descompressor.decompress(entrada, max(n - len(self.buffer), TAMANHO_LEITURA))
+            dados = bytes(self.buffer[:n])
+            del self.buffer[:n]
+        if len(dados) < n:
+            raise ValueError("Save binário truncado")
+        return dados
+
+
+def escrever_binario(arquivo, info, recursos, total, construcoes, comprimir=True):
+    """Grava um save binário em ``arquivo`` (aberto em 'wb')
+
+    ``info`` tem as chaves de dados['cidade'] menos as construções, mais
+    'metadata'; ``construcoes`` é um iterável de (nome, nível) com ``total``
+    itens.
+    """
+    from models.construcao import CATALOGO_CONSTRUCOES
+    nomes = list(CATALOGO_CONSTRUCOES)
+    posicoes = {nome: i for i, nome in enumerate(nomes)}
+    meta = dict(info)
+    meta['nomes_construcoes'] = nomes
+    meta = json.dumps(meta, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+    arquivo.write(CABECALHO.pack(ASSINATURA, VERSAO_BINARIA, FLAG_ZLIB if comprimir else 0,
+                                 info['tempo_jogo'], recursos['dinheiro'], recursos['emissao_carbono'],
+                                 recursos['satisfacao_populacional'], total, len(meta)))
+    saida = _Saida(arquivo, comprimir)
+    saida.escrever(meta)
+
+    gravadas = 0
+    pares = iter(construcoes)
+    while True:
+        bloco = codificar_bloco(islice(pares, TAMANHO_BLOCO), posicoes)
+        if not bloco:
+            break
+        quantidade = len(bloco) // 3
+        saida.escrever(CONTADOR_BLOCO.pack(quantidade) + bloco)
+        gravadas += quantidade
+    if gravadas != total:
+        raise ValueError(f"Esperadas {total} construções, recebidas {gravadas}")
+    saida.escrever(CONTADOR_BLOCO.pack(0))
+    saida.fechar()
+
+
+def escrever_cidade_binario(arquivo, cidade, info, comprimir=True):
+    """Grava a cidade direto das construções, sem montar um dicionário por construção"""
+    pares = ((construcao.prototipo.nome, construcao.nivel) for construcao in cidade.construcoes)
+    escrever_binario(arquivo, info, cidade.recursos.to_dict(), len(cidade.construcoes), pares, comprimir)
+
+
+def escrever_dados_binario(arquivo, dados, comprimir=True):
+    """Grava em binário o dicionário de um save JSON"""
+    info = {chave: valor for chave, valor in dados['cidade'].items() if chave != 'construcoes'}
+    info['metadata'] = dados['metadata']
+    construcoes = dados['cidade']['construcoes']
+    pares = ((construcao['nome'], construcao['nivel']) for construcao in construcoes)
+    escrever_binario(arquivo, info, dados['recursos'], len(construcoes), pares, comprimir)
+
+
+class LeitorBinario:
+    """Lê um save binário: cabeçalho e metadados na criação, construções em blocos
+
+    ``dados`` tem o formato do save JSON, com ``construcoes`` vazia;
+    ``blocos()`` devolve (índices, níveis) como arrays, bloco a bloco, e
+    ``nomes`` converte os índices em nomes de construção.
+    """
+
+    def __init__(self, arquivo):
+        bruto = arquivo.read(CABECALHO.size)
+        if len(bruto) < CABECALHO.size or bruto[:4] != ASSINATURA:
+            raise ValueError("Arquivo não é um save binário")
+        (_, versao, flags, tempo_jogo, dinheiro, emissao, satisfacao,
+         self.total, tamanho_meta) = CABECALHO.unpack(bruto)
+        if versao > VERSAO_BINARIA:
+            raise ValueError(f"Versão de save não suportada: {versao}")
+
+        self.entrada = _Entrada(arquivo, flags & FLAG_ZLIB)
+        meta = json.loads(self.entrada.ler(tamanho_meta).decode('utf-8'))
+        self.nomes = meta.pop('nomes_construcoes')
+        metadata = meta.pop('metadata')
+        meta['tempo_jogo'] = tempo_jogo
+        meta['construcoes'] = []
+        self.dados = {
+            'cidade': meta,
+            'recursos': {'dinheiro': dinheiro, 'emissao_carbono': emissao,
+                         'satisfacao_populacional': satisfacao},
+            'metadata': metadata
+        }
+
+    def blocos(self):
+        lidas = 0
+        while True:
+            quantidade = CONTADOR_BLOCO.unpack(self.entrada.ler(CONTADOR_BLOCO.size))[0]
+            if quantidade == 0:
+                break
+            lidas += quantidade
+            yield decodificar_bloco(self.entrada.ler(3 * quantidade))
+        if lidas != self.total:
+            raise ValueError(f"Save binário com {lidas} construções, esperadas {self.total}")
+
+
+def ler_metadados_binario(caminho):
+    """Dicionário do save sem as construções (só cabeçalho e metadados são lidos)"""
+    with open(caminho, 'rb') as f:
+        return LeitorBinario(f).dados
+
+
+def ler_dados_binario(caminho):
+    """Dicionário completo do save, no mesmo formato do JSON"""
+    with open(caminho, 'rb') as f:
+        leitor = LeitorBinario(f)
+        beneficios = {}  # (índice, nível) -> dicionário, montado uma vez por combinação
+        construcoes = leitor.dados['cidade']['construcoes']
+        for indices, niveis in leitor.blocos():
+            for indice, nivel in zip(indices, niveis):
+                modelo = beneficios.get((indice, nivel))
+                if modelo is None:
+                    modelo = beneficios[indice, nivel] = _beneficios(leitor.nomes[indice], nivel)
+                construcoes.append(dict(modelo))
+        return leitor.dados
+
+
+def _beneficios(nome, nivel):
+    from models.construcao import CATALOGO_CONSTRUCOES
+    prototipo = CATALOGO_CONSTRUCOES.get(nome)
+    if prototipo is None:
+        raise ValueError(f"Construção desconhecida: {nome}")
+    custo, impacto_emissao, impacto_satisfacao = prototipo.niveis[nivel - 1]
+    return {
+        'nome': nome,
+        'tipo': prototipo.tipo.value,
+        'custo': custo,
+        'impacto_emissao': impacto_emissao,
+        'impacto_satisfacao': impacto_satisfacao,
+        'nivel': nivel
+    }
+
+
+def converter_arquivo(origem, destino, comprimir=True):
+    """Converte um save JSON em binário; retorna (arquivo, sucesso, mensagem)"""
+    arquivo = os.path.basename(origem)
+    temporario = destino + ".tmp"
+    try:
+        with open(origem, 'r', encoding='utf-8') as f:
+            dados = json.load(f)
+        if 'diario' in dados:
+            return arquivo, False, "Snapshot de diário não é convertido"
+        with open(temporario, 'wb') as f:
+            escrever_dados_binario(f, dados, comprimir)
+        os.replace(temporario, destino)
+        return arquivo, True, f"Convertido para {os.path.basename(destino)}"
+    except Exception as e:
+        if os.path.exists(temporario):
+            os.remove(temporario)
+        return arquivo, False, f"Erro ao converter: {e}"
+
+
+def converter_pasta(pasta, destino=None, comprimir=True, workers=None, remover_originais=False):
+    """Converte todos os saves JSON de ``pasta`` em processos paralelos
+
+    Os binários vão para ``destino`` (a própria pasta, se None) com a
+    extensão .ecob. Retorna uma lista de (arquivo, sucesso, mensagem), na
+    ordem dos arquivos. Com ``remover_originais``, cada JSON convertido com
+    sucesso é apagado.
+    """
+    destino = pasta if destino is None else destino
+    os.makedirs(destino, exist_ok=True)
+    arquivos = sorted(arquivo for arquivo in os.listdir(pasta) if arquivo.endswith('.json'))
+    origens = [os.path.join(pasta, arquivo) for arquivo in arquivos]
+    destinos = [os.path.join(destino, arquivo[:-len('.json')] + EXTENSAO_BINARIA) for arquivo in arquivos]
+
+    if workers is None:
+        workers = min(len(arquivos), os.cpu_count() or 1)
+    if workers <= 1:
+        resultados = [converter_arquivo(o, d, comprimir) for o, d in zip(origens, destinos)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            resultados = list(executor.map(converter_arquivo, origens, destinos,
+                                           [comprimir] * len(origens), chunksize=4))
+
+    if remover_originais:
+        for origem, (_, sucesso, _) in zip(origens, resultados):
+            if sucesso:
+                os.remove(origem)
+    return resultados
+# [file content end]
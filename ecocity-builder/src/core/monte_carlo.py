@@ -0,0 +1,95 @@
+# [file name]: src/core/monte_carlo.py
+# [file content begin]
+"""
+Estimativa de risco climático por Monte Carlo.
+
+Uma cidade e um plano de construção são jogados várias vezes, cada uma com
+uma sequência independente de eventos climáticos, e a perda de dinheiro e
+satisfação é medida contra a mesma partida sem eventos. As sementes de todas
+as simulações são derivadas da semente mestra antes da distribuição entre os
+processos, então o resultado é o mesmo para qualquer número de workers.
+"""
+import os
+import pickle
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from core.sessao import SessaoJogo
+
+PERCENTIS = (50, 90, 95, 99)
+
+
+def derivar_sementes(semente_mestra, quantidade):
+    """Sementes independentes (64 bits) para cada simulação"""
+    rng = random.Random(semente_mestra)
+    return [rng.getrandbits(64) for _ in range(quantidade)]
+
+
+def _jogar(cidade_serializada, plano, ciclos, semente, eventos=True):
+    """Joga uma cópia da cidade e retorna (dinheiro, satisfação) finais"""
+    cidade = pickle.loads(cidade_serializada)
+    SessaoJogo(cidade, semente, eventos).jogar(plano, ciclos)
+    return cidade.recursos.dinheiro, cidade.recursos.satisfacao_populacional
+
+
+def _simular_lote(cidade_serializada, plano, ciclos, sementes):
+    return [_jogar(cidade_serializada, plano, ciclos, semente) for semente in sementes]
+
+
+def resumir_perdas(perdas):
+    """Média, desvio, percentis e CVaR 95% (média das perdas no pior 5%)"""
+    perdas = np.asarray(perdas, dtype=np.float64)
+    resumo = {
+        'media': float(perdas.mean()),
+        'desvio': float(perdas.std()),
+        'minimo': float(perdas.min()),
+        'maximo': float(perdas.max()),
+    }
+    for percentil, valor in zip(PERCENTIS, np.percentile(perdas, PERCENTIS)):
+        resumo[f'p{percentil}'] = float(valor)
+    resumo['cvar95'] = float(perdas[perdas >= resumo['p95']].mean())
+    return resumo
+
+
+def estimar_risco_climatico(cidade, plano, ciclos, simulacoes=1000, semente=0,
+                            workers=None, tamanho_lote=None):
+    """Joga ``simulacoes`` partidas com eventos e resume as perdas
+
+    ``plano`` segue o formato de SessaoJogo.jogar. A cidade original não é
+    alterada. Com ``workers=1`` tudo roda no processo atual.
+    """
+    # A bifurcação não leva o histórico nem altera os objetos Tecnologia compartilhados
+    cidade_serializada = pickle.dumps(cidade.bifurcar())
+    sementes = derivar_sementes(semente, simulacoes)
+
+    base_dinheiro, base_satisfacao = _jogar(cidade_serializada, plano, ciclos, None, eventos=False)
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        resultados = _simular_lote(cidade_serializada, plano, ciclos, sementes)
+    else:
+        if tamanho_lote is None:
+            tamanho_lote = max(1, simulacoes // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            lotes = [sementes[i:i + tamanho_lote] for i in range(0, simulacoes, tamanho_lote)]
+            futuros = [executor.submit(_simular_lote, cidade_serializada, plano, ciclos, lote)
+                       for lote in lotes]
+            resultados = [resultado for futuro in futuros for resultado in futuro.result()]
+
+    finais = np.array(resultados, dtype=np.float64).reshape(-1, 2)
+    perdas_dinheiro = base_dinheiro - finais[:, 0]
+    perdas_satisfacao = base_satisfacao - finais[:, 1]
+
+    return {
+        'simulacoes': simulacoes,
+        'ciclos': ciclos,
+        'semente': semente,
+        'base': {'dinheiro': base_dinheiro, 'satisfacao': base_satisfacao},
+        'dinheiro': resumir_perdas(perdas_dinheiro),
+        'satisfacao': resumir_perdas(perdas_satisfacao),
+        'perdas_dinheiro': perdas_dinheiro,
+        'perdas_satisfacao': perdas_satisfacao,
+    }
+# [file content end]
@@ -0,0 +1,204 @@
+# [file name]: src/core/planejador.py
+# [file content begin]
+"""
+Planejador de ordem de construção e pesquisa.
+
+Procura, fora do jogo, um plano que leve a emissão de carbono abaixo de uma
+meta até um ciclo limite gastando o mínimo possível. O estado da cidade é
+uma tupla pequena (sem objetos Cidade nem Construcao), avançada entre as
+decisões com a mesma forma fechada de Cidade.avancar_ciclos. A busca é em
+feixe: a cada ponto de decisão cada estado é expandido com "esperar",
+"construir X" e "pesquisar Y", estados equivalentes são unidos por uma
+tabela de transposição e só os melhores seguem adiante.
+"""
+from models.cidade import Cidade, evoluir_populacao
+from models.construcao import CONSTRUCOES_DISPONIVEIS
+from models.tecnologia import TECNOLOGIAS_DISPONIVEIS, ARVORE_TECNOLOGIAS
+
+# Posições na tupla de estado
+CICLO, POPULACAO, DINHEIRO, EMISSAO, SATISFACAO, CONTAGENS, MASCARA, PESQUISA, GASTO = range(9)
+
+
+class PlanejadorConstrucao:
+    """Busca em feixe com tabela de transposição sobre o estado compacto
+
+    ``passo`` é o intervalo em ciclos entre decisões (uma ação por decisão)
+    e ``largura`` o número de estados mantidos por ponto de decisão.
+    """
+
+    def __init__(self, largura=100, passo=5, penalidade_emissao=100,
+                 resolucao_dinheiro=25, resolucao_emissao=0.5, resolucao_populacao=5):
+        self.largura = largura
+        self.passo = passo
+        self.penalidade_emissao = penalidade_emissao  # $ por unidade de emissão acima da meta
+        self.resolucao_dinheiro = resolucao_dinheiro
+        self.resolucao_emissao = resolucao_emissao
+        self.resolucao_populacao = resolucao_populacao
+
+        self.construcoes = [c.prototipo for c in CONSTRUCOES_DISPONIVEIS]
+        self.tecnologias = list(TECNOLOGIAS_DISPONIVEIS)
+        self._mascara_tecnologia = [ARVORE_TECNOLOGIAS.bit(t.nome) for t in self.tecnologias]
+        self._fechamento_tecnologia = [ARVORE_TECNOLOGIAS.fechamento_de(t) for t in self.tecnologias]
+
+        self.tabela = {}
+        self.estados_gerados = 0
+        self.transposicoes = 0
+
+    def estado_de(self, cidade):
+        """Estado compacto a partir de uma Cidade (pesquisas em andamento não são copiadas)"""
+        contagens = tuple(cidade.indice.contar_nome(p.nome) for p in self.construcoes)
+        return (0, cidade.populacao, cidade.recursos.dinheiro, cidade.recursos.emissao_carbono,
+                cidade.recursos.satisfacao_populacional, contagens, cidade.mascara_tecnologias, None, 0)
+
+    def chave(self, estado):
+        """Estado canônico: contagens, tecnologias, pesquisa e recursos em faixas"""
+        return (estado[CICLO], estado[CONTAGENS], estado[MASCARA], estado[PESQUISA],
+                int(estado[POPULACAO] // self.resolucao_populacao),
+                int(estado[DINHEIRO] // self.resolucao_dinheiro),
+                int(estado[EMISSAO] // self.resolucao_emissao),
+                round(estado[SATISFACAO]))
+
+    def acoes(self, estado):
+        """Ações possíveis: (acao, alvo, indice) ou None para esperar"""
+        acoes = [None]
+        dinheiro, mascara = estado[DINHEIRO], estado[MASCARA]
+
+        for i, prototipo in enumerate(self.construcoes):
+            if dinheiro >= prototipo.custo and not prototipo.mascara_requisitos & ~mascara:
+                acoes.append(('construir', prototipo.nome, i))
+
+        if estado[PESQUISA] is None:
+            for i, tecnologia in enumerate(self.tecnologias):
+                if (not self._mascara_tecnologia[i] & mascara and dinheiro >= tecnologia.custo
+                        and not self._fechamento_tecnologia[i] & ~mascara):
+                    acoes.append(('pesquisar', tecnologia.nome, i))
+        return acoes
+
+    def aplicar(self, estado, acao):
+        """Aplica uma ação no ciclo atual (mesmas regras da Cidade)"""
+        ciclo, populacao, dinheiro, emissao, satisfacao, contagens, mascara, pesquisa, gasto = estado
+        tipo, _, i = acao
+
+        if tipo == 'construir':
+            prototipo = self.construcoes[i]
+            contagens = contagens[:i] + (contagens[i] + 1,) + contagens[i + 1:]
+            dinheiro -= prototipo.custo
+            gasto += prototipo.custo
+            emissao += prototipo.impacto_emissao
+            satisfacao = max(0, min(100, satisfacao + prototipo.impacto_satisfacao))
+        else:
+            tecnologia = self.tecnologias[i]
+            dinheiro -= tecnologia.custo
+            gasto += tecnologia.custo
+            pesquisa = (i, ciclo + max(1, tecnologia.tempo_pesquisa))
+
+        return (ciclo, populacao, dinheiro, emissao, satisfacao, contagens, mascara, pesquisa, gasto)
+
+    def avancar(self, estado, ciclos):
+        """Avança ``ciclos`` ciclos em forma fechada, concluindo a pesquisa se terminar no trecho"""
+        ciclo, populacao, dinheiro, emissao, satisfacao, contagens, mascara, pesquisa, gasto = estado
+        total = sum(contagens)
+        fim = ciclo + ciclos
+
+        while ciclo < fim:
+            trecho = fim - ciclo
+            if pesquisa is not None:
+                trecho = min(trecho, pesquisa[1] - ciclo)
+
+            soma_populacao, populacao = evoluir_populacao(populacao, satisfacao, trecho)
+            dinheiro += soma_populacao * 0.5 + total * 25 * trecho
+            emissao += soma_populacao * 0.01
+            ciclo += trecho
+
+            if pesquisa is not None and pesquisa[1] <= ciclo:
+                tecnologia = self.tecnologias[pesquisa[0]]
+                mascara |= self._mascara_tecnologia[pesquisa[0]]
+                emissao += tecnologia.beneficios.get('reducao_emissao', 0)
+                satisfacao += tecnologia.beneficios.get('bonus_satisfacao', 0)
+                pesquisa = None
+
+        return (ciclo, populacao, dinheiro, emissao, satisfacao, contagens, mascara, pesquisa, gasto)
+
+    def pontuacao(self, estado, meta_emissao, ciclo_limite):
+        """Custo gasto mais penalidade pela emissão projetada acima da meta"""
+        projetada = estado[EMISSAO] + estado[POPULACAO] * 0.01 * (ciclo_limite - estado[CICLO])
+        return estado[GASTO] + self.penalidade_emissao * max(0, projetada - meta_emissao)
+
+    def planejar(self, meta_emissao, ciclo_limite, cidade=None):
+        """Procura o plano mais barato com emissão < meta no ciclo limite
+
+        Retorna um dicionário com 'sucesso', 'plano' (lista de (ciclo, acao,
+        alvo) no formato de SessaoJogo.jogar), 'gasto' e o estado final.
+        """
+        if cidade is None:
+            cidade = Cidade("Planejamento")
+
+        self.tabela = {}
+        self.estados_gerados = 0
+        self.transposicoes = 0
+
+        # Cada nó é (estado, nó pai, ação que levou a ele)
+        feixe = [(self.estado_de(cidade), None, None)]
+        ciclo = 0
+
+        while ciclo < ciclo_limite:
+            ciclos = min(self.passo, ciclo_limite - ciclo)
+            proximos = {}
+
+            for no in feixe:
+                estado = no[0]
+                for acao in self.acoes(estado):
+                    novo = estado if acao is None else self.aplicar(estado, acao)
+                    novo = self.avancar(novo, ciclos)
+                    self.estados_gerados += 1
+
+                    chave = self.chave(novo)
+                    melhor = self.tabela.get(chave)
+                    if melhor is not None and (melhor[GASTO], -melhor[DINHEIRO]) <= (novo[GASTO], -novo[DINHEIRO]):
+                        self.transposicoes += 1
+                        continue
+                    self.tabela[chave] = novo
+                    proximos[chave] = (novo, no, acao)
+
+            feixe = sorted(proximos.values(),
+                           key=lambda n: (self.pontuacao(n[0], meta_emissao, ciclo_limite), -n[0][DINHEIRO]))
+            feixe = feixe[:self.largura]
+            ciclo += ciclos
+
+        validos = [n for n in feixe if n[0][EMISSAO] < meta_emissao]
+        sucesso = bool(validos)
+        if sucesso:
+            final = min(validos, key=lambda n: (n[0][GASTO], -n[0][DINHEIRO]))
+        else:
+            final = feixe[0]
+
+        return {
+            'sucesso': sucesso,
+            'plano': self._reconstruir_plano(final),
+            'gasto': final[0][GASTO],
+            'estado_final': self._descrever(final[0]),
+            'estados_gerados': self.estados_gerados,
+            'transposicoes': self.transposicoes,
+        }
+
+    def _reconstruir_plano(self, no):
+        plano = []
+        while no[1] is not None:
+            estado_pai = no[1][0]
+            if no[2] is not None:
+                plano.append((estado_pai[CICLO], no[2][0], no[2][1]))
+            no = no[1]
+        plano.reverse()
+        return plano
+
+    def _descrever(self, estado):
+        return {
+            'ciclo': estado[CICLO],
+            'populacao': estado[POPULACAO],
+            'dinheiro': estado[DINHEIRO],
+            'emissao_carbono': estado[EMISSAO],
+            'satisfacao_populacional': estado[SATISFACAO],
+            'construcoes': {p.nome: n for p, n in zip(self.construcoes, estado[CONTAGENS]) if n},
+            'tecnologias': ARVORE_TECNOLOGIAS.nomes_da_mascara(estado[MASCARA]),
+        }
+# [file content end]
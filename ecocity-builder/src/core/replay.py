@@ -0,0 +1,99 @@
+# [file name]: src/core/replay.py
+# [file content begin]
+"""
+Registro de comandos do jogador e reprodução sem interface.
+
+Uma partida é gravada como a semente dos eventos climáticos mais a lista de
+comandos (ciclo, acao, alvo). Reproduzir o registro em uma SessaoJogo nova
+refaz a partida exatamente, na velocidade máxima, o que serve como carga de
+desempenho e como teste de regressão.
+"""
+import json
+import time
+
+from models.cidade import Cidade
+from core.sessao import SessaoJogo
+
+VERSAO_REGISTRO = 1
+
+
+class RegistroComandos:
+    """Semente, cidade inicial e comandos de uma partida"""
+
+    def __init__(self):
+        self.nome = None
+        self.dificuldade = None
+        self.semente = None
+        self.eventos = True
+        self.comandos = []  # (ciclo, acao, alvo)
+        self.ciclos = 0  # ciclos jogados até o fim da gravação
+
+    def iniciar(self, cidade, semente, eventos=True):
+        """Chamado pela SessaoJogo; a gravação precisa começar de uma cidade nova"""
+        if cidade.tempo_jogo != 0 or len(cidade.construcoes) or cidade.tecnologias_desbloqueadas:
+            raise ValueError("O registro precisa começar de uma cidade nova")
+        self.nome = cidade.nome
+        self.dificuldade = cidade.dificuldade
+        self.semente = semente
+        self.eventos = eventos
+
+    def registrar(self, ciclo, acao, alvo):
+        self.comandos.append((ciclo, acao, alvo))
+
+    def to_dict(self):
+        return {
+            'versao': VERSAO_REGISTRO,
+            'nome': self.nome,
+            'dificuldade': self.dificuldade,
+            'semente': self.semente,
+            'eventos': self.eventos,
+            'ciclos': self.ciclos,
+            'comandos': [list(comando) for comando in self.comandos]
+        }
+
+    @classmethod
+    def from_dict(cls, dados):
+        registro = cls()
+        registro.nome = dados['nome']
+        registro.dificuldade = dados['dificuldade']
+        registro.semente = dados['semente']
+        registro.eventos = dados.get('eventos', True)
+        registro.ciclos = dados['ciclos']
+        registro.comandos = [tuple(comando) for comando in dados['comandos']]
+        return registro
+
+    def salvar(self, caminho):
+        """Grava o registro em JSON compacto"""
+        with open(caminho, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, separators=(',', ':'))
+
+    @classmethod
+    def carregar(cls, caminho):
+        with open(caminho, 'r', encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+
+
+def reproduzir(registro, exportador=None):
+    """Refaz a partida do registro o mais rápido possível
+
+    Retorna um dicionário com a cidade final, suas estatísticas, os ciclos
+    reproduzidos, o tempo gasto e os ciclos (ticks) por segundo. Com um
+    ``exportador`` (ExportadorHistorico), cada ciclo é exportado; fechá-lo
+    fica a cargo de quem o criou.
+    """
+    cidade = Cidade(registro.nome, registro.dificuldade)
+    cidade.historico = None  # o histórico não afeta o estado; sem ele a reprodução é mais rápida
+    sessao = SessaoJogo(cidade, registro.semente, registro.eventos, exportador=exportador)
+
+    inicio = time.perf_counter()
+    sessao.jogar(registro.comandos, registro.ciclos)
+    segundos = time.perf_counter() - inicio
+
+    return {
+        'cidade': cidade,
+        'estatisticas': cidade.get_estatisticas(),
+        'ciclos': registro.ciclos,
+        'segundos': segundos,
+        'ticks_por_segundo': registro.ciclos / segundos if segundos > 0 else float('inf')
+    }
+# [file content end]
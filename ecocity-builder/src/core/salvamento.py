@@ -2,33 +2,152 @@
 # [file content begin]
 import json
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
-class GerenciadorSalvamento:
-    def __init__(self, pasta_saves="saves"):
+from core.formato_binario import (EXTENSAO_BINARIA, escrever_cidade_binario, escrever_dados_binario,
+                                  ler_metadados_binario)
+
+EXTENSOES_SAVE = ('.json', EXTENSAO_BINARIA)
+FORMATOS = {'json': '.json', 'binario': EXTENSAO_BINARIA}
+NOME_MANIFESTO = ".manifesto"
+VERSAO_MANIFESTO = 1
+
+def metadados_save(arquivo, dados):
+    """Resumo de um save exibido na lista de saves"""
+    return {
+        'arquivo': arquivo,
+        'cidade': dados['cidade']['nome'],
+        'dificuldade': dados['cidade']['dificuldade'],
+        'populacao': dados['cidade']['populacao'],
+        'data_salvamento': dados['metadata']['data_salvamento'],
+        'tempo_jogo': dados['cidade']['tempo_jogo']
+    }
+
+class SalvamentoEmSegundoPlano:
+    """Uma thread de trabalho para saves, com os resultados coletados depois
+
+    Usada pelo GerenciadorSalvamento e pelos autosaves (core/autosaves.py):
+    ``_agendar`` envia um save para a thread se não houver outro em
+    andamento; os (sucesso, mensagem) ficam guardados até
+    ``coletar_salvamentos`` ou ``aguardar_salvamentos``.
+    """
+    nome_thread = "salvamento"
+
+    def _iniciar_segundo_plano(self):
+        self._executor = None  # criado no primeiro salvamento em segundo plano
+        self._pendente = None
+        self._resultados = []  # (sucesso, mensagem) ainda não coletados
+
+    def _livre_para_agendar(self):
+        """False se houver um save em andamento"""
+        if self._pendente is not None:
+            if not self._pendente.done():
+                return False
+            self._guardar_resultado()
+        return True
+
+    def _agendar(self, salvar, *argumentos):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=self.nome_thread)
+        self._pendente = self._executor.submit(salvar, *argumentos)
+
+    def _guardar_resultado(self):
+        futuro, self._pendente = self._pendente, None
+        try:
+            self._resultados.append(futuro.result())
+        except Exception as e:
+            self._resultados.append((False, f"Erro ao salvar: {e}"))
+
+    def coletar_salvamentos(self):
+        """Resultados (sucesso, mensagem) de saves em segundo plano já concluídos"""
+        if self._pendente is not None and self._pendente.done():
+            self._guardar_resultado()
+        resultados, self._resultados = self._resultados, []
+        return resultados
+
+    def aguardar_salvamentos(self):
+        """Espera o save em andamento terminar (ex.: ao fechar o jogo) e retorna os resultados"""
+        if self._pendente is not None:
+            self._guardar_resultado()
+        return self.coletar_salvamentos()
+
+class GerenciadorSalvamento(SalvamentoEmSegundoPlano):
+    """Saves na ``pasta_saves``, com um manifesto dos metadados
+
+    O formato de cada save vem da extensão: ``.json`` ou ``.ecob`` (binário,
+    ver core/formato_binario.py). ``formato`` escolhe a extensão dos saves
+    sem nome explícito, como os automáticos.
+
+    O manifesto (``.manifesto`` na mesma pasta) guarda, para cada save, o
+    resumo exibido na lista junto com o mtime e o tamanho do arquivo. Listar
+    lê só o manifesto e um ``stat`` por arquivo; um save só é aberto se não
+    estiver no manifesto ou tiver sido alterado por fora do jogo.
+
+    Os arquivos são gravados em um temporário e trocados com ``os.replace``,
+    então um save nunca fica pela metade. ``salvar_em_segundo_plano`` faz
+    só a bifurcação da cidade na thread do chamador; montar o JSON e gravar
+    ficam para uma thread de trabalho, e o resultado é lido com
+    ``coletar_salvamentos``.
+    """
+
+    def __init__(self, pasta_saves="saves", formato="json", comprimir=True):
+        if formato not in FORMATOS:
+            raise ValueError(f"Formato de save desconhecido: {formato}")
         self.pasta_saves = pasta_saves
+        self.formato = formato
+        self.comprimir = comprimir  # zlib nos saves binários
         self.criar_pasta_saves()
+        self._trava_manifesto = threading.Lock()
+        self._iniciar_segundo_plano()
     
     def criar_pasta_saves(self):
         """Cria a pasta de saves se não existir"""
         if not os.path.exists(self.pasta_saves):
             os.makedirs(self.pasta_saves)
     
-    def salvar_jogo(self, cidade, nome_arquivo=None):
-        """Salva o estado atual do jogo"""
-        if nome_arquivo is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            nome_arquivo = f"{cidade.nome}_{timestamp}.json"
-        
-        caminho_save = os.path.join(self.pasta_saves, nome_arquivo)
-        
-        dados_save = {
+    @property
+    def caminho_manifesto(self):
+        return os.path.join(self.pasta_saves, NOME_MANIFESTO)
+
+    def carregar_manifesto(self):
+        """Entradas do manifesto: arquivo -> {'mtime_ns', 'tamanho', 'metadados'}"""
+        try:
+            with open(self.caminho_manifesto, 'r', encoding='utf-8') as f:
+                manifesto = json.load(f)
+            if manifesto.get('versao') == VERSAO_MANIFESTO:
+                return manifesto['saves']
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+        return {}  # sem manifesto (ou inválido): reconstruído na próxima listagem
+
+    def gravar_manifesto(self, entradas):
+        """Grava o manifesto em um arquivo temporário e troca de uma vez"""
+        temporario = self.caminho_manifesto + ".tmp"
+        with open(temporario, 'w', encoding='utf-8') as f:
+            json.dump({'versao': VERSAO_MANIFESTO, 'saves': entradas}, f,
+                      ensure_ascii=False, separators=(',', ':'))
+        os.replace(temporario, self.caminho_manifesto)
+
+    def _entrada_manifesto(self, caminho, metadados):
+        info = os.stat(caminho)
+        return {'mtime_ns': info.st_mtime_ns, 'tamanho': info.st_size, 'metadados': metadados}
+
+    def nome_automatico(self, cidade):
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        return f"{cidade.nome}_{timestamp}{FORMATOS[self.formato]}"
+
+    def montar_dados_save(self, cidade, incluir_construcoes=True):
+        """Dicionário gravado no arquivo de save"""
+        construcoes = [construcao.get_beneficios() for construcao in cidade.construcoes] if incluir_construcoes else []
+        return {
             'cidade': {
                 'nome': cidade.nome,
                 'dificuldade': cidade.dificuldade,
                 'populacao': cidade.populacao,
                 'tempo_jogo': cidade.tempo_jogo,
-                'construcoes': [construcao.get_beneficios() for construcao in cidade.construcoes],
+                'construcoes': construcoes,
                 'tecnologias_desbloqueadas': cidade.tecnologias_desbloqueadas
             },
             'recursos': cidade.recursos.to_dict(),
@@ -37,67 +156,153 @@ class GerenciadorSalvamento:
                 'versao_jogo': '1.0'
             }
         }
-        
+
+    def _gravar_atomico(self, nome_arquivo, escrever, metadados, binario=False):
+        """Grava com ``escrever(arquivo)`` em um temporário, troca pelo save e atualiza o manifesto"""
+        caminho_save = os.path.join(self.pasta_saves, nome_arquivo)
+        temporario = caminho_save + ".tmp"
         try:
-            with open(caminho_save, 'w', encoding='utf-8') as f:
-                json.dump(dados_save, f, indent=2, ensure_ascii=False)
+            if binario:
+                with open(temporario, 'wb') as f:
+                    escrever(f)
+            else:
+                with open(temporario, 'w', encoding='utf-8') as f:
+                    escrever(f)
+            os.replace(temporario, caminho_save)
+            with self._trava_manifesto:
+                entradas = self.carregar_manifesto()
+                entradas[nome_arquivo] = self._entrada_manifesto(caminho_save, metadados)
+                self.gravar_manifesto(entradas)
             return True, f"Jogo salvo em {nome_arquivo}"
         except Exception as e:
+            if os.path.exists(temporario):
+                os.remove(temporario)
             return False, f"Erro ao salvar: {e}"
-    
+
+    def gravar_save(self, dados_save, nome_arquivo, indent=2):
+        """Grava o dicionário de um save no formato da extensão de ``nome_arquivo``"""
+        metadados = metadados_save(nome_arquivo, dados_save)
+        if nome_arquivo.endswith(EXTENSAO_BINARIA):
+            return self._gravar_atomico(nome_arquivo, lambda f: escrever_dados_binario(f, dados_save, self.comprimir),
+                                        metadados, binario=True)
+        if indent is None:
+            escrever = lambda f: json.dump(dados_save, f, ensure_ascii=False, separators=(',', ':'))
+        else:
+            escrever = lambda f: json.dump(dados_save, f, indent=indent, ensure_ascii=False)
+        return self._gravar_atomico(nome_arquivo, escrever, metadados)
+
+    def _gravar_cidade(self, cidade, nome_arquivo, indent=2):
+        if not nome_arquivo.endswith(EXTENSAO_BINARIA):
+            return self.gravar_save(self.montar_dados_save(cidade), nome_arquivo, indent)
+        # Binário: as construções vão direto para os arrays, sem um dicionário por construção
+        info = self.montar_dados_save(cidade, incluir_construcoes=False)
+        metadados = metadados_save(nome_arquivo, info)
+        dados_cidade = info['cidade']
+        del dados_cidade['construcoes']
+        dados_cidade['metadata'] = info['metadata']
+        return self._gravar_atomico(nome_arquivo, lambda f: escrever_cidade_binario(f, cidade, dados_cidade, self.comprimir),
+                                    metadados, binario=True)
+
+    def salvar_jogo(self, cidade, nome_arquivo=None):
+        """Salva o estado atual do jogo"""
+        if nome_arquivo is None:
+            nome_arquivo = self.nome_automatico(cidade)
+        return self._gravar_cidade(cidade, nome_arquivo)
+
+    def salvar_em_segundo_plano(self, cidade, nome_arquivo=None):
+        """Agenda um save de uma cópia da cidade; retorna False se já houver um em andamento
+
+        Na thread do chamador só acontece ``cidade.bifurcar()`` (O(1) no
+        número de construções); a cópia não é afetada pelos ciclos seguintes.
+        O JSON sai compacto, que o codificador em C do json grava bem mais
+        rápido que o indentado.
+        """
+        if not self._livre_para_agendar():
+            return False
+        if nome_arquivo is None:
+            nome_arquivo = self.nome_automatico(cidade)
+        self._agendar(self._salvar_copia, cidade.bifurcar(), nome_arquivo)
+        return True
+
+    def _salvar_copia(self, copia, nome_arquivo):
+        return self._gravar_cidade(copia, nome_arquivo, indent=None)
+
     def listar_saves(self):
-        """Lista todos os saves disponíveis"""
+        """Lista todos os saves disponíveis, pelo manifesto"""
         saves = []
-        if os.path.exists(self.pasta_saves):
-            for arquivo in os.listdir(self.pasta_saves):
-                if arquivo.endswith('.json'):
-                    caminho = os.path.join(self.pasta_saves, arquivo)
+        if not os.path.exists(self.pasta_saves):
+            return saves
+
+        entradas = self.carregar_manifesto()
+        atualizadas = {}
+        alterado = False
+        with os.scandir(self.pasta_saves) as arquivos:
+            for arquivo in arquivos:
+                if not arquivo.name.endswith(EXTENSOES_SAVE) or not arquivo.is_file():
+                    continue
+                info = arquivo.stat()
+                entrada = entradas.get(arquivo.name)
+                if entrada is None or entrada['mtime_ns'] != info.st_mtime_ns or entrada['tamanho'] != info.st_size:
+                    # Save novo ou alterado por fora do jogo: relido uma vez
+                    alterado = True
                     try:
-                        with open(caminho, 'r', encoding='utf-8') as f:
-                            dados = json.load(f)
-                        
-                        saves.append({
-                            'arquivo': arquivo,
-                            'cidade': dados['cidade']['nome'],
-                            'dificuldade': dados['cidade']['dificuldade'],
-                            'populacao': dados['cidade']['populacao'],
-                            'data_salvamento': dados['metadata']['data_salvamento'],
-                            'tempo_jogo': dados['cidade']['tempo_jogo']
-                        })
+                        if arquivo.name.endswith(EXTENSAO_BINARIA):
+                            dados = ler_metadados_binario(arquivo.path)
+                        else:
+                            with open(arquivo.path, 'r', encoding='utf-8') as f:
+                                dados = json.load(f)
+                        entrada = {'mtime_ns': info.st_mtime_ns, 'tamanho': info.st_size,
+                                   'metadados': metadados_save(arquivo.name, dados)}
                     except:
                         continue
-        
+                atualizadas[arquivo.name] = entrada
+                saves.append(entrada['metadados'])
+
+        if alterado or len(atualizadas) != len(entradas):
+            try:
+                with self._trava_manifesto:
+                    self.gravar_manifesto(atualizadas)
+            except OSError:
+                pass  # sem permissão de escrita: a lista continua válida
+
         # Ordenar por data mais recente
         saves.sort(key=lambda x: x['data_salvamento'], reverse=True)
         return saves
     
-    def carregar_jogo(self, nome_arquivo):
-        """Carrega um jogo salvo"""
+    def cidade_de_dados(self, dados):
+        """Cria a cidade a partir do dicionário de um save"""
+        from core.carregamento import construcao_de_registro, montar_cidade
+        return montar_cidade(dados, [construcao_de_registro(registro) for registro in dados['cidade']['construcoes']])
+    
+    def _ler_save(self, nome_arquivo):
+        """(dados sem construções, construções, índice) de um save da pasta"""
+        from core.carregamento import ler_binario_em_fluxo, ler_json_em_fluxo
         caminho_save = os.path.join(self.pasta_saves, nome_arquivo)
+        if nome_arquivo.endswith(EXTENSAO_BINARIA):
+            with open(caminho_save, 'rb') as f:
+                return ler_binario_em_fluxo(f)
+        with open(caminho_save, 'r', encoding='utf-8') as f:
+            return ler_json_em_fluxo(f)
+
+    def carregar_jogo(self, nome_arquivo):
+        """Carrega um jogo salvo, com construções, níveis e tecnologias
+        
+        O arquivo é lido em fluxo e as construções são recriadas em blocos
+        a partir do catálogo (ver core/carregamento.py).
+        """
+        from core.carregamento import construcao_de_registro, montar_cidade
         
         try:
-            with open(caminho_save, 'r', encoding='utf-8') as f:
-                dados = json.load(f)
-            
-            # Criar cidade
-            from models.cidade import Cidade
-            cidade = Cidade(
-                dados['cidade']['nome'],
-                dados['cidade']['dificuldade']
-            )
-            
-            # Restaurar estado
-            cidade.populacao = dados['cidade']['populacao']
-            cidade.tempo_jogo = dados['cidade']['tempo_jogo']
-            cidade.tecnologias_desbloqueadas = dados['cidade']['tecnologias_desbloqueadas']
-            
-            # Restaurar recursos
-            cidade.recursos = Recurso.from_dict(dados['recursos'])
-            
-            # Restaurar construções (simplificado por enquanto)
-            cidade.construcoes = []  # Será reconstruído durante o jogo
+            dados, construcoes, indice = self._ler_save(nome_arquivo)
+            if 'diario' in dados:
+                # Snapshot de um diário: aplica o que foi registrado depois dele
+                from core.diario import aplicar_diario
+                dados['cidade']['construcoes'] = construcoes
+                aplicar_diario(self.pasta_saves, dados, construcao_de_registro)
+                construcoes = dados['cidade'].pop('construcoes')
+                indice = None  # melhorias do diário trocam construções: índice recalculado
             
-            return True, cidade, "Jogo carregado com sucesso!"
+            return True, montar_cidade(dados, construcoes, indice), "Jogo carregado com sucesso!"
             
         except Exception as e:
             return False, None, f"Erro ao carregar: {e}"
@@ -107,6 +312,10 @@ class GerenciadorSalvamento:
         caminho_save = os.path.join(self.pasta_saves, nome_arquivo)
         try:
             os.remove(caminho_save)
+            with self._trava_manifesto:
+                entradas = self.carregar_manifesto()
+                if entradas.pop(nome_arquivo, None) is not None:
+                    self.gravar_manifesto(entradas)
             return True, "Save deletado com sucesso"
         except Exception as e:
             return False, f"Erro ao deletar: {e}"
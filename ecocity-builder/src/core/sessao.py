@@ -0,0 +1,107 @@
+# [file name]: src/core/sessao.py
+# [file content begin]
+"""
+Partida sem interface: uma cidade, seus eventos climáticos e os comandos do
+jogador, avançando ciclo a ciclo. Usada por simulações e ferramentas que não
+dependem do pygame.
+"""
+import random
+
+from models.eventos import GerenteEventos
+from models.tecnologia import TECNOLOGIAS_DISPONIVEIS
+
+TECNOLOGIAS_POR_NOME = {t.nome: t for t in TECNOLOGIAS_DISPONIVEIS}
+
+
+class SessaoJogo:
+    """Cidade + GerenteEventos com sorteio próprio (``semente``)
+
+    Um plano é uma lista de comandos (ciclo, acao, alvo), com ``ciclo``
+    contado a partir do início da sessão. As ações são 'construir' (nome da
+    construção), 'pesquisar' (nome da tecnologia), 'melhorar' (posição da
+    construção na lista da cidade) e 'salvar' (nome do arquivo).
+
+    Sem ``semente``, uma é sorteada e guardada, então toda sessão pode ser
+    reproduzida. Com um ``registro`` (RegistroComandos), cada comando é
+    gravado com o ciclo em que foi executado. Com um ``exportador``
+    (ExportadorHistorico), o estado ao fim de cada ciclo é exportado.
+    """
+
+    def __init__(self, cidade, semente=None, eventos=True, registro=None, gerenciador_salvamento=None,
+                 exportador=None):
+        if semente is None:
+            semente = random.getrandbits(32)
+        self.cidade = cidade
+        self.semente = semente
+        self.gerente_eventos = GerenteEventos(semente) if eventos else None
+        self.ciclo_inicial = cidade.tempo_jogo
+        self.registro = registro
+        self.gerenciador_salvamento = gerenciador_salvamento
+        self.exportador = exportador
+        if registro is not None:
+            registro.iniciar(cidade, semente, eventos)
+
+    @property
+    def ciclo(self):
+        """Ciclos jogados nesta sessão"""
+        return self.cidade.tempo_jogo - self.ciclo_inicial
+
+    def executar_comando(self, acao, alvo):
+        """Executa um comando do jogador e retorna (sucesso, mensagem)"""
+        if self.registro is not None:
+            self.registro.registrar(self.ciclo, acao, alvo)
+
+        if acao == 'construir':
+            return self.cidade.adicionar_construcao(alvo)
+
+        if acao == 'pesquisar':
+            tecnologia = TECNOLOGIAS_POR_NOME.get(alvo)
+            if tecnologia is None:
+                return False, "Tecnologia não encontrada"
+            return self.cidade.pesquisas.enfileirar(tecnologia)
+
+        if acao == 'melhorar':
+            return self.cidade.melhorar_construcao(alvo)
+
+        if acao == 'salvar':
+            # Salvar não altera o estado; sem gerenciador (ex.: reprodução) só fica no registro
+            if self.gerenciador_salvamento is None:
+                return True, "Salvamento registrado"
+            return self.gerenciador_salvamento.salvar_jogo(self.cidade, alvo)
+
+        return False, f"Comando desconhecido: {acao}"
+
+    def avancar_ciclo(self):
+        """Avança um ciclo da cidade e dos eventos climáticos"""
+        self.cidade.atualizar_estado()
+        if self.registro is not None:
+            self.registro.ciclos = self.ciclo
+        if self.gerente_eventos is not None:
+            evento = self.gerente_eventos.verificar_evento(self.cidade, self.cidade.tempo_jogo)
+            if evento:
+                self.gerente_eventos.agendar_evento(evento)
+            self.gerente_eventos.atualizar(self.cidade, 1)
+        if self.exportador is not None:
+            self.exportador.registrar(self.cidade)
+
+    def _executar_ate(self, comandos, proximo):
+        while proximo < len(comandos) and comandos[proximo][0] <= self.ciclo:
+            _, acao, alvo = comandos[proximo]
+            self.executar_comando(acao, alvo)
+            proximo += 1
+        return proximo
+
+    def jogar(self, plano, ciclos):
+        """Joga ``ciclos`` ciclos executando os comandos do plano no ciclo indicado"""
+        comandos = sorted(plano, key=lambda comando: comando[0])
+        proximo = 0
+        fim = self.ciclo + ciclos
+
+        while self.ciclo < fim:
+            proximo = self._executar_ate(comandos, proximo)
+            self.avancar_ciclo()
+
+        # Comandos marcados para o último ciclo
+        self._executar_ate(comandos, proximo)
+        return self.cidade
+# [file content end]
@@ -0,0 +1,131 @@
+# [file name]: src/core/simulacao_vetorizada.py
+# [file content begin]
+"""
+Motor de simulação sem interface para milhares de cidades ao mesmo tempo.
+
+Cada cidade ocupa uma linha dos arrays NumPy e todas avançam juntas a cada
+ciclo com operações vetorizadas. As regras de crescimento, renda e emissão
+são as mesmas de ``Cidade.atualizar_estado`` e produzem valores idênticos
+enquanto a população couber exatamente em um float64 (< 2**53).
+"""
+import numpy as np
+
+from models.cidade import Cidade
+from models.construcao import CONSTRUCOES_DISPONIVEIS
+
+
+class SimuladorVetorizado:
+    """Simula ``n_cidades`` cidades em paralelo usando arrays NumPy"""
+
+    def __init__(self, n_cidades, dificuldade="Médio"):
+        # Usa a própria Cidade como fonte dos valores iniciais da dificuldade
+        modelo = Cidade("", dificuldade)
+
+        self.n_cidades = n_cidades
+        self.populacao = np.full(n_cidades, modelo.populacao, dtype=np.int64)
+        self.dinheiro = np.full(n_cidades, modelo.recursos.dinheiro, dtype=np.float64)
+        self.emissao_carbono = np.full(n_cidades, modelo.recursos.emissao_carbono, dtype=np.float64)
+        self.satisfacao = np.full(n_cidades, modelo.recursos.satisfacao_populacional, dtype=np.float64)
+        self.tempo_jogo = np.zeros(n_cidades, dtype=np.int64)
+
+        # Uma coluna por construção do catálogo
+        self.nomes_construcoes = [c.nome for c in CONSTRUCOES_DISPONIVEIS]
+        self._coluna = {nome: i for i, nome in enumerate(self.nomes_construcoes)}
+        self.contagem_construcoes = np.zeros((n_cidades, len(self.nomes_construcoes)), dtype=np.int64)
+
+        # Tecnologias desbloqueadas: nome -> array booleano por cidade
+        self.tecnologias = {}
+
+    @classmethod
+    def from_cidades(cls, cidades):
+        """Cria o simulador a partir do estado atual de objetos Cidade"""
+        simulador = cls(len(cidades))
+        for i, cidade in enumerate(cidades):
+            simulador.populacao[i] = cidade.populacao
+            simulador.dinheiro[i] = cidade.recursos.dinheiro
+            simulador.emissao_carbono[i] = cidade.recursos.emissao_carbono
+            simulador.satisfacao[i] = cidade.recursos.satisfacao_populacional
+            simulador.tempo_jogo[i] = cidade.tempo_jogo
+            for construcao in cidade.construcoes:
+                simulador.contagem_construcoes[i, simulador._coluna[construcao.nome]] += 1
+            for tecnologia in cidade.tecnologias_desbloqueadas:
+                nome = getattr(tecnologia, 'nome', tecnologia)
+                simulador._mascara_tecnologia(nome)[i] = True
+        return simulador
+
+    def _mascara_tecnologia(self, nome):
+        if nome not in self.tecnologias:
+            self.tecnologias[nome] = np.zeros(self.n_cidades, dtype=bool)
+        return self.tecnologias[nome]
+
+    def _selecionar(self, cidades):
+        """Converte índices ou máscara em máscara booleana (None = todas)"""
+        mascara = np.zeros(self.n_cidades, dtype=bool)
+        if cidades is None:
+            mascara[:] = True
+        else:
+            mascara[cidades] = True
+        return mascara
+
+    @property
+    def total_construcoes(self):
+        return self.contagem_construcoes.sum(axis=1)
+
+    def desbloquear_tecnologia(self, nome, cidades=None):
+        """Marca uma tecnologia como desbloqueada nas cidades selecionadas"""
+        self._mascara_tecnologia(nome)[self._selecionar(cidades)] = True
+
+    def construir(self, construcao_nome, cidades=None):
+        """Equivalente vetorizado de ``Cidade.adicionar_construcao``
+
+        Retorna um array booleano indicando em quais cidades a construção
+        foi realizada.
+        """
+        if construcao_nome not in self._coluna:
+            raise ValueError(f"Construção não encontrada: {construcao_nome}")
+        construcao = CONSTRUCOES_DISPONIVEIS[self._coluna[construcao_nome]]
+
+        pode = self._selecionar(cidades) & (self.dinheiro >= construcao.custo)
+        for req in construcao.requisitos:
+            pode &= self._mascara_tecnologia(req)
+
+        self.dinheiro[pode] -= construcao.custo
+        self.contagem_construcoes[pode, self._coluna[construcao_nome]] += 1
+        self.emissao_carbono[pode] += construcao.impacto_emissao
+        self.satisfacao[pode] = np.clip(self.satisfacao[pode] + construcao.impacto_satisfacao, 0, 100)
+        return pode
+
+    def atualizar_estado(self):
+        """Avança um ciclo em todas as cidades"""
+        self.avancar(1)
+
+    def avancar(self, ciclos):
+        """Avança ``ciclos`` ciclos em todas as cidades"""
+        # Satisfação e construções não mudam durante os ciclos
+        crescendo = self.satisfacao > 70
+        encolhendo = self.satisfacao < 40
+        renda_construcoes = self.total_construcoes * 25
+
+        for _ in range(ciclos):
+            self.tempo_jogo += 1
+
+            # int() trunca em direção a zero; população nunca é negativa
+            self.populacao[crescendo] = np.trunc(self.populacao[crescendo] * 1.01)
+            self.populacao[encolhendo] = np.trunc(self.populacao[encolhendo] * 0.99)
+
+            self.dinheiro += self.populacao * 0.5 + renda_construcoes
+            self.emissao_carbono += self.populacao * 0.01
+
+    def get_estatisticas(self, indice):
+        """Retorna as estatísticas de uma cidade no formato de ``Cidade.get_estatisticas``"""
+        return {
+            'populacao': int(self.populacao[indice]),
+            'tempo_jogo': int(self.tempo_jogo[indice]),
+            'total_construcoes': int(self.contagem_construcoes[indice].sum()),
+            'recursos': {
+                'dinheiro': float(self.dinheiro[indice]),
+                'emissao_carbono': float(self.emissao_carbono[indice]),
+                'satisfacao_populacional': float(self.satisfacao[indice])
+            }
+        }
+# [file content end]
@@ -9,7 +9,6 @@ import pygame
 import sys
 import os
 import time
-import json
 from datetime import datetime
 
 # Configuração de paths
@@ -18,14 +17,23 @@ src_path = os.path.join(current_dir, 'src')
 if src_path not in sys.path:
     sys.path.append(src_path)
 
+from core.agendador import AgendadorSimulacao
+from core.salvamento import GerenciadorSalvamento
+from core.diario import DiarioSalvamento
+from core.autosaves import ArmazemAutosaves
+
 # Importações com fallback
 try:
     from models.base import Recurso
     from models.cidade import Cidade
     from models.construcao import CONSTRUCOES_DISPONIVEIS
+    from models.tecnologia import TECNOLOGIAS_DISPONIVEIS, ARVORE_TECNOLOGIAS
+    from core.exportacao import ExportadorHistorico
     print("✅ Modelos importados com sucesso")
 except ImportError as e:
     print(f"❌ Erro importando modelos: {e}")
+    ExportadorHistorico = None  # exportação depende dos modelos
+    TECNOLOGIAS_DISPONIVEIS = []  # sem modelos, sem pesquisas
     # Definir classes básicas como fallback
     class Recurso:
         def __init__(self, dinheiro=1000, emissao_carbono=50, satisfacao=70):
@@ -316,6 +324,8 @@ class TelaCriacaoMundo:
         self.botao_confirmar.atualizar(pos_mouse)
         self.botao_voltar.atualizar(pos_mouse)
 
+CICLOS_PREVISAO = 50
+
 class MenuConstrucoes:
     def __init__(self, screen, cidade):
         self.screen = screen
@@ -332,6 +342,50 @@ class MenuConstrucoes:
         self.pagina_atual = 0
         self.itens_por_pagina = 6
         
+        # Lista de construções (simplificada para demo)
+        self.construcoes_demo = [
+            {"nome": "Painel Solar", "custo": 300, "impacto_emissao": -8, "impacto_satisfacao": 2},
+            {"nome": "Parque Eólico", "custo": 500, "impacto_emissao": -12, "impacto_satisfacao": 3},
+            {"nome": "Usina Reciclagem", "custo": 400, "impacto_emissao": -6, "impacto_satisfacao": 5},
+            {"nome": "Parque Público", "custo": 200, "impacto_emissao": -3, "impacto_satisfacao": 8},
+            {"nome": "Ciclovia", "custo": 150, "impacto_emissao": -4, "impacto_satisfacao": 4},
+            {"nome": "Transporte Elétrico", "custo": 600, "impacto_emissao": -15, "impacto_satisfacao": 6},
+        ]
+        
+        # Previsão "e se eu construir isto?" para cada item da lista
+        self.previsoes = {}
+        self._chave_previsoes = None
+        
+    def calcular_previsoes(self):
+        """Projeta a cidade em CICLOS_PREVISAO ciclos para cada construção da lista
+        
+        Cada previsão roda em uma bifurcação O(1) da cidade, e só é refeita
+        quando o estado da cidade muda. A cidade de fallback (sem os
+        modelos) não bifurca, então fica sem previsões.
+        """
+        cidade = self.cidade
+        if not hasattr(cidade, 'bifurcar'):
+            return self.previsoes
+        recursos = cidade.recursos
+        chave = (cidade.tempo_jogo, cidade.indice.total, recursos.dinheiro, recursos.emissao_carbono,
+                 recursos.satisfacao_populacional, cidade.mascara_tecnologias)
+        if chave == self._chave_previsoes:
+            return self.previsoes
+        
+        self.previsoes = {}
+        for construcao in self.construcoes_demo:
+            previsao = cidade.bifurcar()
+            sucesso, _ = previsao.adicionar_construcao(construcao["nome"])
+            if sucesso:
+                previsao.avancar_ciclos(CICLOS_PREVISAO)
+                self.previsoes[construcao["nome"]] = {
+                    'emissao_carbono': previsao.recursos.emissao_carbono,
+                    'dinheiro': previsao.recursos.dinheiro,
+                    'populacao': previsao.populacao
+                }
+        self._chave_previsoes = chave
+        return self.previsoes
+        
     def desenhar(self):
         # Fundo semi-transparente
         overlay = pygame.Surface((self.largura, self.altura), pygame.SRCALPHA)
@@ -353,19 +407,9 @@ class MenuConstrucoes:
                                                 True, (255, 255, 255))
         self.screen.blit(texto_recursos, (painel_rect.x + 20, painel_rect.y + 70))
         
-        # Lista de construções (simplificada para demo)
-        construcoes_demo = [
-            {"nome": "Painel Solar", "custo": 300, "impacto_emissao": -8, "impacto_satisfacao": 2},
-            {"nome": "Parque Eólico", "custo": 500, "impacto_emissao": -12, "impacto_satisfacao": 3},
-            {"nome": "Usina Reciclagem", "custo": 400, "impacto_emissao": -6, "impacto_satisfacao": 5},
-            {"nome": "Parque Público", "custo": 200, "impacto_emissao": -3, "impacto_satisfacao": 8},
-            {"nome": "Ciclovia", "custo": 150, "impacto_emissao": -4, "impacto_satisfacao": 4},
-            {"nome": "Transporte Elétrico", "custo": 600, "impacto_emissao": -15, "impacto_satisfacao": 6},
-        ]
-        
         inicio = self.pagina_atual * self.itens_por_pagina
         fim = inicio + self.itens_por_pagina
-        construcoes_pagina = construcoes_demo[inicio:fim]
+        construcoes_pagina = self.construcoes_demo[inicio:fim]
         
         y_pos = painel_rect.y + 120
         for i, construcao in enumerate(construcoes_pagina):
@@ -401,6 +445,16 @@ class MenuConstrucoes:
         )
         self.screen.blit(stats_text, (x + 10, y + 35))
         
+        # Previsão em CICLOS_PREVISAO ciclos
+        previsao = self.previsoes.get(construcao['nome'])
+        if previsao:
+            previsao_text = self.fonte_pequena.render(
+                f"Em {CICLOS_PREVISAO} ciclos: 🌍 {previsao['emissao_carbono']:.1f}CO₂ | "
+                f"💰 ${previsao['dinheiro']:.0f} | 👥 {previsao['populacao']}",
+                True, (170, 200, 255)
+            )
+            self.screen.blit(previsao_text, (x + 10, y + 52))
+        
         # Botão construir
         botao_construir = Botao(
             "Construir" if pode_construir else "Sem recursos",
@@ -425,12 +479,10 @@ class MenuConstrucoes:
             if hasattr(self, 'botoes_construir'):
                 for botao, construcao in self.botoes_construir:
                     if botao.esta_clicado(event.pos) and self.cidade.recursos.dinheiro >= construcao["custo"]:
-                        # Simular construção
-                        self.cidade.recursos.dinheiro -= construcao["custo"]
-                        self.cidade.recursos.emissao_carbono += construcao["impacto_emissao"]
-                        self.cidade.recursos.satisfacao_populacional += construcao["impacto_satisfacao"]
-                        self.cidade.construcoes.append(construcao["nome"])
-                        return "construido"
+                        # A cidade valida, cobra e mantém seus agregados
+                        sucesso, mensagem = self.cidade.adicionar_construcao(construcao["nome"])
+                        print(f"🏗️ {mensagem}")
+                        return "construido" if sucesso else "erro"
         
         # Limpar botoes_construir para próxima renderização
         if hasattr(self, 'botoes_construir'):
@@ -439,6 +491,7 @@ class MenuConstrucoes:
         return None
     
     def atualizar(self):
+        self.calcular_previsoes()
         pos_mouse = pygame.mouse.get_pos()
         self.botao_fechar.atualizar(pos_mouse)
 
@@ -454,12 +507,9 @@ class MenuPesquisas:
         # Botões
         self.botao_fechar = Botao("Fechar", self.largura - 100, 50, 120, 40, (231, 76, 60))
         
-        # Tecnologias de demonstração
-        self.tecnologias_demo = [
-            {"nome": "Energia Solar Avançada", "custo": 800, "tempo": 10, "desbloqueada": False, "pesquisando": False, "requisitos": []},
-            {"nome": "Veículos Elétricos", "custo": 1200, "tempo": 15, "desbloqueada": False, "pesquisando": False, "requisitos": ["Energia Solar Avançada"]},
-            {"nome": "Agricultura Vertical", "custo": 600, "tempo": 8, "desbloqueada": False, "pesquisando": False, "requisitos": []},
-        ]
+        # Categorias
+        self.categorias = list(set([tech.tipo for tech in TECNOLOGIAS_DISPONIVEIS]))
+        self.categoria_selecionada = None
         
     def desenhar(self):
         # Fundo semi-transparente
@@ -482,15 +532,16 @@ class MenuPesquisas:
         self.screen.blit(texto_recursos, (painel_rect.x + 20, painel_rect.y + 70))
         
         # Tecnologias desbloqueadas
-        techs_desbloqueadas = len([t for t in self.tecnologias_demo if t["desbloqueada"]])
-        texto_desbloqueadas = self.fonte_normal.render(f"Tecnologias Desbloqueadas: {techs_desbloqueadas}/{len(self.tecnologias_demo)}", True, (255, 255, 255))
+        techs_desbloqueadas = len([t for t in TECNOLOGIAS_DISPONIVEIS if self.cidade.tecnologia_desbloqueada(t.nome)])
+        texto_desbloqueadas = self.fonte_normal.render(f"Tecnologias Desbloqueadas: {techs_desbloqueadas}/{len(TECNOLOGIAS_DISPONIVEIS)}", True, (255, 255, 255))
         self.screen.blit(texto_desbloqueadas, (painel_rect.x + 20, painel_rect.y + 100))
         
         # Lista de tecnologias
         y_pos = painel_rect.y + 140
-        for tecnologia in self.tecnologias_demo:
-            self.desenhar_item_tecnologia(tecnologia, painel_rect.x + 20, y_pos, painel_rect.width - 40)
-            y_pos += 90
+        for tecnologia in TECNOLOGIAS_DISPONIVEIS:
+            if self.categoria_selecionada is None or tecnologia.tipo == self.categoria_selecionada:
+                self.desenhar_item_tecnologia(tecnologia, painel_rect.x + 20, y_pos, painel_rect.width - 40)
+                y_pos += 90
         
         # Botão fechar
         self.botao_fechar.desenhar(self.screen)
@@ -501,25 +552,30 @@ class MenuPesquisas:
     
     def desenhar_item_tecnologia(self, tecnologia, x, y, largura):
         """Desenha um item de tecnologia na lista"""
+        # Estado da pesquisa nesta cidade
+        desbloqueada = self.cidade.tecnologia_desbloqueada(tecnologia.nome)
+        pesquisando = self.cidade.pesquisas.em_pesquisa(tecnologia.nome)
+        
         # Fundo do item
         item_rect = pygame.Rect(x, y, largura, 80)
-        cor_fundo = (60, 80, 140) if tecnologia["desbloqueada"] else (50, 70, 120)
+        cor_fundo = (60, 80, 140) if desbloqueada else (50, 70, 120)
         pygame.draw.rect(self.screen, cor_fundo, item_rect, border_radius=8)
         pygame.draw.rect(self.screen, (200, 200, 200), item_rect, 1, border_radius=8)
         
         # Status da tecnologia
-        if tecnologia["desbloqueada"]:
+        if desbloqueada:
             status = "✅ DESBLOQUEADA"
             cor_status = (46, 204, 113)
-        elif tecnologia["pesquisando"]:
-            status = "🔬 PESQUISANDO..."
+        elif pesquisando:
+            progresso = self.cidade.pesquisas.progresso(tecnologia)
+            status = f"🔬 PESQUISANDO... {progresso:.0f}%"
             cor_status = (241, 196, 15)
         else:
             status = "🔒 BLOQUEADA"
             cor_status = (150, 150, 150)
         
-        # Nome
-        texto_nome = self.fonte_normal.render(tecnologia["nome"], True, (255, 255, 255))
+        # Nome e tipo
+        texto_nome = self.fonte_normal.render(f"{tecnologia.nome} - {tecnologia.tipo.value}", True, (255, 255, 255))
         self.screen.blit(texto_nome, (x + 10, y + 10))
         
         # Status
@@ -527,14 +583,14 @@ class MenuPesquisas:
         self.screen.blit(texto_status, (x + 10, y + 35))
         
         # Custo e tempo
-        info_text = self.fonte_pequena.render(f"Custo: ${tecnologia['custo']} | Tempo: {tecnologia['tempo']}s", True, (200, 200, 200))
+        info_text = self.fonte_pequena.render(f"Custo: ${tecnologia.custo} | Tempo: {tecnologia.tempo_pesquisa}s", True, (200, 200, 200))
         self.screen.blit(info_text, (x + 10, y + 55))
         
         # Botão pesquisar (se disponível)
-        pode_pesquisar = (not tecnologia["desbloqueada"] and 
-                         not tecnologia["pesquisando"] and
-                         self.cidade.recursos.dinheiro >= tecnologia["custo"] and
-                         all(req in [t["nome"] for t in self.tecnologias_demo if t["desbloqueada"]] for req in tecnologia["requisitos"]))
+        pode_pesquisar = (not desbloqueada and 
+                         not pesquisando and
+                         self.cidade.recursos.dinheiro >= tecnologia.custo and
+                         not ARVORE_TECNOLOGIAS.fechamento_de(tecnologia) & ~self.cidade.mascara_tecnologias)
         
         if pode_pesquisar:
             botao_pesquisar = Botao(
@@ -551,8 +607,8 @@ class MenuPesquisas:
             self.botoes_pesquisar.append((botao_pesquisar, tecnologia))
         
         # Requisitos (se houver)
-        if tecnologia["requisitos"] and not tecnologia["desbloqueada"]:
-            req_text = f"Requisitos: {', '.join(tecnologia['requisitos'])}"
+        if tecnologia.requisitos and not desbloqueada:
+            req_text = f"Requisitos: {', '.join(tecnologia.requisitos)}"
             texto_req = self.fonte_pequena.render(req_text, True, (200, 150, 150))
             self.screen.blit(texto_req, (x + largura - 250, y + 55))
     
@@ -566,13 +622,14 @@ class MenuPesquisas:
             if hasattr(self, 'botoes_pesquisar'):
                 for botao, tecnologia in self.botoes_pesquisar:
                     if botao.esta_clicado(event.pos):
-                        # Simular pesquisa
-                        if self.cidade.recursos.dinheiro >= tecnologia["custo"]:
-                            self.cidade.recursos.dinheiro -= tecnologia["custo"]
-                            tecnologia["pesquisando"] = True
-                            # Simular conclusão após tempo
-                            print(f"🔬 Pesquisa de {tecnologia['nome']} iniciada!")
+                        # Desbloqueio e benefícios ficam a cargo do agendador da cidade
+                        sucesso, mensagem = self.cidade.pesquisas.enfileirar(tecnologia)
+                        if sucesso:
+                            print(f"🔬 {mensagem}")
                             return "pesquisa_iniciada"
+                        else:
+                            print(f"❌ {mensagem}")
+                            return "erro_pesquisa"
         
         # Limpar botoes_pesquisar para próxima renderização
         if hasattr(self, 'botoes_pesquisar'):
@@ -597,10 +654,16 @@ class PainelEstatisticas:
         # Botões
         self.botao_fechar = Botao("Fechar", self.largura - 100, 50, 120, 40, (231, 76, 60))
         
-        # Histórico de dados (simulado)
-        self.historico_emissao = [50, 48, 45, 42, 40, 38, 35]
-        self.historico_satisfacao = [70, 72, 75, 78, 80, 82, 85]
-        self.historico_populacao = [100, 105, 110, 115, 120, 125, 130]
+        # Pontos por gráfico (um por pixel de largura) e janela em ciclos (None = partida toda)
+        self.pontos_grafico = 250
+        self.janela_grafico = None
+    
+    def serie_historico(self, nome):
+        """(tempos, valores) de uma série do histórico, com no máximo pontos_grafico pontos"""
+        historico = getattr(self.cidade, 'historico', None)
+        if historico is None:
+            return [], []
+        return historico.serie_reduzida(nome, self.pontos_grafico, self.janela_grafico)
     
     def desenhar(self):
         # Fundo semi-transparente
@@ -705,22 +768,24 @@ class PainelEstatisticas:
         # Gráfico de emissões
         texto_emissao = self.fonte_pequena.render("Emissões de CO₂:", True, (255, 255, 255))
         self.screen.blit(texto_emissao, (x + 20, y + 50))
-        self.desenhar_grafico_simples(self.historico_emissao, x + 20, y + 70, 250, 60, (231, 76, 60))
+        self.desenhar_grafico_simples(*self.serie_historico('emissao_carbono'), x + 20, y + 70, 250, 60, (231, 76, 60))
         
         # Gráfico de satisfação
         texto_satisfacao = self.fonte_pequena.render("Satisfação Populacional:", True, (255, 255, 255))
         self.screen.blit(texto_satisfacao, (x + 300, y + 50))
-        self.desenhar_grafico_simples(self.historico_satisfacao, x + 300, y + 70, 250, 60, (46, 204, 113))
+        self.desenhar_grafico_simples(*self.serie_historico('satisfacao'), x + 300, y + 70, 250, 60, (46, 204, 113))
         
         # Gráfico de população
         texto_populacao = self.fonte_pequena.render("População:", True, (255, 255, 255))
         self.screen.blit(texto_populacao, (x + 580, y + 50))
-        self.desenhar_grafico_simples(self.historico_populacao, x + 580, y + 70, 250, 60, (241, 196, 15))
+        self.desenhar_grafico_simples(*self.serie_historico('populacao'), x + 580, y + 70, 250, 60, (241, 196, 15))
     
-    def desenhar_grafico_simples(self, dados, x, y, largura, altura, cor):
-        """Desenha um gráfico de linha simplificado"""
+    def desenhar_grafico_simples(self, tempos, dados, x, y, largura, altura, cor):
+        """Desenha um gráfico de linha simplificado (``tempos`` dá a posição de cada ponto)"""
         if len(dados) < 2:
             return
+        inicio_tempo = tempos[0]
+        duracao = (tempos[-1] - inicio_tempo) or 1
             
         # Encontrar valores máximo e mínimo para escala
         max_val = max(dados)
@@ -733,15 +798,15 @@ class PainelEstatisticas:
         # Desenhar linhas do gráfico
         pontos = []
         for i, valor in enumerate(dados):
-            x_pos = x + (i / (len(dados) - 1)) * largura
+            x_pos = x + ((tempos[i] - inicio_tempo) / duracao) * largura
             y_pos = y + altura - ((valor - min_val) / range_val) * altura
             pontos.append((x_pos, y_pos))
         
         if len(pontos) > 1:
             pygame.draw.lines(self.screen, cor, False, pontos, 3)
             
-        # Desenhar pontos
-        for ponto in pontos:
+        # Desenhar pontos (só com poucos dados, senão viram uma linha grossa)
+        for ponto in (pontos if len(pontos) <= 30 else []):
             pygame.draw.circle(self.screen, cor, (int(ponto[0]), int(ponto[1])), 4)
     
     def calcular_investimento_total(self):
@@ -766,44 +831,6 @@ class PainelEstatisticas:
         pos_mouse = pygame.mouse.get_pos()
         self.botao_fechar.atualizar(pos_mouse)
 
-class GerenciadorSalvamento:
-    def __init__(self, pasta_saves="saves"):
-        self.pasta_saves = pasta_saves
-        self.criar_pasta_saves()
-    
-    def criar_pasta_saves(self):
-        if not os.path.exists(self.pasta_saves):
-            os.makedirs(self.pasta_saves)
-    
-    def salvar_jogo(self, cidade, nome_arquivo=None):
-        if nome_arquivo is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            nome_arquivo = f"{cidade.nome}_{timestamp}.json"
-        
-        caminho_save = os.path.join(self.pasta_saves, nome_arquivo)
-        
-        dados_save = {
-            'cidade': {
-                'nome': cidade.nome,
-                'dificuldade': cidade.dificuldade,
-                'populacao': cidade.populacao,
-                'tempo_jogo': cidade.tempo_jogo,
-                'construcoes': cidade.construcoes,
-            },
-            'recursos': cidade.recursos.to_dict(),
-            'metadata': {
-                'data_salvamento': datetime.now().isoformat(),
-                'versao_jogo': '1.0'
-            }
-        }
-        
-        try:
-            with open(caminho_save, 'w', encoding='utf-8') as f:
-                json.dump(dados_save, f, indent=2, ensure_ascii=False)
-            return True, f"Jogo salvo em {nome_arquivo}"
-        except Exception as e:
-            return False, f"Erro ao salvar: {e}"
-
 class EcoCityBuilder:
     def __init__(self):
         pygame.init()
@@ -840,10 +867,16 @@ class EcoCityBuilder:
         
         # Sistemas
         self.gerenciador_salvamento = GerenciadorSalvamento()
+        # Autosaves deduplicados: só o que mudou é gravado, com retenção (últimos, por hora e por dia)
+        self.autosaves = ArmazemAutosaves(os.path.join(self.gerenciador_salvamento.pasta_saves, "autosaves"))
+        self.exportador = None  # ExportadorHistorico ativo (tecla X)
+        # Diário por ciclo + compactação em vez do salvamento automático (tecla J ou --diario)
+        self.usar_diario = "--diario" in sys.argv
+        self.diario = None
         
         # Temporizadores
-        self.ultima_atualizacao = 0
-        self.intervalo_atualizacao = 1000  # 1 segundo
+        self.agendador = AgendadorSimulacao(passo_ms=1000)  # 1 ciclo por segundo em 1x
+        self.ultimo_quadro = 0
         self.ultimo_salvamento_auto = 0
         self.intervalo_salvamento_auto = 30000  # 30 segundos
         
@@ -899,6 +932,14 @@ class EcoCityBuilder:
                     self.abrir_painel_estatisticas()
                 elif evento.key == pygame.K_s and self.estado_atual == self.estados["JOGANDO"]:
                     self.salvar_jogo()
+                elif evento.key == pygame.K_x and self.estado_atual == self.estados["JOGANDO"]:
+                    self.alternar_exportacao()
+                elif evento.key == pygame.K_j and self.estado_atual == self.estados["JOGANDO"]:
+                    self.alternar_diario()
+                elif evento.key == pygame.K_SPACE and self.estado_atual == self.estados["JOGANDO"]:
+                    self.agendador.alternar_pausa()
+                elif evento.key in (pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4) and self.estado_atual == self.estados["JOGANDO"]:
+                    self.agendador.definir_velocidade(AgendadorSimulacao.VELOCIDADES[evento.key - pygame.K_1])
             
             resultado = self.processar_eventos_estado(evento)
             if resultado == "sair":
@@ -972,19 +1013,46 @@ class EcoCityBuilder:
             self.tela_criacao = TelaCriacaoMundo(self.screen)
             self.estado_atual = self.estados["CRIAR_MUNDO"]
         elif acao == "Carregar Jogo":
-            print("📂 Carregar jogo (em desenvolvimento)")
+            self.carregar_ultimo_jogo()
         elif acao == "Configurações":
             print("⚙️ Configurações (em desenvolvimento)")
         elif acao == "Sair":
+            self.encerrar_exportacao()
+            self.encerrar_diario()
+            self.mostrar_resultados_salvamento(self.gerenciador_salvamento.aguardar_salvamentos())
+            self.mostrar_resultados_salvamento(self.autosaves.aguardar_salvamentos())
             pygame.quit()
             sys.exit()
     
     def iniciar_novo_jogo(self, nome_cidade, dificuldade):
         print(f"🆕 Iniciando novo jogo: {nome_cidade} ({dificuldade})")
-        self.cidade = Cidade(nome_cidade, dificuldade)
-        self.estado_atual = self.estados["JOGANDO"]
+        self.iniciar_cidade(Cidade(nome_cidade, dificuldade))
         print(f"🏙️ Nova cidade criada: {self.cidade}")
     
+    def iniciar_cidade(self, cidade):
+        """Passa a jogar com ``cidade`` (nova ou carregada), com o diário se estiver ligado"""
+        self.encerrar_exportacao()
+        self.encerrar_diario()
+        self.cidade = cidade
+        self.cidade.ativar_historico()
+        if self.usar_diario:
+            self.diario = DiarioSalvamento(self.gerenciador_salvamento, self.cidade)
+        self.estado_atual = self.estados["JOGANDO"]
+    
+    def carregar_ultimo_jogo(self):
+        """Carrega o save mais recente, manual ou automático (ex.: depois de uma queda)"""
+        saves = [(save, self.gerenciador_salvamento.carregar_jogo) for save in self.gerenciador_salvamento.listar_saves()]
+        saves += [(save, self.autosaves.carregar) for save in self.autosaves.listar()]
+        if not saves:
+            print("📂 Nenhum save encontrado")
+            return
+        save, carregar = max(saves, key=lambda item: item[0]['data_salvamento'])
+        sucesso, cidade, mensagem = carregar(save['arquivo'])
+        print(f"📂 {mensagem}")
+        if sucesso:
+            self.iniciar_cidade(cidade)
+            print(f"🏙️ Cidade carregada: {self.cidade}")
+    
     def abrir_menu_construcoes(self):
         if self.cidade:
             self.menu_construcoes = MenuConstrucoes(self.screen, self.cidade)
@@ -1008,8 +1076,74 @@ class EcoCityBuilder:
             self.tempo_alerta = time.time()
             self.mensagem_alerta = "Jogo Salvo!"
     
+    def salvar_automaticamente(self):
+        # A cópia da cidade é feita aqui; codificar e gravar ficam na thread de salvamento
+        if self.cidade:
+            self.autosaves.salvar_em_segundo_plano(self.cidade)
+    
+    def mostrar_resultados_salvamento(self, resultados):
+        for sucesso, mensagem in resultados:
+            print(f"💾 {mensagem}")
+            self.mostrar_alerta = True
+            self.tempo_alerta = time.time()
+            self.mensagem_alerta = "Jogo Salvo!" if sucesso else "Erro ao salvar!"
+    
+    def alternar_exportacao(self):
+        """Liga ou desliga a exportação do histórico por ciclo (CSV + .npy)"""
+        if not self.cidade or ExportadorHistorico is None:
+            return
+        if self.exportador:
+            self.encerrar_exportacao()
+            return
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        pasta = os.path.join("exportacoes", f"{self.cidade.nome}_{timestamp}")
+        self.exportador = ExportadorHistorico(pasta)
+        print(f"📤 Exportando histórico para {pasta}")
+        self.mostrar_alerta = True
+        self.tempo_alerta = time.time()
+        self.mensagem_alerta = "Exportando histórico..."
+    
+    def encerrar_exportacao(self):
+        if self.exportador:
+            self.exportador.fechar()
+            print(f"📤 Histórico exportado: {self.exportador.linhas} ciclos em {self.exportador.pasta}")
+            self.mostrar_alerta = True
+            self.tempo_alerta = time.time()
+            self.mensagem_alerta = "Histórico exportado!"
+            self.exportador = None
+    
+    def alternar_diario(self):
+        """Liga ou desliga o diário de saves (no lugar do salvamento automático)"""
+        if not self.cidade:
+            return
+        self.usar_diario = not self.usar_diario
+        if self.usar_diario:
+            self.diario = DiarioSalvamento(self.gerenciador_salvamento, self.cidade)
+            print(f"📓 Diário de saves ligado: {self.diario.arquivo_snapshot}")
+            self.mensagem_alerta = "Diário de saves ligado"
+        else:
+            self.encerrar_diario()
+            print("📓 Diário de saves desligado")
+            self.mensagem_alerta = "Diário de saves desligado"
+        self.mostrar_alerta = True
+        self.tempo_alerta = time.time()
+    
+    def encerrar_diario(self):
+        if self.diario:
+            self.diario.fechar()
+            self.diario = None
+    
+    def ciclo_simulacao(self):
+        self.cidade.atualizar_estado()
+        if self.exportador:
+            self.exportador.registrar(self.cidade)
+        if self.diario:
+            self.diario.registrar(self.cidade)
+    
     def atualizar(self):
         tempo_atual = pygame.time.get_ticks()
+        delta_ms = tempo_atual - self.ultimo_quadro
+        self.ultimo_quadro = tempo_atual
         
         if self.estado_atual == self.estados["MENU_PRINCIPAL"]:
             self.menu_principal.atualizar()
@@ -1018,14 +1152,12 @@ class EcoCityBuilder:
             self.tela_criacao.atualizar()
             
         elif self.estado_atual == self.estados["JOGANDO"] and self.cidade:
-            # Atualização periódica da cidade
-            if tempo_atual - self.ultima_atualizacao > self.intervalo_atualizacao:
-                self.cidade.atualizar_estado()
-                self.ultima_atualizacao = tempo_atual
+            # Ticks de passo fixo, independentes do FPS
+            self.agendador.atualizar(delta_ms, self.ciclo_simulacao)
             
-            # Salvamento automático
-            if tempo_atual - self.ultimo_salvamento_auto > self.intervalo_salvamento_auto:
-                self.salvar_jogo()
+            # Salvamento automático em segundo plano (o diário já grava a cada ciclo)
+            if not self.diario and tempo_atual - self.ultimo_salvamento_auto > self.intervalo_salvamento_auto:
+                self.salvar_automaticamente()
                 self.ultimo_salvamento_auto = tempo_atual
             
             # Atualizar botões
@@ -1041,6 +1173,9 @@ class EcoCityBuilder:
         elif self.estado_atual == self.estados["PAINEL_ESTATISTICAS"] and self.painel_estatisticas:
             self.painel_estatisticas.atualizar()
         
+        self.mostrar_resultados_salvamento(self.gerenciador_salvamento.coletar_salvamentos())
+        self.mostrar_resultados_salvamento(self.autosaves.coletar_salvamentos())
+        
         # Atualizar alertas
         if self.mostrar_alerta and time.time() - self.tempo_alerta > 3:
             self.mostrar_alerta = False
@@ -1107,7 +1242,7 @@ class EcoCityBuilder:
             self.screen.blit(const_info, (area_jogo.x + 20, area_jogo.y + 90 + i * 25))
         
         # Instruções
-        instrucoes = self.fontes['pequena'].render("C: Construções | P: Pesquisas | E: Estatísticas | S: Salvar | ESC: Pausar", True, self.cores['texto'])
+        instrucoes = self.fontes['pequena'].render("C: Construções | P: Pesquisas | E: Estatísticas | S: Salvar | X: Exportar | J: Diário | ESPAÇO: Pausar simulação | 1-4: Velocidade | ESC: Pausar", True, self.cores['texto'])
         self.screen.blit(instrucoes, (20, self.screen_height - 30))
     
     def desenhar_painel_recursos(self):
@@ -1126,6 +1261,9 @@ class EcoCityBuilder:
             for i, texto in enumerate(textos):
                 surf = self.fontes['normal'].render(texto, True, self.cores['texto'])
                 self.screen.blit(surf, (20 + i * 250, 40))
+            
+            velocidade = self.fontes['pequena'].render(str(self.agendador), True, self.cores['destaque'])
+            self.screen.blit(velocidade, (20, 75))
     
     def desenhar_tela_pausa(self):
         overlay = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
@@ -1150,7 +1288,8 @@ class EcoCityBuilder:
         print("🎮 Iniciando EcoCity Builder...")
         print("📍 Controles:")
         print("- ESC: Navegar entre telas")
-        print("- C: Construções | P: Pesquisas | E: Estatísticas | S: Salvar")
+        print("- C: Construções | P: Pesquisas | E: Estatísticas | S: Salvar | X: Exportar histórico | J: Diário de saves")
+        print("- ESPAÇO: Pausar simulação | 1-4: Velocidade (1x, 2x, 10x, 100x)")
         print("- Mouse: Navegar e interagir")
         
         while True:
@@ -1161,6 +1300,10 @@ class EcoCityBuilder:
             self.desenhar()
             self.clock.tick(self.fps)
         
+        self.encerrar_exportacao()
+        self.encerrar_diario()
+        self.mostrar_resultados_salvamento(self.gerenciador_salvamento.aguardar_salvamentos())
+        self.mostrar_resultados_salvamento(self.autosaves.aguardar_salvamentos())
         pygame.quit()
         sys.exit()
 
@@ -3,6 +3,7 @@
 from .base import Recurso
 from .cidade import Cidade
 from .construcao import Construcao, CONSTRUCOES_DISPONIVEIS, TipoConstrucao
+from .indice_construcoes import IndiceConstrucoes
 
-__all__ = ['Recurso', 'Cidade', 'Construcao', 'CONSTRUCOES_DISPONIVEIS', 'TipoConstrucao']
+__all__ = ['Recurso', 'Cidade', 'Construcao', 'CONSTRUCOES_DISPONIVEIS', 'TipoConstrucao', 'IndiceConstrucoes']
 # [file content end]
\ No newline at end of file
@@ -0,0 +1,115 @@
+# [file name]: src/models/arvore_tecnologias.py
+# [file content begin]
+class ArvoreTecnologias:
+    """Árvore de tecnologias compilada em IDs inteiros e máscaras de bits
+
+    Cada tecnologia recebe um ID e o fechamento transitivo dos seus
+    pré-requisitos é calculado uma única vez. Um conjunto de tecnologias
+    desbloqueadas é um inteiro (bit ``id`` ligado), e qualquer verificação
+    "pode pesquisar / pode construir" vira um único teste de máscara.
+
+    Os nós são as tecnologias e seus requisitos, mais as folhas (sem
+    pré-requisitos) que as construções exigem, criadas com
+    ``registrar_folhas``. Consultas nunca criam nós: nomes fora da árvore
+    têm bit 0 e ficam para quem consulta verificar pelo nome.
+    """
+
+    def __init__(self, tecnologias=()):
+        self.ids = {}
+        self.nomes = []
+        self.fechamento = []  # pré-requisitos diretos e indiretos, por ID
+        self.compiladas = {t.nome for t in tecnologias}
+
+        for tecnologia in tecnologias:
+            self._registrar(tecnologia.nome)
+        for tecnologia in tecnologias:
+            for req in tecnologia.requisitos:
+                self._registrar(req)
+        self._compilar({t.nome: t.requisitos for t in tecnologias})
+
+    def _registrar(self, nome):
+        """Retorna o ID da tecnologia, criando um nó sem pré-requisitos se for nova"""
+        if nome not in self.ids:
+            self.ids[nome] = len(self.nomes)
+            self.nomes.append(nome)
+            self.fechamento.append(0)
+        return self.ids[nome]
+
+    def registrar_folhas(self, nomes):
+        """Dá um ID, como nó sem pré-requisitos, aos nomes que ainda não estão na árvore"""
+        for nome in nomes:
+            self._registrar(nome)
+
+    def _compilar(self, requisitos):
+        """Calcula o fechamento transitivo em ordem topológica (sem recursão)"""
+        dependentes = {nome: [] for nome in self.ids}
+        pendentes = {}
+        for nome, reqs in requisitos.items():
+            pendentes[nome] = len(reqs)
+            for req in reqs:
+                dependentes[req].append(nome)
+
+        prontos = [nome for nome in self.ids if pendentes.get(nome, 0) == 0]
+        processados = 0
+        while prontos:
+            nome = prontos.pop()
+            processados += 1
+            mascara = self.fechamento[self.ids[nome]] | (1 << self.ids[nome])
+            for dependente in dependentes[nome]:
+                self.fechamento[self.ids[dependente]] |= mascara
+                pendentes[dependente] -= 1
+                if pendentes[dependente] == 0:
+                    prontos.append(dependente)
+
+        if processados < len(self.ids):
+            ciclo = [nome for nome, n in pendentes.items() if n > 0]
+            raise ValueError(f"Ciclo na árvore de tecnologias: {', '.join(ciclo)}")
+
+    def bit(self, nome):
+        """Bit da tecnologia, ou 0 se ela não está na árvore"""
+        id_tecnologia = self.ids.get(nome)
+        return 0 if id_tecnologia is None else 1 << id_tecnologia
+
+    def fora_da_arvore(self, nomes):
+        """Nomes que não estão na árvore, na ordem dada"""
+        return [nome for nome in nomes if nome not in self.ids]
+
+    def mascara(self, nomes):
+        """Converte uma lista de nomes em máscara de bits"""
+        mascara = 0
+        for nome in nomes:
+            mascara |= self.bit(nome)
+        return mascara
+
+    def mascara_requisitos(self, requisitos):
+        """Máscara com os requisitos e todos os seus pré-requisitos (os fora da árvore são ignorados)"""
+        mascara = 0
+        for req in requisitos:
+            id_req = self.ids.get(req)
+            if id_req is not None:
+                mascara |= (1 << id_req) | self.fechamento[id_req]
+        return mascara
+
+    def fechamento_de(self, tecnologia):
+        """Máscara de pré-requisitos de uma tecnologia (compilada ou não)"""
+        if tecnologia.nome in self.compiladas:
+            return self.fechamento[self.ids[tecnologia.nome]]
+        return self.mascara_requisitos(tecnologia.requisitos)
+
+    def nomes_da_mascara(self, mascara):
+        """Converte uma máscara de volta em lista de nomes, na ordem dos IDs"""
+        nomes = []
+        while mascara:
+            menor_bit = mascara & -mascara
+            nomes.append(self.nomes[menor_bit.bit_length() - 1])
+            mascara ^= menor_bit
+        return nomes
+
+    def requisitos_faltando(self, requisitos, mascara_desbloqueadas):
+        """Lista os requisitos ainda não desbloqueados (diretos primeiro)"""
+        faltando = self.mascara_requisitos(requisitos) & ~mascara_desbloqueadas
+        if not faltando:
+            return []
+        diretos = [req for req in requisitos if self.bit(req) & faltando]
+        return diretos + [nome for nome in self.nomes_da_mascara(faltando) if nome not in diretos]
+# [file content end]
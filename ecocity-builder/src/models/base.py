@@ -2,6 +2,7 @@
 # [file content begin]
 class Recurso:
     """Classe para gerenciar os recursos da cidade"""
+    __slots__ = ('dinheiro', 'emissao_carbono', 'satisfacao_populacional')
     
     def __init__(self, dinheiro=1000, emissao_carbono=50, satisfacao=70):
         self.dinheiro = dinheiro
@@ -1,7 +1,57 @@
 # [file name]: src/models/cidade.py
 # [file content begin]
+import math
+
 from .base import Recurso
-from .construcao import Construcao, CONSTRUCOES_DISPONIVEIS
+from .construcao import Construcao, CATALOGO_CONSTRUCOES
+from .indice_construcoes import IndiceConstrucoes
+from .lista_compartilhada import ListaCompartilhada
+from .historico import HistoricoCidade
+from .tecnologia import ARVORE_TECNOLOGIAS
+from .pesquisa import AgendadorPesquisas
+
+def evoluir_populacao(populacao, satisfacao, ciclos):
+    """Aplica ``ciclos`` vezes a regra de população de atualizar_estado
+    
+    Retorna (soma da população após cada ciclo, população final).
+    - Satisfação entre 40 e 70 (inclusive): população constante, O(1).
+    - Satisfação < 40: int(p * 0.99) leva p até 100 em O(log p) passos; de
+      100 para baixo a regra é exatamente p - 1, somada como progressão.
+    - Satisfação > 70: abaixo de 100 habitantes int(p * 1.01) == p (ponto
+      fixo, O(1)); acima disso a população cresce 1% por ciclo e, como o
+      truncamento de cada ciclo não tem forma fechada, a regra é aplicada
+      passo a passo: O(ciclos), só uma multiplicação por ciclo. Levanta
+      OverflowError no mesmo ciclo que atualizar_estado (a população passa
+      do limite do float após ~71 mil ciclos a partir de 100).
+    """
+    soma = 0
+    
+    if satisfacao > 70:
+        if int(populacao * 1.01) == populacao:
+            return populacao * ciclos, populacao
+        for _ in range(ciclos):
+            populacao = int(populacao * 1.01)
+            soma += populacao
+        return soma, populacao
+    
+    if satisfacao < 40:
+        while ciclos > 0 and populacao > 100:
+            populacao = int(populacao * 0.99)
+            soma += populacao
+            ciclos -= 1
+        # p -> p - 1 até zerar; depois disso a população fica em zero
+        passos = min(ciclos, populacao)
+        soma += passos * populacao - passos * (passos + 1) // 2
+        return soma, populacao - passos
+    
+    return populacao * ciclos, populacao
+
+def _como_float(valor):
+    """float(valor), ou inf se o inteiro passar do limite do float"""
+    try:
+        return float(valor)
+    except OverflowError:
+        return math.inf
 
 class Cidade:
     def __init__(self, nome, dificuldade="Médio"):
@@ -9,13 +59,51 @@ class Cidade:
         self.dificuldade = dificuldade
         self.populacao = 100
         self.recursos = Recurso()
-        self.construcoes = []
-        self.tecnologias_desbloqueadas = []
+        self.construcoes = []  # ListaCompartilhada (cópia na escrita entre bifurcações)
+        self.indice = IndiceConstrucoes()  # agregados das construções
+        self.tecnologias_desbloqueadas = []  # nomes; também define mascara_tecnologias
         self.tempo_jogo = 0  # em ciclos
+        self.pesquisas = AgendadorPesquisas(self)
+        self.historico = None  # HistoricoCidade, só quando ligado com ativar_historico
+        self.alteracoes = None  # set de posições melhoradas, usado pelo diário de saves
         
         # Ajusta recursos baseado na dificuldade
         self._ajustar_dificuldade()
         
+    @property
+    def construcoes(self):
+        return self._construcoes
+    
+    @construcoes.setter
+    def construcoes(self, construcoes):
+        if not isinstance(construcoes, ListaCompartilhada):
+            construcoes = ListaCompartilhada(construcoes)
+        self._construcoes = construcoes
+    
+    @property
+    def tecnologias_desbloqueadas(self):
+        return self._tecnologias_desbloqueadas
+    
+    @tecnologias_desbloqueadas.setter
+    def tecnologias_desbloqueadas(self, tecnologias):
+        # Aceita nomes ou objetos Tecnologia; guarda sempre os nomes
+        self._tecnologias_desbloqueadas = [getattr(t, 'nome', t) for t in tecnologias]
+        self.mascara_tecnologias = ARVORE_TECNOLOGIAS.mascara(self._tecnologias_desbloqueadas)
+    
+    def desbloquear_tecnologia(self, nome):
+        """Marca uma tecnologia como desbloqueada (use em vez de append na lista)"""
+        if self.tecnologia_desbloqueada(nome):
+            return False
+        self._tecnologias_desbloqueadas.append(nome)
+        self.mascara_tecnologias |= ARVORE_TECNOLOGIAS.bit(nome)
+        return True
+    
+    def tecnologia_desbloqueada(self, nome):
+        bit = ARVORE_TECNOLOGIAS.bit(nome)
+        if bit:
+            return bool(self.mascara_tecnologias & bit)
+        return nome in self._tecnologias_desbloqueadas  # fora da árvore: sem bit na máscara
+        
     def _ajustar_dificuldade(self):
         """Ajusta recursos iniciais baseado na dificuldade"""
         if self.dificuldade == "Fácil":
@@ -28,31 +116,166 @@ class Cidade:
             
     def adicionar_construcao(self, construcao_nome):
         """Adiciona uma construção à cidade"""
-        construcao = next((c for c in CONSTRUCOES_DISPONIVEIS if c.nome == construcao_nome), None)
+        prototipo = CATALOGO_CONSTRUCOES.get(construcao_nome)
         
-        if not construcao:
+        if not prototipo:
             return False, "Construção não encontrada"
             
-        pode_construir, mensagem = construcao.pode_construir(self.recursos, self.tecnologias_desbloqueadas)
+        pode_construir, mensagem = prototipo.pode_construir(self.recursos, self.mascara_tecnologias)
         
         if pode_construir:
-            # Cria uma cópia da construção
-            nova_construcao = Construcao(
-                construcao.nome, 
-                construcao.tipo, 
-                construcao.custo,
-                construcao.impacto_emissao,
-                construcao.impacto_satisfacao,
-                construcao.requisitos
-            )
+            # Nova construção compartilha o protótipo do catálogo
+            nova_construcao = Construcao.de_prototipo(prototipo)
             
             self.recursos.dinheiro -= nova_construcao.custo
             self.construcoes.append(nova_construcao)
+            self.indice.registrar(nova_construcao)
             self.aplicar_beneficios_construcao(nova_construcao)
-            return True, f"{construcao.nome} construída com sucesso!"
+            return True, f"{prototipo.nome} construída com sucesso!"
         else:
             return False, mensagem
     
+    def construir_em_lote(self, pedidos):
+        """Constrói vários itens em uma única transação
+        
+        ``pedidos`` é uma lista de (nome, quantidade). Custo total e requisitos
+        de tecnologia são validados uma vez para o lote inteiro e os efeitos
+        são aplicados em uma única atualização agregada. Se qualquer pedido
+        falhar, nada é aplicado. Como todas as construções aumentam a
+        satisfação, limitar a soma uma vez dá o mesmo resultado que construir
+        uma a uma.
+        
+        Retorna (sucesso, relatorio), com um dicionário por pedido.
+        """
+        relatorio = []
+        validos = []
+        custo_total = 0
+        
+        for nome, quantidade in pedidos:
+            item = {'nome': nome, 'quantidade': quantidade, 'custo': 0, 'sucesso': False}
+            prototipo = CATALOGO_CONSTRUCOES.get(nome)
+            
+            if not prototipo:
+                item['mensagem'] = "Construção não encontrada"
+            elif quantidade <= 0:
+                item['mensagem'] = "Quantidade inválida"
+            else:
+                if prototipo.mascara_requisitos & ~self.mascara_tecnologias:
+                    faltando = ARVORE_TECNOLOGIAS.requisitos_faltando(prototipo.requisitos, self.mascara_tecnologias)
+                    item['mensagem'] = f"Tecnologia {faltando[0]} necessária"
+                else:
+                    item['custo'] = prototipo.custo * quantidade
+                    item['sucesso'] = True
+                    item['mensagem'] = f"{quantidade}x {nome} construída(s) com sucesso!"
+                    custo_total += item['custo']
+                    validos.append((prototipo, quantidade))
+            relatorio.append(item)
+        
+        erro = None
+        if len(validos) < len(relatorio):
+            erro = "Cancelado: outro pedido do lote falhou"
+        elif not self.recursos.verificar_recursos_suficientes(custo_total):
+            erro = f"Recursos insuficientes para o lote (${custo_total})"
+        
+        if erro is None:
+            try:
+                self._aplicar_lote(validos, custo_total)
+            except Exception as e:
+                erro = f"Erro ao construir lote: {e}"
+        
+        if erro is not None:
+            for item in relatorio:
+                if item['sucesso']:
+                    item['sucesso'] = False
+                    item['mensagem'] = erro
+            return False, relatorio
+        
+        return True, relatorio
+    
+    def _aplicar_lote(self, validos, custo_total):
+        """Aplica um lote já validado; desfaz tudo se algo der errado"""
+        estado_anterior = (self.recursos.dinheiro, self.recursos.emissao_carbono,
+                           self.recursos.satisfacao_populacional, len(self.construcoes))
+        try:
+            impacto_emissao = 0
+            impacto_satisfacao = 0
+            for prototipo, quantidade in validos:
+                novas = [Construcao.de_prototipo(prototipo) for _ in range(quantidade)]
+                self.construcoes.extend(novas)
+                self.indice.registrar_lote(prototipo, novas)
+                impacto_emissao += prototipo.impacto_emissao * quantidade
+                impacto_satisfacao += prototipo.impacto_satisfacao * quantidade
+            
+            self.recursos.dinheiro -= custo_total
+            self.recursos.emissao_carbono += impacto_emissao
+            self.recursos.satisfacao_populacional = max(0, min(100, self.recursos.satisfacao_populacional + impacto_satisfacao))
+        except Exception:
+            (self.recursos.dinheiro, self.recursos.emissao_carbono,
+             self.recursos.satisfacao_populacional, total_anterior) = estado_anterior
+            del self.construcoes[total_anterior:]
+            self.reconstruir_indice()
+            raise
+    
+    def melhorar_construcao(self, posicao):
+        """Melhora a construção na posição dada
+        
+        Use em vez de construcoes[i].melhorar(): se a construção ainda for
+        compartilhada com uma bifurcação, ela é copiada antes de mudar.
+        """
+        if not 0 <= posicao < len(self.construcoes):
+            return False, "Construção não encontrada"
+        
+        construcao = self.construcoes.para_escrita(posicao, self._copiar_construcao)
+        construcao.indice = self.indice
+        if construcao.melhorar():
+            if self.alteracoes is not None:
+                self.alteracoes.add(posicao)
+            return True, f"{construcao.nome} melhorada para o nível {construcao.nivel}"
+        return False, "Nível máximo atingido"
+    
+    def _copiar_construcao(self, construcao):
+        copia = Construcao.de_prototipo(construcao.prototipo)
+        copia.nivel = construcao.nivel
+        return copia
+    
+    def bifurcar(self):
+        """Cópia barata da cidade para previsões ("e se eu construir isto?")
+        
+        As construções são compartilhadas com cópia na escrita; índice,
+        recursos, tecnologias e pesquisas têm tamanho limitado pelo catálogo.
+        Assim bifurcar é O(1) no número de construções, e a cópia pode
+        construir, pesquisar e avançar ciclos sem alterar a original.
+        """
+        copia = Cidade.__new__(Cidade)
+        copia.nome = self.nome
+        copia.dificuldade = self.dificuldade
+        copia.populacao = self.populacao
+        copia.recursos = Recurso(self.recursos.dinheiro, self.recursos.emissao_carbono,
+                                 self.recursos.satisfacao_populacional)
+        copia.construcoes = self.construcoes.bifurcar()
+        copia.indice = self.indice.copiar()
+        copia._tecnologias_desbloqueadas = list(self._tecnologias_desbloqueadas)
+        copia.mascara_tecnologias = self.mascara_tecnologias
+        copia.tempo_jogo = self.tempo_jogo
+        copia.pesquisas = self.pesquisas.copiar(copia)
+        copia.historico = None  # previsões não gravam histórico
+        copia.alteracoes = None
+        return copia
+    
+    def ativar_historico(self, **kwargs):
+        """Passa a gravar as métricas de cada ciclo (para o painel de estatísticas)
+        
+        Desligado por padrão: os buffers ocupam alguns MB e simulações,
+        planejamento e previsões não precisam deles.
+        """
+        if self.historico is None:
+            self.historico = HistoricoCidade(**kwargs)
+        return self.historico
+    
+    def reconstruir_indice(self):
+        """Recalcula os agregados após substituir a lista de construções"""
+        self.indice = IndiceConstrucoes.a_partir_de(self.construcoes)
+        
     def aplicar_beneficios_construcao(self, construcao):
         """Aplica os benefícios de uma construção aos recursos"""
         self.recursos.emissao_carbono += construcao.impacto_emissao
@@ -73,12 +296,59 @@ class Cidade:
             
         # Geração de renda baseada em construções e população
         renda_base = self.populacao * 0.5
-        renda_construcoes = len(self.construcoes) * 25
+        renda_construcoes = self.indice.total * 25
         self.recursos.dinheiro += renda_base + renda_construcoes
         
         # Emissões base aumentam com população
         self.recursos.emissao_carbono += self.populacao * 0.01
         
+        # Pesquisas concluídas neste ciclo
+        self.pesquisas.atualizar()
+        
+        if self.historico is not None:
+            self.historico.registrar(self)
+        
+    def avancar_ciclos(self, ciclos):
+        """Avança vários ciclos de uma vez, sem chamar atualizar_estado a cada ciclo
+        
+        Entre ações do jogador a satisfação não muda, então cada trecho entre
+        conclusões de pesquisa fica no mesmo regime de crescimento. População
+        e tempo de jogo são idênticos aos de ``ciclos`` chamadas a
+        atualizar_estado; renda e emissão são calculadas pela soma da
+        população, podendo diferir apenas no arredondamento de ponto
+        flutuante. Com satisfação acima de 70 o custo é O(ciclos) (ver
+        evoluir_populacao); nos demais regimes, O(1) ou O(log população)
+        por trecho. Enquanto houver pesquisa na fila esperando dinheiro para
+        começar, os ciclos são avançados um a um. O histórico recebe um ponto
+        por trecho avançado (a série tempo_jogo indica o ciclo de cada ponto;
+        os agregados do histórico são por faixa de ciclos, não de pontos).
+        """
+        while ciclos > 0:
+            if self.pesquisas.aguardando_inicio():
+                self.atualizar_estado()
+                ciclos -= 1
+                continue
+            
+            proxima = self.pesquisas.proxima_conclusao()
+            passo = ciclos if proxima is None else min(ciclos, proxima - self.tempo_jogo)
+            self._avancar_trecho(passo)
+            ciclos -= passo
+            self.pesquisas.atualizar()
+            if self.historico is not None:
+                self.historico.registrar(self)
+        
+    def _avancar_trecho(self, ciclos):
+        """Avança ``ciclos`` ciclos em forma fechada (sem pesquisas terminando no meio)"""
+        soma_populacao, self.populacao = evoluir_populacao(
+            self.populacao, self.recursos.satisfacao_populacional, ciclos
+        )
+        self.tempo_jogo += ciclos
+        
+        # A soma passa do limite do float antes da população; ciclo a ciclo o total iria a inf
+        soma_populacao = _como_float(soma_populacao)
+        self.recursos.dinheiro += soma_populacao * 0.5 + self.indice.total * 25 * ciclos
+        self.recursos.emissao_carbono += soma_populacao * 0.01
+        
     def get_estatisticas(self):
         """Retorna estatísticas da cidade"""
         return {
@@ -86,12 +356,12 @@ class Cidade:
             'dificuldade': self.dificuldade,
             'populacao': self.populacao,
             'tempo_jogo': self.tempo_jogo,
-            'total_construcoes': len(self.construcoes),
+            'total_construcoes': self.indice.total,
             'recursos': self.recursos.to_dict()
         }
         
     def __str__(self):
         stats = self.get_estatisticas()
         return (f"🏙️ {self.nome} | 👥 {self.populacao} | "
-                f"⏱️ {self.tempo_jogo}c | 🏗️ {len(self.construcoes)} construções")
+                f"⏱️ {self.tempo_jogo}c | 🏗️ {self.indice.total} construções")
 # [file content end]
\ No newline at end of file
@@ -1,6 +1,7 @@
 # [file name]: src/models/construcao.py
 # [file content begin]
 from enum import Enum
+from .tecnologia import ARVORE_TECNOLOGIAS
 
 class TipoConstrucao(Enum):
     ENERGIA = "Energia Limpa"
@@ -8,34 +9,155 @@ class TipoConstrucao(Enum):
     AMBIENTAL = "Proteção Ambiental"
     SOCIAL = "Infraestrutura Social"
 
-class Construcao:
-    def __init__(self, nome, tipo, custo, impacto_emissao, impacto_satisfacao, requisitos=None):
-        self.nome = nome
-        self.tipo = tipo
-        self.custo = custo
-        self.impacto_emissao = impacto_emissao  # Negativo = reduz emissão
-        self.impacto_satisfacao = impacto_satisfacao  # Positivo = aumenta satisfação
-        self.nivel = 1
-        self.requisitos = requisitos or []
+NIVEL_MAXIMO = 3
+
+# Protótipos de construções fora do catálogo, por (nome, tipo, nível, custo, emissão, satisfação)
+_PROTOTIPOS_DE_NIVEL = {}
+
+def _proximo_nivel(custo, impacto_emissao, impacto_satisfacao):
+    return int(custo * 1.5), impacto_emissao * 1.3, impacto_satisfacao * 1.2
+
+class PrototipoConstrucao:
+    """Dados imutáveis de um tipo de construção, compartilhados por todas as instâncias
+    
+    Os valores de cada nível são pré-calculados aplicando as mesmas regras de
+    melhoria (custo x1.5, emissão x1.3, satisfação x1.2), então uma construção
+    colocada só precisa guardar seu nível.
+    """
+    __slots__ = ('nome', 'tipo', 'custo', 'impacto_emissao', 'impacto_satisfacao', 'requisitos',
+                 'mascara_requisitos', 'niveis')
+    
+    def __init__(self, nome, tipo, custo, impacto_emissao, impacto_satisfacao, requisitos=None, niveis=None):
+        ARVORE_TECNOLOGIAS.registrar_folhas(requisitos or ())  # requisitos que não são pesquisáveis
+        if niveis is None:
+            niveis = [(custo, impacto_emissao, impacto_satisfacao)]
+            for _ in range(NIVEL_MAXIMO - 1):
+                niveis.append(_proximo_nivel(*niveis[-1]))
+        else:
+            custo, impacto_emissao, impacto_satisfacao = niveis[0]
         
-    def pode_construir(self, recursos, tecnologias_desbloqueadas=[]):
-        """Verifica se pode construir baseado em recursos e tecnologias"""
-        if not recursos.verificar_recursos_suficientes(self.custo):
+        for atributo, valor in (('nome', nome), ('tipo', tipo), ('custo', custo),
+                                ('impacto_emissao', impacto_emissao),
+                                ('impacto_satisfacao', impacto_satisfacao),
+                                ('requisitos', tuple(requisitos or ())),
+                                ('mascara_requisitos', ARVORE_TECNOLOGIAS.mascara_requisitos(requisitos or ())),
+                                ('niveis', tuple(niveis))):
+            object.__setattr__(self, atributo, valor)
+    
+    @classmethod
+    def de_nivel(cls, nome, tipo, nivel, custo, impacto_emissao, impacto_satisfacao):
+        """Protótipo cujo nível ``nivel`` tem exatamente os valores dados
+        
+        Usado para construções fora do catálogo, salvas com os valores do
+        nível atual: os níveis acima seguem as regras de melhoria e os de
+        baixo as desfazem (o custo, truncado a cada nível, fica aproximado).
+        Registros iguais compartilham o mesmo protótipo.
+        """
+        chave = (nome, tipo, nivel, custo, impacto_emissao, impacto_satisfacao)
+        prototipo = _PROTOTIPOS_DE_NIVEL.get(chave)
+        if prototipo is None:
+            prototipo = _PROTOTIPOS_DE_NIVEL[chave] = cls._criar_de_nivel(*chave)
+        return prototipo
+    
+    @classmethod
+    def _criar_de_nivel(cls, nome, tipo, nivel, custo, impacto_emissao, impacto_satisfacao):
+        niveis = [(custo, impacto_emissao, impacto_satisfacao)]
+        for _ in range(nivel - 1):
+            custo_nivel, emissao_nivel, satisfacao_nivel = niveis[0]
+            niveis.insert(0, (round(custo_nivel / 1.5), emissao_nivel / 1.3, satisfacao_nivel / 1.2))
+        while len(niveis) < NIVEL_MAXIMO:
+            niveis.append(_proximo_nivel(*niveis[-1]))
+        return cls(nome, tipo, *niveis[0], niveis=niveis)
+    
+    def __setattr__(self, atributo, valor):
+        raise AttributeError("PrototipoConstrucao é imutável")
+    
+    def __reduce__(self):
+        # Protótipos do catálogo voltam pelo nome, preservando o compartilhamento
+        if CATALOGO_CONSTRUCOES.get(self.nome) is self:
+            return (obter_prototipo, (self.nome,))
+        return (PrototipoConstrucao, (self.nome, self.tipo, self.custo, self.impacto_emissao,
+                                      self.impacto_satisfacao, self.requisitos, self.niveis))
+    
+    def pode_construir(self, recursos, tecnologias_desbloqueadas=[], custo=None):
+        """Verifica se pode construir baseado em recursos e tecnologias
+        
+        ``tecnologias_desbloqueadas`` pode ser a lista de nomes ou a máscara
+        de bits da cidade (Cidade.mascara_tecnologias).
+        """
+        if not recursos.verificar_recursos_suficientes(self.custo if custo is None else custo):
             return False, "Recursos insuficientes"
+        
+        if isinstance(tecnologias_desbloqueadas, int):
+            if self.mascara_requisitos & ~tecnologias_desbloqueadas:
+                faltando = ARVORE_TECNOLOGIAS.requisitos_faltando(self.requisitos, tecnologias_desbloqueadas)
+                return False, f"Tecnologia {faltando[0]} necessária"
+            return True, "Pode construir"
             
         for req in self.requisitos:
             if req not in tecnologias_desbloqueadas:
                 return False, f"Tecnologia {req} necessária"
                 
         return True, "Pode construir"
+
+class Construcao:
+    """Construção colocada na cidade: guarda apenas o nível e o protótipo compartilhado"""
+    __slots__ = ('prototipo', 'nivel', 'indice')
+    
+    def __init__(self, nome, tipo, custo, impacto_emissao, impacto_satisfacao, requisitos=None):
+        self.prototipo = PrototipoConstrucao(nome, tipo, custo, impacto_emissao, impacto_satisfacao, requisitos)
+        self.nivel = 1
+        self.indice = None  # IndiceConstrucoes da cidade, se houver
+    
+    @classmethod
+    def de_prototipo(cls, prototipo):
+        """Cria uma construção que compartilha o protótipo do catálogo"""
+        construcao = cls.__new__(cls)
+        construcao.prototipo = prototipo
+        construcao.nivel = 1
+        construcao.indice = None
+        return construcao
+    
+    @property
+    def nome(self):
+        return self.prototipo.nome
+    
+    @property
+    def tipo(self):
+        return self.prototipo.tipo
+    
+    @property
+    def requisitos(self):
+        return self.prototipo.requisitos
+    
+    @property
+    def custo(self):
+        return self.prototipo.niveis[self.nivel - 1][0]
+    
+    @property
+    def impacto_emissao(self):
+        return self.prototipo.niveis[self.nivel - 1][1]  # Negativo = reduz emissão
+    
+    @property
+    def impacto_satisfacao(self):
+        return self.prototipo.niveis[self.nivel - 1][2]  # Positivo = aumenta satisfação
+        
+    def pode_construir(self, recursos, tecnologias_desbloqueadas=[]):
+        """Verifica se pode construir baseado em recursos e tecnologias"""
+        return self.prototipo.pode_construir(recursos, tecnologias_desbloqueadas, self.custo)
         
     def melhorar(self):
         """Melhora a construção para o próximo nível"""
-        if self.nivel < 3:  # Máximo 3 níveis
+        if self.nivel < NIVEL_MAXIMO:
+            nivel_anterior = self.nivel
+            emissao_anterior = self.impacto_emissao
+            satisfacao_anterior = self.impacto_satisfacao
+            
+            # Custo x1.5, emissão x1.3 e satisfação x1.2 vêm da tabela do protótipo
             self.nivel += 1
-            self.custo = int(self.custo * 1.5)
-            self.impacto_emissao *= 1.3  # 30% mais eficiente
-            self.impacto_satisfacao *= 1.2  # 20% mais satisfação
+            
+            if self.indice is not None:
+                self.indice.registrar_melhoria(self, nivel_anterior, emissao_anterior, satisfacao_anterior)
             return True
         return False
         
@@ -62,4 +184,11 @@ CONSTRUCOES_DISPONIVEIS = [
     Construcao("Ciclovia", TipoConstrucao.TRANSPORTE, 150, -4, 4),
     Construcao("Transporte Elétrico", TipoConstrucao.TRANSPORTE, 600, -15, 6, ["Eletrificação"]),
 ]
+
+# Catálogo indexado por nome, com os protótipos compartilhados
+CATALOGO_CONSTRUCOES = {construcao.nome: construcao.prototipo for construcao in CONSTRUCOES_DISPONIVEIS}
+
+def obter_prototipo(nome):
+    """Retorna o protótipo do catálogo com esse nome, ou None"""
+    return CATALOGO_CONSTRUCOES.get(nome)
 # [file content end]
\ No newline at end of file
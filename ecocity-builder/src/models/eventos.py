@@ -1,5 +1,7 @@
 # [file name]: src/models/evento.py
 # [file content begin]
+import heapq
+import math
 import random
 from enum import Enum
 from datetime import datetime
@@ -12,13 +14,60 @@ class TipoEvento(Enum):
     GEADA = "Geada"
     INCENDIO_FLORESTAL = "Incêndio Florestal"
 
+# Impacto de cada tipo de evento com intensidade 1.0: (dinheiro, satisfacao, emissao)
+EFEITOS_EVENTOS = {
+    TipoEvento.SECA: (-100, -15, 5),
+    TipoEvento.INUNDACAO: (-200, -20, 10),
+    TipoEvento.TEMPESTADE: (-150, -10, 8),
+    TipoEvento.ONDA_CALOR: (-80, -12, 15),
+    TipoEvento.GEADA: (-120, -8, 3),
+    TipoEvento.INCENDIO_FLORESTAL: (-300, -25, 50),
+}
+
+DESCRICOES_EVENTOS = {
+    TipoEvento.SECA: "Baixa umidade e falta de água afetam a população",
+    TipoEvento.INUNDACAO: "Chuvas intensas causam inundações",
+    TipoEvento.TEMPESTADE: "Tempestade com ventos fortes e raios",
+    TipoEvento.ONDA_CALOR: "Temperaturas extremamente altas",
+    TipoEvento.GEADA: "Temperaturas congelantes afetam a cidade",
+    TipoEvento.INCENDIO_FLORESTAL: "Incêndio florestal se aproxima da cidade",
+}
+
+def somar_efeitos(eventos):
+    """Soma os vetores de efeito de vários eventos
+
+    As intensidades são acumuladas por tipo e multiplicadas pela tabela uma
+    vez por tipo, então o custo por evento é só uma soma.
+    """
+    intensidade_por_tipo = {}
+    for evento in eventos:
+        intensidade_por_tipo[evento.tipo] = intensidade_por_tipo.get(evento.tipo, 0) + evento.intensidade
+    
+    dinheiro = satisfacao = emissao = 0
+    for tipo, intensidade in intensidade_por_tipo.items():
+        efeito = EFEITOS_EVENTOS[tipo]
+        dinheiro += efeito[0] * intensidade
+        satisfacao += efeito[1] * intensidade
+        emissao += efeito[2] * intensidade
+    return (dinheiro, satisfacao, emissao)
+
+def aplicar_efeitos(recursos, vetor):
+    """Aplica um vetor (dinheiro, satisfacao, emissao) aos recursos, respeitando os limites"""
+    dinheiro, satisfacao, emissao = vetor
+    recursos.dinheiro = max(0, recursos.dinheiro + dinheiro)
+    recursos.satisfacao_populacional = max(0, min(100, recursos.satisfacao_populacional + satisfacao))
+    recursos.emissao_carbono += emissao
+
 class EventoClimatico:
-    def __init__(self, tipo, intensidade=1.0):
+    __slots__ = ('tipo', 'intensidade', 'ativo', 'tempo_inicio', 'duracao', 'tempo_restante',
+                 'resolvido', 'efeitos')
+    
+    def __init__(self, tipo, intensidade=1.0, rng=None):
         self.tipo = tipo
         self.intensidade = intensidade  # 1.0 = normal, 1.5 = forte, etc.
         self.ativo = False
         self.tempo_inicio = None
-        self.duracao = random.randint(20, 60)  # segundos
+        self.duracao = (rng or random).randint(20, 60)  # segundos
         self.tempo_restante = self.duracao
         self.resolvido = False
         
@@ -26,49 +75,19 @@ class EventoClimatico:
         self.configurar_efeitos()
     
     def configurar_efeitos(self):
-        """Configura os efeitos do evento baseado no tipo"""
-        if self.tipo == TipoEvento.SECA:
-            self.efeitos = {
-                'dinheiro': -100 * self.intensidade,
-                'satisfacao': -15 * self.intensidade,
-                'emissao': 5 * self.intensidade,
-                'descricao': "Baixa umidade e falta de água afetam a população"
-            }
-        elif self.tipo == TipoEvento.INUNDACAO:
-            self.efeitos = {
-                'dinheiro': -200 * self.intensidade,
-                'satisfacao': -20 * self.intensidade,
-                'emissao': 10 * self.intensidade,
-                'descricao': "Chuvas intensas causam inundações"
-            }
-        elif self.tipo == TipoEvento.TEMPESTADE:
-            self.efeitos = {
-                'dinheiro': -150 * self.intensidade,
-                'satisfacao': -10 * self.intensidade,
-                'emissao': 8 * self.intensidade,
-                'descricao': "Tempestade com ventos fortes e raios"
-            }
-        elif self.tipo == TipoEvento.ONDA_CALOR:
-            self.efeitos = {
-                'dinheiro': -80 * self.intensidade,
-                'satisfacao': -12 * self.intensidade,
-                'emissao': 15 * self.intensidade,
-                'descricao': "Temperaturas extremamente altas"
-            }
-        elif self.tipo == TipoEvento.GEADA:
-            self.efeitos = {
-                'dinheiro': -120 * self.intensidade,
-                'satisfacao': -8 * self.intensidade,
-                'emissao': 3 * self.intensidade,
-                'descricao': "Temperaturas congelantes afetam a cidade"
-            }
-        elif self.tipo == TipoEvento.INCENDIO_FLORESTAL:
-            self.efeitos = {
-                'dinheiro': -300 * self.intensidade,
-                'satisfacao': -25 * self.intensidade,
-                'emissao': 50 * self.intensidade,
-                'descricao': "Incêndio florestal se aproxima da cidade"
-            }
+        """Configura os efeitos do evento a partir da tabela EFEITOS_EVENTOS"""
+        dinheiro, satisfacao, emissao = self.vetor_efeitos()
+        self.efeitos = {
+            'dinheiro': dinheiro,
+            'satisfacao': satisfacao,
+            'emissao': emissao,
+            'descricao': DESCRICOES_EVENTOS[self.tipo]
+        }
+    
+    def vetor_efeitos(self):
+        """Impacto do evento como vetor (dinheiro, satisfacao, emissao)"""
+        dinheiro, satisfacao, emissao = EFEITOS_EVENTOS[self.tipo]
+        return (dinheiro * self.intensidade, satisfacao * self.intensidade, emissao * self.intensidade)
     
     def ativar(self, cidade):
         """Ativa o evento na cidade"""
@@ -77,13 +96,7 @@ class EventoClimatico:
         self.tempo_restante = self.duracao
         
         # Aplicar efeitos iniciais
-        cidade.recursos.dinheiro += self.efeitos['dinheiro']
-        cidade.recursos.satisfacao_populacional += self.efeitos['satisfacao']
-        cidade.recursos.emissao_carbono += self.efeitos['emissao']
-        
-        # Garantir limites
-        cidade.recursos.satisfacao_populacional = max(0, min(100, cidade.recursos.satisfacao_populacional))
-        cidade.recursos.dinheiro = max(0, cidade.recursos.dinheiro)
+        aplicar_efeitos(cidade.recursos, self.vetor_efeitos())
         
         return f"🌪️ EVENTO: {self.tipo.value} - {self.efeitos['descricao']}"
     
@@ -109,34 +122,77 @@ class EventoClimatico:
         return None
 
 class GerenteEventos:
-    def __init__(self):
+    """Sorteia eventos climáticos com horário pré-amostrado
+
+    Em vez de sortear a cada chamada, o instante do próximo evento é
+    amostrado de uma distribuição geométrica (probabilidade por unidade de
+    tempo, 1 ciclo) e cada verificação é só uma comparação. A taxa de eventos
+    não depende de quantas vezes verificar_evento é chamado (por quadro ou
+    por ciclo). Quando a faixa de emissão muda, o instante é sorteado de novo;
+    como a distribuição não tem memória, isso mantém as taxas corretas.
+
+    Vários eventos podem estar ativos ao mesmo tempo: os agendados com
+    agendar_evento são ativados em atualizar, que soma os vetores de efeito
+    de todos os que começam no ciclo e aplica uma única atualização aos
+    recursos. Os ativos ficam em um min-heap pelo instante de término.
+    """
+    
+    # Multiplicador da probabilidade por faixa de emissão (até 70, até 100, acima)
+    MULTIPLICADORES_EMISSAO = (1, 2, 3)
+    
+    def __init__(self, semente=None):
         self.evento_atual = None
-        self.probabilidade_base = 0.01  # 1% de chance por atualização
+        self.probabilidade_base = 0.01  # 1% de chance por unidade de tempo
         self.tempo_ultimo_evento = 0
         self.tempo_entre_eventos = 120  # segundos mínimos entre eventos
+        self.rng = random.Random(semente)
+        self.proximo_evento = None  # instante sorteado do próximo evento
+        self.faixa_emissao = None
+        self.max_eventos_ativos = 1  # limite para eventos sorteados (agendados não têm limite)
+        self.relogio = 0
+        self.pendentes = []
+        self.ativos = []  # heap de (instante_termino, ordem, evento)
+        self._ordem = 0
+    
+    @staticmethod
+    def calcular_faixa_emissao(emissao):
+        """Faixa de emissão usada para escolher a probabilidade"""
+        if emissao > 100:
+            return 2
+        if emissao > 70:
+            return 1
+        return 0
+    
+    def sortear_proximo_evento(self, tempo_decorrido, faixa):
+        """Amostra o instante do próximo evento a partir de agora"""
+        self.faixa_emissao = faixa
+        probabilidade = min(1.0, self.probabilidade_base * self.MULTIPLICADORES_EMISSAO[faixa])
+        inicio = max(tempo_decorrido, self.tempo_ultimo_evento + self.tempo_entre_eventos)
+        
+        # Falhas antes do primeiro sucesso ~ Geométrica(p), por inversão
+        if probabilidade >= 1.0:
+            falhas = 0
+        else:
+            falhas = int(math.log1p(-self.rng.random()) / math.log1p(-probabilidade))
+        self.proximo_evento = inicio + falhas
+        return self.proximo_evento
     
     def verificar_evento(self, cidade, tempo_decorrido):
         """Verifica se deve ocorrer um evento"""
-        if self.evento_atual and self.evento_atual.ativo:
-            return None
-        
-        # Verificar tempo mínimo entre eventos
-        if tempo_decorrido - self.tempo_ultimo_evento < self.tempo_entre_eventos:
+        # Sorteados e agendados contam juntos; o limite vale para quantos estão ativos ou por ativar
+        if self.quantidade_eventos_ativos() >= self.max_eventos_ativos:
             return None
         
-        # Aumentar probabilidade baseado em emissões
-        probabilidade = self.probabilidade_base
-        if cidade.recursos.emissao_carbono > 70:
-            probabilidade *= 2
-        elif cidade.recursos.emissao_carbono > 100:
-            probabilidade *= 3
+        faixa = self.calcular_faixa_emissao(cidade.recursos.emissao_carbono)
+        if self.proximo_evento is None or faixa != self.faixa_emissao:
+            self.sortear_proximo_evento(tempo_decorrido, faixa)
         
-        # Verificar ocorrência
-        if random.random() < probabilidade:
-            self.tempo_ultimo_evento = tempo_decorrido
-            return self.gerar_evento_aleatorio(cidade)
+        if tempo_decorrido < self.proximo_evento:
+            return None
         
-        return None
+        self.tempo_ultimo_evento = tempo_decorrido
+        self.proximo_evento = None
+        return self.gerar_evento_aleatorio(cidade)
     
     def gerar_evento_aleatorio(self, cidade):
         """Gera um evento climático aleatório"""
@@ -146,7 +202,7 @@ class GerenteEventos:
         else:
             tipos = list(TipoEvento)
         
-        tipo = random.choice(tipos)
+        tipo = self.rng.choice(tipos)
         
         # Intensidade baseada em emissões
         intensidade = 1.0
@@ -155,7 +211,7 @@ class GerenteEventos:
         if cidade.recursos.emissao_carbono > 90:
             intensidade = 1.5
         
-        self.evento_atual = EventoClimatico(tipo, intensidade)
+        self.evento_atual = EventoClimatico(tipo, intensidade, self.rng)
         return self.evento_atual
     
     def get_evento_atual(self):
@@ -163,4 +219,53 @@ class GerenteEventos:
         if self.evento_atual and self.evento_atual.ativo:
             return self.evento_atual
         return None
+    
+    def quantidade_eventos_ativos(self):
+        """Eventos ativos ou por ativar, incluindo o evento_atual ativado com EventoClimatico.ativar"""
+        quantidade = len(self.ativos) + len(self.pendentes)
+        atual = self.get_evento_atual()
+        if atual is not None and all(evento is not atual for _, _, evento in self.ativos):
+            quantidade += 1
+        return quantidade
+    
+    def agendar_evento(self, evento):
+        """Agenda um evento para ser ativado na próxima chamada de atualizar"""
+        self.pendentes.append(evento)
+    
+    def atualizar(self, cidade, delta_time):
+        """Avança o relógio, encerra os eventos vencidos e ativa os agendados
+
+        Retorna (ativados, finalizados).
+        """
+        self.relogio += delta_time
+        
+        finalizados = []
+        while self.ativos and self.ativos[0][0] <= self.relogio:
+            _, _, evento = heapq.heappop(self.ativos)
+            evento.tempo_restante = 0
+            evento.resolvido = True
+            evento.ativo = False
+            finalizados.append(evento)
+        
+        ativados = self.pendentes
+        self.pendentes = []
+        if ativados:
+            inicio = datetime.now()
+            for evento in ativados:
+                evento.ativo = True
+                evento.tempo_inicio = inicio
+                evento.tempo_restante = evento.duracao
+                heapq.heappush(self.ativos, (self.relogio + evento.duracao, self._ordem, evento))
+                self._ordem += 1
+            aplicar_efeitos(cidade.recursos, somar_efeitos(ativados))
+        
+        return ativados, finalizados
+    
+    def get_eventos_ativos(self):
+        """Eventos ativos (agendados), com o tempo restante atualizado"""
+        eventos = []
+        for termino, _, evento in sorted(self.ativos):
+            evento.tempo_restante = termino - self.relogio
+            eventos.append(evento)
+        return eventos
 # [file content end]
\ No newline at end of file
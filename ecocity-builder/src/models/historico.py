@@ -0,0 +1,241 @@
+# [file name]: src/models/historico.py
+# [file content begin]
+from array import array
+from bisect import bisect_right
+
+class SerieCircular:
+    """Série temporal de capacidade fixa sobre um ``array``
+
+    Cada valor é gravado duas vezes, na posição ``p`` e em ``p + capacidade``.
+    Assim os últimos ``n`` valores estão sempre contíguos no array e podem
+    ser lidos como um ``memoryview``, sem cópia e sem juntar dois pedaços.
+    A memória fica limitada a 2 x capacidade valores.
+    """
+    __slots__ = ('capacidade', 'dados', 'posicao', 'tamanho', 'total')
+
+    def __init__(self, capacidade, tipo='d'):
+        self.capacidade = capacidade
+        self.dados = array(tipo, [0]) * (2 * capacidade)
+        self.posicao = 0  # próxima escrita, em [0, capacidade)
+        self.tamanho = 0  # valores guardados (até a capacidade)
+        self.total = 0  # valores já recebidos
+
+    def adicionar(self, valor):
+        posicao = self.posicao
+        self.dados[posicao] = valor
+        self.dados[posicao + self.capacidade] = valor
+        self.posicao = posicao + 1 if posicao + 1 < self.capacidade else 0
+        if self.tamanho < self.capacidade:
+            self.tamanho += 1
+        self.total += 1
+
+    def ultimos(self, n=None):
+        """Os ``n`` valores mais recentes (todos, se None), do mais antigo ao mais novo"""
+        n = self.tamanho if n is None else max(0, min(n, self.tamanho))
+        fim = self.posicao + self.capacidade
+        return memoryview(self.dados)[fim - n:fim]
+
+    def ultimo(self):
+        return self.dados[self.posicao + self.capacidade - 1] if self.tamanho else None
+
+    def __len__(self):
+        return self.tamanho
+
+class NivelAgregado:
+    """Mínimo, máximo e média dos valores de cada bloco de ``resolucao`` ciclos
+
+    O bloco ``b`` cobre os ciclos ``b * resolucao + 1`` a ``(b + 1) * resolucao``
+    e é fechado ao receber seu último ciclo ou um valor de um bloco
+    seguinte; depois de um salto (Cidade.avancar_ciclos) um bloco pode ter
+    menos valores, ou nenhum, mas nunca cobre mais ciclos que a resolução.
+    Os níveis formam uma cascata: cada bloco fechado é repassado ao nível
+    seguinte como um valor no último ciclo do bloco, então o custo por valor
+    recebido é constante, não importa quantos níveis existam.
+    """
+    __slots__ = ('resolucao', 'minimo', 'maximo', 'media', 'proximo',
+                 '_bloco', '_minimo', '_maximo', '_soma', '_contagem')
+
+    def __init__(self, resolucao, capacidade, proximo=None):
+        self.resolucao = resolucao
+        self.minimo = SerieCircular(capacidade)
+        self.maximo = SerieCircular(capacidade)
+        self.media = SerieCircular(capacidade)
+        self.proximo = proximo
+        self._bloco = None
+        self._minimo = self._maximo = self._soma = 0
+        self._contagem = 0
+
+    def adicionar(self, tempo, minimo, maximo, media):
+        bloco = (tempo - 1) // self.resolucao
+        if self._contagem and bloco != self._bloco:
+            self._fechar()
+
+        if self._contagem == 0:
+            self._bloco = bloco
+            self._minimo, self._maximo, self._soma = minimo, maximo, media
+        else:
+            if minimo < self._minimo:
+                self._minimo = minimo
+            if maximo > self._maximo:
+                self._maximo = maximo
+            self._soma += media
+        self._contagem += 1
+
+        if tempo >= (bloco + 1) * self.resolucao:
+            self._fechar()
+
+    def _fechar(self):
+        media = self._soma / self._contagem
+        self.minimo.adicionar(self._minimo)
+        self.maximo.adicionar(self._maximo)
+        self.media.adicionar(media)
+        self._contagem = 0
+        if self.proximo is not None:
+            self.proximo.adicionar((self._bloco + 1) * self.resolucao, self._minimo, self._maximo, media)
+
+    def __len__(self):
+        return self.media.tamanho
+
+def reduzir_lttb(xs, ys, limite):
+    """Largest-Triangle-Three-Buckets: escolhe até ``limite`` pontos preservando a forma
+
+    O primeiro e o último ponto são mantidos; de cada balde intermediário
+    fica o ponto que forma o maior triângulo com o escolhido no balde
+    anterior e a média do balde seguinte. Retorna (xs, ys) como listas.
+    """
+    n = len(ys)
+    if limite >= n or limite < 3:
+        return list(xs), list(ys)
+
+    saida_x = [xs[0]]
+    saida_y = [ys[0]]
+    tamanho_balde = (n - 2) / (limite - 2)
+    anterior = 0
+
+    for i in range(limite - 2):
+        inicio = int(i * tamanho_balde) + 1
+        fim = int((i + 1) * tamanho_balde) + 1
+
+        # Média do balde seguinte (no último balde, o último ponto)
+        fim_seguinte = min(int((i + 2) * tamanho_balde) + 1, n)
+        quantidade = fim_seguinte - fim
+        media_x = sum(xs[fim:fim_seguinte]) / quantidade
+        media_y = sum(ys[fim:fim_seguinte]) / quantidade
+
+        ax, ay = xs[anterior], ys[anterior]
+        maior_area = -1
+        escolhido = inicio
+        for j in range(inicio, fim):
+            area = abs((ax - media_x) * (ys[j] - ay) - (ax - xs[j]) * (media_y - ay))
+            if area > maior_area:
+                maior_area = area
+                escolhido = j
+
+        saida_x.append(xs[escolhido])
+        saida_y.append(ys[escolhido])
+        anterior = escolhido
+
+    saida_x.append(xs[n - 1])
+    saida_y.append(ys[n - 1])
+    return saida_x, saida_y
+
+class HistoricoCidade:
+    """Histórico por ciclo das métricas de uma cidade, com memória limitada
+
+    Além dos valores brutos, cada série mantém agregados (mínimo, máximo e
+    média) em blocos de 10, 100 e 1000 ciclos, atualizados à medida que os
+    dados chegam. Os blocos são contados em ciclos de jogo, não em pontos:
+    um salto de avancar_ciclos grava um ponto só, e os blocos que ele pula
+    ficam vazios. Gráficos de janelas longas leem o nível mais fino que
+    caiba no orçamento de pontos e reduzem com LTTB, então o custo de
+    desenhar não cresce com o tamanho da partida.
+    """
+
+    SERIES = {
+        'tempo_jogo': 'q',
+        'populacao': 'd',  # cresce 1% por ciclo e passa do limite de um int64
+        'dinheiro': 'd',
+        'emissao_carbono': 'd',
+        'satisfacao': 'd',
+    }
+
+    RESOLUCOES = (10, 100, 1000)
+
+    def __init__(self, capacidade=20000, capacidade_agregados=2000):
+        self.capacidade = capacidade
+        self.inicio = None  # ciclo do primeiro ponto gravado
+        self.series = {nome: SerieCircular(capacidade, tipo) for nome, tipo in self.SERIES.items()}
+        self.agregados = {nome: self._criar_niveis(capacidade_agregados) for nome in self.SERIES}
+        # Série bruta e primeiro nível de agregação de cada métrica, na ordem de SERIES
+        self._entradas = [(self.series[nome], self.agregados[nome][0]) for nome in self.SERIES]
+
+    def _criar_niveis(self, capacidade):
+        niveis = []
+        proximo = None
+        for resolucao in reversed(self.RESOLUCOES):
+            proximo = NivelAgregado(resolucao, capacidade, proximo)
+            niveis.append(proximo)
+        niveis.reverse()
+        return niveis
+
+    def registrar(self, cidade):
+        """Guarda o estado atual da cidade (chamado a cada ciclo ou trecho avançado)"""
+        recursos = cidade.recursos
+        tempo = cidade.tempo_jogo
+        if self.inicio is None:
+            self.inicio = tempo
+        valores = (tempo, cidade.populacao, recursos.dinheiro,
+                   recursos.emissao_carbono, recursos.satisfacao_populacional)
+        for (serie, nivel), valor in zip(self._entradas, valores):
+            serie.adicionar(valor)
+            nivel.adicionar(tempo, valor, valor, valor)
+
+    def serie(self, nome, n=None):
+        """memoryview com os ``n`` valores mais recentes da série"""
+        return self.series[nome].ultimos(n)
+
+    def agregado(self, nome, resolucao, n=None):
+        """(mínimos, máximos, médias) dos ``n`` blocos mais recentes, como memoryviews"""
+        nivel = self.agregados[nome][self.RESOLUCOES.index(resolucao)]
+        return nivel.minimo.ultimos(n), nivel.maximo.ultimos(n), nivel.media.ultimos(n)
+
+    @staticmethod
+    def _na_janela(tempos, limite):
+        """(quantos dos ``tempos`` passam de ``limite``, se os guardados cobrem a janela toda)"""
+        visao = tempos.ultimos()
+        dentro = len(visao) - bisect_right(visao, limite)
+        cobre = tempos.total == tempos.tamanho or (len(visao) > 0 and visao[0] <= limite)
+        return dentro, cobre
+
+    def serie_reduzida(self, nome, pontos, ultimos=None):
+        """Até ``pontos`` pontos (tempos, valores) dos ``ultimos`` ciclos (a partida toda, se None)
+
+        Usa os valores brutos se couberem em 4 x ``pontos``; senão, as médias
+        do nível de agregação mais fino que caiba (ou do mais grosso
+        disponível, se a janela for maior que tudo). O resultado é reduzido
+        com LTTB, então o custo depende de ``pontos`` e não da janela.
+        """
+        if not len(self):
+            return [], []
+        fim = self.series['tempo_jogo'].ultimo()
+        limite = self.inicio - 1 if ultimos is None else max(self.inicio - 1, fim - ultimos)
+        orcamento = 4 * pontos
+
+        quantidade, cobre = self._na_janela(self.series['tempo_jogo'], limite)
+        if cobre and quantidade <= orcamento:
+            tempos = self.series['tempo_jogo'].ultimos(quantidade)
+            valores = self.series[nome].ultimos(quantidade)
+        else:
+            niveis_tempo = self.agregados['tempo_jogo']
+            for i in range(len(niveis_tempo)):
+                blocos, cobre = self._na_janela(niveis_tempo[i].media, limite)
+                if cobre and blocos <= orcamento:
+                    break
+            tempos = niveis_tempo[i].media.ultimos(blocos)
+            valores = self.agregados[nome][i].media.ultimos(blocos)
+
+        return reduzir_lttb(tempos, valores, pontos)
+
+    def __len__(self):
+        return self.series['tempo_jogo'].tamanho
+# [file content end]
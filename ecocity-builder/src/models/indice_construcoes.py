@@ -0,0 +1,93 @@
+# [file name]: src/models/indice_construcoes.py
+# [file content begin]
+from collections import Counter
+
+class IndiceConstrucoes:
+    """Agregados das construções de uma cidade, mantidos de forma incremental
+
+    Cada construção adicionada ou melhorada atualiza os contadores em O(1),
+    de modo que consultas por tipo, nome ou nível não percorrem a lista.
+    """
+
+    def __init__(self):
+        self.total = 0
+        self.por_tipo = Counter()
+        self.por_nome = Counter()
+        self.por_nivel = Counter()
+        self.impacto_emissao = 0
+        self.impacto_satisfacao = 0
+        self.investimento_total = 0
+
+    def registrar(self, construcao, custo_pago=None):
+        """Registra uma nova construção e passa a acompanhar suas melhorias"""
+        self.total += 1
+        self.por_tipo[construcao.tipo] += 1
+        self.por_nome[construcao.nome] += 1
+        self.por_nivel[construcao.nivel] += 1
+        self.impacto_emissao += construcao.impacto_emissao
+        self.impacto_satisfacao += construcao.impacto_satisfacao
+        # Melhorias não são cobradas: o investimento é o custo base da construção
+        self.investimento_total += construcao.prototipo.custo if custo_pago is None else custo_pago
+        construcao.indice = self
+
+    def registrar_lote(self, prototipo, construcoes):
+        """Registra de uma vez várias construções novas (nível 1) do mesmo protótipo"""
+        quantidade = len(construcoes)
+        self.total += quantidade
+        self.por_tipo[prototipo.tipo] += quantidade
+        self.por_nome[prototipo.nome] += quantidade
+        self.por_nivel[1] += quantidade
+        self.impacto_emissao += prototipo.impacto_emissao * quantidade
+        self.impacto_satisfacao += prototipo.impacto_satisfacao * quantidade
+        self.investimento_total += prototipo.custo * quantidade
+        for construcao in construcoes:
+            construcao.indice = self
+
+    def registrar_melhoria(self, construcao, nivel_anterior, emissao_anterior, satisfacao_anterior):
+        """Atualiza os agregados após Construcao.melhorar"""
+        self.por_nivel[nivel_anterior] -= 1
+        self.por_nivel[construcao.nivel] += 1
+        self.impacto_emissao += construcao.impacto_emissao - emissao_anterior
+        self.impacto_satisfacao += construcao.impacto_satisfacao - satisfacao_anterior
+
+    def contar_tipo(self, tipo):
+        return self.por_tipo[tipo]
+
+    def contar_nome(self, nome):
+        return self.por_nome[nome]
+
+    def contar_nivel(self, nivel):
+        return self.por_nivel[nivel]
+
+    def copiar(self):
+        """Cópia independente dos agregados (tamanho limitado pelo catálogo)"""
+        copia = IndiceConstrucoes()
+        copia.total = self.total
+        copia.por_tipo = self.por_tipo.copy()
+        copia.por_nome = self.por_nome.copy()
+        copia.por_nivel = self.por_nivel.copy()
+        copia.impacto_emissao = self.impacto_emissao
+        copia.impacto_satisfacao = self.impacto_satisfacao
+        copia.investimento_total = self.investimento_total
+        return copia
+
+    @classmethod
+    def a_partir_de(cls, construcoes):
+        """Reconstrói o índice a partir de uma lista de construções (ex.: ao carregar)"""
+        indice = cls()
+        for construcao in construcoes:
+            indice.registrar(construcao)
+        return indice
+
+    def to_dict(self):
+        """Converte para dicionário para exibição e salvamento"""
+        return {
+            'total': self.total,
+            'por_tipo': {tipo.value: n for tipo, n in self.por_tipo.items() if n},
+            'por_nome': {nome: n for nome, n in self.por_nome.items() if n},
+            'por_nivel': {nivel: n for nivel, n in self.por_nivel.items() if n},
+            'impacto_emissao': self.impacto_emissao,
+            'impacto_satisfacao': self.impacto_satisfacao,
+            'investimento_total': self.investimento_total
+        }
+# [file content end]
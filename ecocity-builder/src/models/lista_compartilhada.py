@@ -0,0 +1,154 @@
+# [file name]: src/models/lista_compartilhada.py
+# [file content begin]
+import copy
+from itertools import chain, islice
+
+class ListaCompartilhada:
+    """Lista com cópia na escrita, usada para bifurcar cidades em O(1)
+
+    Os elementos ficam em uma base compartilhada (nunca alterada) mais uma
+    cauda própria com o que foi acrescentado depois. ``bifurcar`` passa a
+    mesma base para a nova lista; acrescentar vai para a cauda, e
+    ``para_escrita`` copia só o elemento da base que vai mudar. Uma lista
+    com cauda ou trocas é consolidada (O(n)) uma vez ao ser bifurcada;
+    bifurcações seguidas da mesma lista custam O(1).
+    """
+    __slots__ = ('_base', '_tamanho_base', '_trocados', '_cauda')
+
+    def __init__(self, itens=()):
+        self._base = []
+        self._tamanho_base = 0  # elementos de _base que pertencem a esta lista
+        self._trocados = {}  # posição -> elemento que substitui o da base nesta lista
+        self._cauda = list(itens)
+
+    def bifurcar(self):
+        """Nova lista que compartilha armazenamento e elementos com esta"""
+        if self._cauda or self._trocados or self._tamanho_base < len(self._base):
+            self._consolidar()
+        copia = ListaCompartilhada.__new__(ListaCompartilhada)
+        copia._base = self._base
+        copia._tamanho_base = self._tamanho_base
+        copia._trocados = {}
+        copia._cauda = []
+        return copia
+
+    def _consolidar(self):
+        base = self._lista()
+        self._base = base
+        self._tamanho_base = len(base)
+        self._trocados = {}
+        self._cauda = []
+
+    def _lista(self):
+        itens = self._base[:self._tamanho_base]
+        for posicao, item in self._trocados.items():
+            itens[posicao] = item
+        itens.extend(self._cauda)
+        return itens
+
+    def _materializar(self):
+        # Alterações que deslocam posições: a lista passa a ter só cauda própria
+        self._cauda = self._lista()
+        self._base = []
+        self._tamanho_base = 0
+        self._trocados = {}
+
+    def _posicao(self, posicao):
+        tamanho = len(self)
+        if posicao < 0:
+            posicao += tamanho
+        if not 0 <= posicao < tamanho:
+            raise IndexError("índice fora da lista")
+        return posicao
+
+    def para_escrita(self, posicao, copiar=copy.copy):
+        """Retorna o elemento pronto para ser alterado, copiando-o se for compartilhado"""
+        posicao = self._posicao(posicao)
+        if posicao >= self._tamanho_base:
+            return self._cauda[posicao - self._tamanho_base]
+        if posicao not in self._trocados:
+            self._trocados[posicao] = copiar(self._base[posicao])
+        return self._trocados[posicao]
+
+    def append(self, item):
+        self._cauda.append(item)
+
+    def extend(self, itens):
+        self._cauda.extend(itens)
+
+    def pop(self, posicao=-1):
+        posicao = self._posicao(posicao)
+        item = self[posicao]
+        del self[posicao]
+        return item
+
+    def __setitem__(self, posicao, valor):
+        if isinstance(posicao, slice):
+            self._materializar()
+            self._cauda[posicao] = valor
+            return
+        posicao = self._posicao(posicao)
+        if posicao < self._tamanho_base:
+            self._trocados[posicao] = valor
+        else:
+            self._cauda[posicao - self._tamanho_base] = valor
+
+    def __delitem__(self, posicao):
+        if isinstance(posicao, slice) and posicao.stop is None and posicao.step is None:
+            # Remoção do final (ex.: desfazer um lote) não desloca os anteriores
+            inicio = posicao.indices(len(self))[0]
+            if inicio >= self._tamanho_base:
+                del self._cauda[inicio - self._tamanho_base:]
+            else:
+                self._tamanho_base = inicio
+                self._cauda = []
+                self._trocados = {p: item for p, item in self._trocados.items() if p < inicio}
+            return
+        if not isinstance(posicao, slice) and self._posicao(posicao) == len(self) - 1:
+            del self[len(self) - 1:]
+            return
+        self._materializar()
+        del self._cauda[posicao]
+
+    def __getitem__(self, posicao):
+        if isinstance(posicao, slice):
+            return self._lista()[posicao]
+        posicao = self._posicao(posicao)
+        if posicao >= self._tamanho_base:
+            return self._cauda[posicao - self._tamanho_base]
+        if posicao in self._trocados:
+            return self._trocados[posicao]
+        return self._base[posicao]
+
+    def __len__(self):
+        return self._tamanho_base + len(self._cauda)
+
+    def __iter__(self):
+        if self._trocados:
+            return iter(self._lista())
+        return chain(islice(self._base, self._tamanho_base), self._cauda)
+
+    def __contains__(self, item):
+        return any(elemento is item or elemento == item for elemento in self)
+
+    def __eq__(self, outra):
+        if isinstance(outra, ListaCompartilhada):
+            outra = outra._lista()
+        return self._lista() == outra
+
+    def __add__(self, outra):
+        return self._lista() + list(outra)
+
+    def __mul__(self, vezes):
+        return self._lista() * vezes
+
+    def __repr__(self):
+        return f"ListaCompartilhada({self._lista()!r})"
+
+    def __getstate__(self):
+        # Ao serializar, a lista é gravada como uma lista comum
+        return self._lista()
+
+    def __setstate__(self, itens):
+        self.__init__(itens)
+# [file content end]
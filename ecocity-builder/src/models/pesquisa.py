@@ -0,0 +1,129 @@
+# [file name]: src/models/pesquisa.py
+# [file content begin]
+import heapq
+from collections import deque
+
+class AgendadorPesquisas:
+    """Fila de pesquisas de uma cidade com laboratórios paralelos
+
+    As pesquisas em andamento ficam em um min-heap ordenado pelo ciclo de
+    conclusão, então cada ciclo custa só uma consulta ao topo do heap (e
+    O(log n) por pesquisa concluída), sem percorrer todas as tecnologias.
+    A fila é FIFO: se a primeira da fila não puder começar (dinheiro ou
+    requisitos), as seguintes esperam.
+    """
+
+    def __init__(self, cidade, slots=1):
+        self.cidade = cidade
+        self.slots = slots
+        self.fila = deque()
+        self.em_andamento = []  # heap de (ciclo_conclusao, ordem, tecnologia)
+        self.conclusoes = {}  # nome -> ciclo de conclusão
+        self.callbacks = []  # chamados com (cidade, tecnologia) ao concluir
+        self.espelhar_tecnologias = True  # atualiza pesquisando/desbloqueada nos objetos Tecnologia
+        self._ordem = 0
+        self._nomes_fila = set()
+
+    def copiar(self, cidade):
+        """Cópia para uma bifurcação da cidade; não altera os objetos Tecnologia nem chama callbacks"""
+        copia = AgendadorPesquisas(cidade, self.slots)
+        copia.fila = deque(self.fila)
+        copia.em_andamento = list(self.em_andamento)
+        copia.conclusoes = dict(self.conclusoes)
+        copia.espelhar_tecnologias = False
+        copia._ordem = self._ordem
+        copia._nomes_fila = set(self._nomes_fila)
+        return copia
+
+    def enfileirar(self, tecnologia):
+        """Coloca uma tecnologia na fila e inicia se houver laboratório livre"""
+        if self.cidade.tecnologia_desbloqueada(tecnologia.nome):
+            return False, "Tecnologia já desbloqueada"
+        if tecnologia.nome in self.conclusoes or tecnologia.nome in self._nomes_fila:
+            return False, "Tecnologia já em pesquisa"
+
+        self.fila.append(tecnologia)
+        self._nomes_fila.add(tecnologia.nome)
+        self._iniciar_pendentes()
+
+        if tecnologia.nome in self.conclusoes:
+            return True, f"Pesquisa de {tecnologia.nome} iniciada!"
+        return True, f"{tecnologia.nome} adicionada à fila de pesquisas"
+
+    def cancelar(self, tecnologia):
+        """Remove uma tecnologia que ainda está na fila"""
+        if tecnologia.nome not in self._nomes_fila:
+            return False
+        self.fila = deque(t for t in self.fila if t.nome != tecnologia.nome)
+        self._nomes_fila.discard(tecnologia.nome)
+        return True
+
+    def _iniciar_pendentes(self):
+        while self.fila and len(self.em_andamento) < self.slots:
+            tecnologia = self.fila[0]
+            pode_pesquisar, _ = tecnologia.pode_pesquisar(self.cidade)
+            if not pode_pesquisar:
+                break
+
+            self.fila.popleft()
+            self._nomes_fila.discard(tecnologia.nome)
+            self.cidade.recursos.dinheiro -= tecnologia.custo
+
+            conclusao = self.cidade.tempo_jogo + max(1, tecnologia.tempo_pesquisa)
+            heapq.heappush(self.em_andamento, (conclusao, self._ordem, tecnologia))
+            self._ordem += 1
+            self.conclusoes[tecnologia.nome] = conclusao
+
+            if self.espelhar_tecnologias:
+                tecnologia.pesquisando = True
+                tecnologia.tempo_restante = tecnologia.tempo_pesquisa
+
+    def atualizar(self):
+        """Conclui as pesquisas que terminam até o ciclo atual e inicia as pendentes
+
+        Retorna a lista de tecnologias concluídas neste ciclo.
+        """
+        concluidas = []
+        ciclo = self.cidade.tempo_jogo
+        while self.em_andamento and self.em_andamento[0][0] <= ciclo:
+            _, _, tecnologia = heapq.heappop(self.em_andamento)
+            del self.conclusoes[tecnologia.nome]
+            self._concluir(tecnologia)
+            concluidas.append(tecnologia)
+
+        if self.fila and len(self.em_andamento) < self.slots:
+            self._iniciar_pendentes()
+        return concluidas
+
+    def _concluir(self, tecnologia):
+        # Sai do heap uma única vez, então os benefícios são aplicados uma única vez
+        if self.espelhar_tecnologias:
+            tecnologia.pesquisando = False
+            tecnologia.desbloqueada = True
+            tecnologia.tempo_restante = 0
+        self.cidade.desbloquear_tecnologia(tecnologia.nome)
+        tecnologia.aplicar_beneficios(self.cidade, exigir_desbloqueio=False)
+        for callback in self.callbacks:
+            callback(self.cidade, tecnologia)
+
+    def proxima_conclusao(self):
+        """Ciclo da próxima pesquisa a terminar, ou None"""
+        return self.em_andamento[0][0] if self.em_andamento else None
+
+    def aguardando_inicio(self):
+        """True se há pesquisa na fila esperando por um laboratório livre"""
+        return bool(self.fila) and len(self.em_andamento) < self.slots
+
+    def em_pesquisa(self, nome):
+        return nome in self.conclusoes
+
+    def progresso(self, tecnologia):
+        """Progresso da pesquisa desta cidade em porcentagem"""
+        if self.cidade.tecnologia_desbloqueada(tecnologia.nome):
+            return 100
+        if tecnologia.nome not in self.conclusoes:
+            return 0
+        restante = self.conclusoes[tecnologia.nome] - self.cidade.tempo_jogo
+        duracao = max(1, tecnologia.tempo_pesquisa)
+        return ((duracao - restante) / duracao) * 100
+# [file content end]
@@ -1,6 +1,7 @@
 # [file name]: src/models/tecnologia.py
 # [file content begin]
 from enum import Enum
+from .arvore_tecnologias import ArvoreTecnologias
 
 class TipoTecnologia(Enum):
     ENERGIA = "Energia Limpa"
@@ -10,6 +11,9 @@ class TipoTecnologia(Enum):
     TECNOLOGIA = "Tecnologia Avançada"
 
 class Tecnologia:
+    __slots__ = ('nome', 'tipo', 'custo', 'tempo_pesquisa', 'tempo_restante', 'pesquisando',
+                 'desbloqueada', 'requisitos', 'beneficios')
+    
     def __init__(self, nome, tipo, custo, tempo_pesquisa, requisitos=None, beneficios=None):
         self.nome = nome
         self.tipo = tipo
@@ -29,14 +33,9 @@ class Tecnologia:
         if self.pesquisando:
             return False, "Tecnologia já em pesquisa"
         
-        # Verificar requisitos
-        for req in self.requisitos:
-            if req not in [t.nome for t in cidade.tecnologias_desbloqueadas]:
-                return False, f"Requisito não atendido: {req}"
-        
-        # Verificar recursos
-        if cidade.recursos.dinheiro < self.custo:
-            return False, "Recursos insuficientes"
+        pode_pesquisar, mensagem = self.pode_pesquisar(cidade)
+        if not pode_pesquisar:
+            return False, mensagem
         
         # Deduzir custo e iniciar pesquisa
         cidade.recursos.dinheiro -= self.custo
@@ -45,6 +44,22 @@ class Tecnologia:
         
         return True, f"Pesquisa de {self.nome} iniciada!"
     
+    def pode_pesquisar(self, cidade):
+        """Verifica requisitos e recursos da cidade para pesquisar esta tecnologia"""
+        # Fechamento pré-calculado: um único teste de máscara
+        if ARVORE_TECNOLOGIAS.fechamento_de(self) & ~cidade.mascara_tecnologias:
+            faltando = ARVORE_TECNOLOGIAS.requisitos_faltando(self.requisitos, cidade.mascara_tecnologias)
+            return False, f"Requisito não atendido: {faltando[0]}"
+        # Requisitos fora da árvore (tecnologias fora do catálogo) são verificados pelo nome
+        for req in ARVORE_TECNOLOGIAS.fora_da_arvore(self.requisitos):
+            if not cidade.tecnologia_desbloqueada(req):
+                return False, f"Requisito não atendido: {req}"
+        
+        if cidade.recursos.dinheiro < self.custo:
+            return False, "Recursos insuficientes"
+        
+        return True, "Pode pesquisar"
+    
     def atualizar_pesquisa(self):
         """Atualiza o progresso da pesquisa"""
         if self.pesquisando and not self.desbloqueada:
@@ -63,9 +78,9 @@ class Tecnologia:
             return 0
         return ((self.tempo_pesquisa - self.tempo_restante) / self.tempo_pesquisa) * 100
     
-    def aplicar_beneficios(self, cidade):
+    def aplicar_beneficios(self, cidade, exigir_desbloqueio=True):
         """Aplica os benefícios da tecnologia à cidade"""
-        if not self.desbloqueada:
+        if exigir_desbloqueio and not self.desbloqueada:
             return
         
         for recurso, valor in self.beneficios.items():
@@ -139,4 +154,7 @@ TECNOLOGIAS_DISPONIVEIS = [
         beneficios={'reducao_emissao': -30}
     )
 ]
+
+# Árvore compilada usada nas verificações de requisitos (as construções acrescentam seus requisitos)
+ARVORE_TECNOLOGIAS = ArvoreTecnologias(TECNOLOGIAS_DISPONIVEIS)
 # [file content end]
\ No newline at end of file
@@ -4,6 +4,8 @@ import pygame
 from .botoes import Botao
 from models.construcao import CONSTRUCOES_DISPONIVEIS
 
+CICLOS_PREVISAO = 50
+
 class MenuConstrucoes:
     def __init__(self, screen, cidade):
         self.screen = screen
@@ -22,6 +24,37 @@ class MenuConstrucoes:
         self.botao_proxima = Botao("Próxima >", self.largura - 120, self.altura - 50, 100, 30, (52, 152, 219), fonte=self.fonte_pequena)
         self.botao_anterior = Botao("< Anterior", self.largura - 230, self.altura - 50, 100, 30, (52, 152, 219), fonte=self.fonte_pequena)
         
+        # Previsão "e se eu construir isto?" para cada item do catálogo
+        self.previsoes = {}
+        self._chave_previsoes = None
+        
+    def calcular_previsoes(self):
+        """Projeta a cidade em CICLOS_PREVISAO ciclos para cada construção do catálogo
+        
+        Cada previsão roda em uma bifurcação O(1) da cidade, e só é refeita
+        quando o estado da cidade muda.
+        """
+        cidade = self.cidade
+        recursos = cidade.recursos
+        chave = (cidade.tempo_jogo, cidade.indice.total, recursos.dinheiro, recursos.emissao_carbono,
+                 recursos.satisfacao_populacional, cidade.mascara_tecnologias)
+        if chave == self._chave_previsoes:
+            return self.previsoes
+        
+        self.previsoes = {}
+        for construcao in CONSTRUCOES_DISPONIVEIS:
+            previsao = cidade.bifurcar()
+            sucesso, _ = previsao.adicionar_construcao(construcao.nome)
+            if sucesso:
+                previsao.avancar_ciclos(CICLOS_PREVISAO)
+                self.previsoes[construcao.nome] = {
+                    'emissao_carbono': previsao.recursos.emissao_carbono,
+                    'dinheiro': previsao.recursos.dinheiro,
+                    'populacao': previsao.populacao
+                }
+        self._chave_previsoes = chave
+        return self.previsoes
+        
     def desenhar(self):
         # Fundo semi-transparente
         overlay = pygame.Surface((self.largura, self.altura), pygame.SRCALPHA)
@@ -72,7 +105,7 @@ class MenuConstrucoes:
         pygame.draw.rect(self.screen, (200, 200, 200), item_rect, 1, border_radius=8)
         
         # Verificar se pode construir
-        pode_construir, motivo = construcao.pode_construir(self.cidade.recursos, self.cidade.tecnologias_desbloqueadas)
+        pode_construir, motivo = construcao.pode_construir(self.cidade.recursos, self.cidade.mascara_tecnologias)
         cor_texto = (255, 255, 255) if pode_construir else (150, 150, 150)
         
         # Nome e tipo
@@ -87,6 +120,16 @@ class MenuConstrucoes:
         )
         self.screen.blit(stats_text, (x + 10, y + 35))
         
+        # Previsão em CICLOS_PREVISAO ciclos
+        previsao = self.previsoes.get(construcao.nome)
+        if previsao:
+            previsao_text = self.fonte_pequena.render(
+                f"Em {CICLOS_PREVISAO} ciclos: 🌍 {previsao['emissao_carbono']:.1f}CO₂ | "
+                f"💰 ${previsao['dinheiro']:.0f} | 👥 {previsao['populacao']}",
+                True, (170, 200, 255)
+            )
+            self.screen.blit(previsao_text, (x + 10, y + 52))
+        
         # Botão construir
         botao_construir = Botao(
             "Construir" if pode_construir else motivo,
@@ -134,6 +177,7 @@ class MenuConstrucoes:
         return None
     
     def atualizar(self):
+        self.calcular_previsoes()
         pos_mouse = pygame.mouse.get_pos()
         self.botao_fechar.atualizar(pos_mouse)
         self.botao_proxima.atualizar(pos_mouse)
@@ -2,7 +2,7 @@
 # [file content begin]
 import pygame
 from .botoes import Botao
-from models.tecnologia import TECNOLOGIAS_DISPONIVEIS
+from models.tecnologia import TECNOLOGIAS_DISPONIVEIS, ARVORE_TECNOLOGIAS
 
 class MenuPesquisas:
     def __init__(self, screen, cidade):
@@ -41,7 +41,7 @@ class MenuPesquisas:
         self.screen.blit(texto_recursos, (painel_rect.x + 20, painel_rect.y + 70))
         
         # Tecnologias desbloqueadas
-        techs_desbloqueadas = len([t for t in TECNOLOGIAS_DISPONIVEIS if t.desbloqueada])
+        techs_desbloqueadas = len([t for t in TECNOLOGIAS_DISPONIVEIS if self.cidade.tecnologia_desbloqueada(t.nome)])
         texto_desbloqueadas = self.fonte_normal.render(f"Tecnologias Desbloqueadas: {techs_desbloqueadas}/{len(TECNOLOGIAS_DISPONIVEIS)}", True, (255, 255, 255))
         self.screen.blit(texto_desbloqueadas, (painel_rect.x + 20, painel_rect.y + 100))
         
@@ -61,18 +61,22 @@ class MenuPesquisas:
     
     def desenhar_item_tecnologia(self, tecnologia, x, y, largura):
         """Desenha um item de tecnologia na lista"""
+        # Estado da pesquisa nesta cidade
+        desbloqueada = self.cidade.tecnologia_desbloqueada(tecnologia.nome)
+        pesquisando = self.cidade.pesquisas.em_pesquisa(tecnologia.nome)
+        
         # Fundo do item
         item_rect = pygame.Rect(x, y, largura, 80)
-        cor_fundo = (60, 80, 140) if tecnologia.desbloqueada else (50, 70, 120)
+        cor_fundo = (60, 80, 140) if desbloqueada else (50, 70, 120)
         pygame.draw.rect(self.screen, cor_fundo, item_rect, border_radius=8)
         pygame.draw.rect(self.screen, (200, 200, 200), item_rect, 1, border_radius=8)
         
         # Status da tecnologia
-        if tecnologia.desbloqueada:
+        if desbloqueada:
             status = "✅ DESBLOQUEADA"
             cor_status = (46, 204, 113)
-        elif tecnologia.pesquisando:
-            progresso = tecnologia.get_progresso()
+        elif pesquisando:
+            progresso = self.cidade.pesquisas.progresso(tecnologia)
             status = f"🔬 PESQUISANDO... {progresso:.0f}%"
             cor_status = (241, 196, 15)
         else:
@@ -92,10 +96,10 @@ class MenuPesquisas:
         self.screen.blit(info_text, (x + 10, y + 55))
         
         # Botão pesquisar (se disponível)
-        pode_pesquisar = (not tecnologia.desbloqueada and 
-                         not tecnologia.pesquisando and
+        pode_pesquisar = (not desbloqueada and 
+                         not pesquisando and
                          self.cidade.recursos.dinheiro >= tecnologia.custo and
-                         all(req in [t.nome for t in self.cidade.tecnologias_desbloqueadas] for req in tecnologia.requisitos))
+                         not ARVORE_TECNOLOGIAS.fechamento_de(tecnologia) & ~self.cidade.mascara_tecnologias)
         
         if pode_pesquisar:
             botao_pesquisar = Botao(
@@ -112,7 +116,7 @@ class MenuPesquisas:
             self.botoes_pesquisar.append((botao_pesquisar, tecnologia))
         
         # Requisitos (se houver)
-        if tecnologia.requisitos and not tecnologia.desbloqueada:
+        if tecnologia.requisitos and not desbloqueada:
             req_text = f"Requisitos: {', '.join(tecnologia.requisitos)}"
             texto_req = self.fonte_pequena.render(req_text, True, (200, 150, 150))
             self.screen.blit(texto_req, (x + largura - 250, y + 55))
@@ -127,9 +131,9 @@ class MenuPesquisas:
             if hasattr(self, 'botoes_pesquisar'):
                 for botao, tecnologia in self.botoes_pesquisar:
                     if botao.esta_clicado(event.pos):
-                        sucesso, mensagem = tecnologia.iniciar_pesquisa(self.cidade)
+                        # Desbloqueio e benefícios ficam a cargo do agendador da cidade
+                        sucesso, mensagem = self.cidade.pesquisas.enfileirar(tecnologia)
                         if sucesso:
-                            self.cidade.tecnologias_desbloqueadas.append(tecnologia)
                             print(f"🔬 {mensagem}")
                             return "pesquisa_iniciada"
                         else:
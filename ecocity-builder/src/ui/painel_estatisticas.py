@@ -17,10 +17,16 @@ class PainelEstatisticas:
         # Botões
         self.botao_fechar = Botao("Fechar", self.largura - 100, 50, 120, 40, (231, 76, 60))
         
-        # Histórico de dados (simulado)
-        self.historico_emissao = [50, 48, 45, 42, 40, 38, 35]
-        self.historico_satisfacao = [70, 72, 75, 78, 80, 82, 85]
-        self.historico_populacao = [100, 105, 110, 115, 120, 125, 130]
+        # Pontos por gráfico (um por pixel de largura) e janela em ciclos (None = partida toda)
+        self.pontos_grafico = 250
+        self.janela_grafico = None
+    
+    def serie_historico(self, nome):
+        """(tempos, valores) de uma série do histórico, com no máximo pontos_grafico pontos"""
+        historico = getattr(self.cidade, 'historico', None)
+        if historico is None:
+            return [], []
+        return historico.serie_reduzida(nome, self.pontos_grafico, self.janela_grafico)
     
     def desenhar(self):
         # Fundo semi-transparente
@@ -63,8 +69,8 @@ class PainelEstatisticas:
             f"🎯 Dificuldade: {self.cidade.dificuldade}",
             f"⏱️ Tempo de Jogo: {self.cidade.tempo_jogo} ciclos",
             f"👥 População: {self.cidade.populacao} habitantes",
-            f"🏗️ Construções: {len(self.cidade.construcoes)}",
-            f"🔬 Tecnologias: {len([t for t in self.cidade.tecnologias_desbloqueadas if t.desbloqueada])}"
+            f"🏗️ Construções: {self.cidade.indice.total}",
+            f"🔬 Tecnologias: {len(self.cidade.tecnologias_desbloqueadas)}"
         ]
         
         for i, dado in enumerate(dados):
@@ -127,22 +133,24 @@ class PainelEstatisticas:
         # Gráfico de emissões
         texto_emissao = self.fonte_pequena.render("Emissões de CO₂:", True, (255, 255, 255))
         self.screen.blit(texto_emissao, (x + 20, y + 50))
-        self.desenhar_grafico_simples(self.historico_emissao, x + 20, y + 70, 250, 60, (231, 76, 60))
+        self.desenhar_grafico_simples(*self.serie_historico('emissao_carbono'), x + 20, y + 70, 250, 60, (231, 76, 60))
         
         # Gráfico de satisfação
         texto_satisfacao = self.fonte_pequena.render("Satisfação Populacional:", True, (255, 255, 255))
         self.screen.blit(texto_satisfacao, (x + 300, y + 50))
-        self.desenhar_grafico_simples(self.historico_satisfacao, x + 300, y + 70, 250, 60, (46, 204, 113))
+        self.desenhar_grafico_simples(*self.serie_historico('satisfacao'), x + 300, y + 70, 250, 60, (46, 204, 113))
         
         # Gráfico de população
         texto_populacao = self.fonte_pequena.render("População:", True, (255, 255, 255))
         self.screen.blit(texto_populacao, (x + 580, y + 50))
-        self.desenhar_grafico_simples(self.historico_populacao, x + 580, y + 70, 250, 60, (241, 196, 15))
+        self.desenhar_grafico_simples(*self.serie_historico('populacao'), x + 580, y + 70, 250, 60, (241, 196, 15))
     
-    def desenhar_grafico_simples(self, dados, x, y, largura, altura, cor):
-        """Desenha um gráfico de linha simplificado"""
+    def desenhar_grafico_simples(self, tempos, dados, x, y, largura, altura, cor):
+        """Desenha um gráfico de linha simplificado (``tempos`` dá a posição de cada ponto)"""
         if len(dados) < 2:
             return
+        inicio_tempo = tempos[0]
+        duracao = (tempos[-1] - inicio_tempo) or 1
             
         # Encontrar valores máximo e mínimo para escala
         max_val = max(dados)
@@ -155,21 +163,21 @@ class PainelEstatisticas:
         # Desenhar linhas do gráfico
         pontos = []
         for i, valor in enumerate(dados):
-            x_pos = x + (i / (len(dados) - 1)) * largura
+            x_pos = x + ((tempos[i] - inicio_tempo) / duracao) * largura
             y_pos = y + altura - ((valor - min_val) / range_val) * altura
             pontos.append((x_pos, y_pos))
         
         if len(pontos) > 1:
             pygame.draw.lines(self.screen, cor, False, pontos, 3)
             
-        # Desenhar pontos
-        for ponto in pontos:
+        # Desenhar pontos (só com poucos dados, senão viram uma linha grossa)
+        for ponto in (pontos if len(pontos) <= 30 else []):
             pygame.draw.circle(self.screen, cor, (int(ponto[0]), int(ponto[1])), 4)
     
     def calcular_investimento_total(self):
         """Calcula o investimento total em construções e pesquisas"""
-        # Simulação - na implementação real somaria custos reais
-        return len(self.cidade.construcoes) * 300 + len(self.cidade.tecnologias_desbloqueadas) * 800
+        # Construções vêm do índice da cidade; pesquisas ainda são estimadas
+        return self.cidade.indice.investimento_total + len(self.cidade.tecnologias_desbloqueadas) * 800
     
     def calcular_eficiencia(self):
         """Calcula uma métrica de eficiência geral"""
@@ -0,0 +1,40 @@
+"""
+Cidades e dados de save compartilhados pelos testes de salvamento e carregamento
+"""
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from models.cidade import Cidade
+
+
+def criar_cidade(nome="Teste", dificuldade="Médio", paineis=300, ciclovias=None, parques=0,
+                 melhorar_a_cada=0, tecnologias=("Energia Solar Avançada",), ciclos=0):
+    """Cidade com construções em níveis variados, para testar ida e volta de saves
+
+    ``ciclovias`` vale ``paineis // 3`` se omitido. Com ``melhorar_a_cada``,
+    uma construção a cada tantas é melhorada; a primeira recebe ainda mais
+    uma melhoria.
+    """
+    cidade = Cidade(nome, dificuldade)
+    cidade.recursos.dinheiro = 10**7
+    pedidos = [("Painel Solar", paineis), ("Ciclovia", paineis // 3 if ciclovias is None else ciclovias),
+               ("Parque Público", parques)]
+    cidade.construir_em_lote([(nome_construcao, quantidade) for nome_construcao, quantidade in pedidos if quantidade])
+    if melhorar_a_cada:
+        for posicao in range(0, len(cidade.construcoes), melhorar_a_cada):
+            cidade.melhorar_construcao(posicao)
+    if len(cidade.construcoes):
+        cidade.melhorar_construcao(0)
+    for tecnologia in tecnologias:
+        cidade.desbloquear_tecnologia(tecnologia)
+    for _ in range(ciclos):
+        cidade.atualizar_estado()
+    return cidade
+
+
+def sem_data(dados):
+    """Dados de save sem a data, para comparar saves gravados em momentos diferentes"""
+    dados['metadata'].pop('data_salvamento')
+    return dados
@@ -0,0 +1,70 @@
+"""
+Testes do agendador de simulação de passo fixo
+"""
+
+import pytest
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from core.agendador import AgendadorSimulacao
+
+
+class Contador:
+    def __init__(self):
+        self.ticks = 0
+
+    def __call__(self):
+        self.ticks += 1
+
+
+class TestAgendadorSimulacao:
+    """Testes do AgendadorSimulacao"""
+
+    def test_independente_do_fps(self):
+        """A mesma duração real gera os mesmos ticks em 30 ou 144 FPS"""
+        for fps in [30, 60, 144]:
+            agendador = AgendadorSimulacao(passo_ms=100)
+            contador = Contador()
+            for _ in range(fps * 10):
+                agendador.atualizar(1000 / fps, contador)
+            assert contador.ticks in (99, 100)
+
+    def test_quadro_travado_recupera_tempo(self):
+        """Um quadro longo não perde tempo simulado, só o distribui"""
+        agendador = AgendadorSimulacao(passo_ms=100, max_ticks_por_quadro=5)
+        contador = Contador()
+
+        assert agendador.atualizar(1200, contador) == 5
+        assert agendador.atualizar(0, contador) == 5
+        assert agendador.atualizar(0, contador) == 2
+        assert contador.ticks == 12
+
+    def test_atraso_maximo_descartado(self):
+        agendador = AgendadorSimulacao(passo_ms=100, max_ticks_por_quadro=5, atraso_maximo_ms=300)
+        contador = Contador()
+
+        agendador.atualizar(10000, contador)
+
+        assert contador.ticks == 5
+        assert agendador.acumulador == 300
+        assert agendador.tempo_descartado_ms == 10000 - 500 - 300
+
+    def test_velocidade_e_pausa(self):
+        agendador = AgendadorSimulacao(passo_ms=1000)
+        contador = Contador()
+
+        agendador.definir_velocidade(10)
+        agendador.atualizar(500, contador)
+        assert contador.ticks == 5
+
+        agendador.alternar_pausa()
+        assert agendador.atualizar(5000, contador) == 0
+        assert contador.ticks == 5
+
+        agendador.alternar_pausa()
+        assert agendador.proxima_velocidade() == 100
+
+    def test_velocidade_invalida(self):
+        with pytest.raises(ValueError):
+            AgendadorSimulacao().definir_velocidade(0)
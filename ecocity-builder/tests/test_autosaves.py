@@ -0,0 +1,130 @@
+"""
+Testes dos autosaves deduplicados
+"""
+
+import pytest
+import sys
+import os
+from datetime import datetime, timedelta
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+import auxiliares
+from core.autosaves import ArmazemAutosaves, EXTENSAO_AUTOSAVE
+
+
+def criar_cidade(nome="Auto", quantidade=300):
+    return auxiliares.criar_cidade(nome, paineis=quantidade)
+
+
+def objetos(armazem):
+    return {arquivo for _, _, arquivos in os.walk(armazem.pasta_objetos) for arquivo in arquivos}
+
+
+def manifestos(armazem):
+    return sorted(arquivo for arquivo in os.listdir(armazem.pasta) if arquivo.endswith(EXTENSAO_AUTOSAVE))
+
+
+INICIO = datetime(2024, 3, 1, 12, 0, 0)
+
+
+class TestArmazemAutosaves:
+    """Testes de gravação e carregamento"""
+
+    def test_ida_e_volta(self, tmp_path):
+        armazem = ArmazemAutosaves(str(tmp_path), construcoes_por_pedaco=64)
+        cidade = criar_cidade()
+        for _ in range(5):
+            cidade.atualizar_estado()
+
+        sucesso, mensagem = armazem.salvar(cidade, INICIO)
+        assert sucesso, mensagem
+
+        saves = armazem.listar()
+        assert [(s['cidade'], s['tempo_jogo']) for s in saves] == [("Auto", 5)]
+        sucesso, carregada, mensagem = armazem.carregar(saves[0]['arquivo'])
+        assert sucesso, mensagem
+        assert [(c.nome, c.nivel) for c in carregada.construcoes] == [(c.nome, c.nivel) for c in cidade.construcoes]
+        assert carregada.tecnologias_desbloqueadas == cidade.tecnologias_desbloqueadas
+        assert carregada.recursos.to_dict() == cidade.recursos.to_dict()
+        assert carregada.populacao == cidade.populacao
+
+    def test_so_pedacos_alterados_sao_gravados(self, tmp_path):
+        armazem = ArmazemAutosaves(str(tmp_path), construcoes_por_pedaco=64)
+        cidade = criar_cidade()
+        armazem.salvar(cidade, INICIO)
+        antes = objetos(armazem)
+
+        # Só ciclos: recursos mudam no manifesto, nenhum objeto novo
+        cidade.atualizar_estado()
+        armazem.salvar(cidade, INICIO + timedelta(seconds=30))
+        assert objetos(armazem) == antes
+
+        # Uma melhoria no meio da lista: um pedaço novo
+        cidade.melhorar_construcao(200)
+        armazem.salvar(cidade, INICIO + timedelta(seconds=60))
+        assert len(objetos(armazem) - antes) == 1
+
+    def test_objeto_corrompido(self, tmp_path):
+        armazem = ArmazemAutosaves(str(tmp_path))
+        armazem.salvar(criar_cidade(), INICIO)
+        for pasta, _, arquivos in os.walk(armazem.pasta_objetos):
+            for arquivo in arquivos:
+                os.remove(os.path.join(pasta, arquivo))
+
+        sucesso, cidade, mensagem = armazem.carregar(manifestos(armazem)[0])
+        assert not sucesso and cidade is None and mensagem.startswith("Erro ao carregar")
+
+    def test_segundo_plano(self, tmp_path):
+        armazem = ArmazemAutosaves(str(tmp_path))
+        cidade = criar_cidade()
+        assert armazem.salvar_em_segundo_plano(cidade)
+        cidade.adicionar_construcao("Parque Público")  # depois da bifurcação: fora do autosave
+
+        resultados = armazem.aguardar_salvamentos()
+        assert [sucesso for sucesso, _ in resultados] == [True]
+        _, carregada, _ = armazem.carregar(armazem.listar()[0]['arquivo'])
+        assert len(carregada.construcoes) == len(cidade.construcoes) - 1
+
+
+class TestRetencao:
+    """Testes da política de retenção e da coleta de lixo"""
+
+    def test_ultimos_por_hora_e_por_dia(self, tmp_path):
+        armazem = ArmazemAutosaves(str(tmp_path), ultimos=3, por_hora=4, por_dia=2)
+        cidade = criar_cidade(quantidade=20)
+        # Dois dias de jogo, um autosave a cada 10 minutos
+        datas = [INICIO + timedelta(minutes=10 * i) for i in range(6 * 48)]
+        for data in datas:
+            armazem.salvar(cidade, data)
+
+        mantidas = sorted(datetime.fromisoformat(s['data_salvamento']) for s in armazem.listar())
+        esperadas = set(datas[-3:])
+        esperadas |= {datas[-1] - timedelta(hours=h) for h in range(4)}  # o último de cada hora
+        esperadas |= {datetime(2024, 3, 3, 11, 50), datetime(2024, 3, 2, 23, 50)}  # o último de cada dia
+        assert mantidas == sorted(esperadas)
+
+    def test_retencao_por_cidade(self, tmp_path):
+        armazem = ArmazemAutosaves(str(tmp_path), ultimos=2, por_hora=0, por_dia=0)
+        alfa, beta = criar_cidade("Alfa", 10), criar_cidade("Beta", 10)
+        for i in range(5):
+            armazem.salvar(alfa, INICIO + timedelta(seconds=i))
+            armazem.salvar(beta, INICIO + timedelta(seconds=i, milliseconds=500))
+
+        assert sorted(s['cidade'] for s in armazem.listar()) == ["Alfa", "Alfa", "Beta", "Beta"]
+
+    def test_coleta_de_lixo(self, tmp_path):
+        armazem = ArmazemAutosaves(str(tmp_path), ultimos=1, por_hora=0, por_dia=0, construcoes_por_pedaco=32)
+        cidade = criar_cidade(quantidade=100)
+        for i in range(10):
+            cidade.melhorar_construcao(i * 10)
+            armazem.salvar(cidade, INICIO + timedelta(minutes=i))
+
+        assert len(manifestos(armazem)) == 1
+        # Só sobram os objetos do último autosave: info + um por pedaço
+        assert len(objetos(armazem)) == 1 + (len(cidade.construcoes) + 31) // 32
+        assert armazem.carregar(manifestos(armazem)[0])[0]
+
+        # Objetos soltos (ex.: de uma queda no meio de um autosave) são removidos
+        (tmp_path / "objetos" / "ff").mkdir(exist_ok=True)
+        (tmp_path / "objetos" / "ff" / "ffff.tmp").write_bytes(b"x")
+        assert armazem.coletar_lixo() == 1
@@ -0,0 +1,171 @@
+"""
+Testes do banco de saves em SQLite
+"""
+
+import pytest
+import sys
+import os
+import sqlite3
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+import auxiliares
+from core.salvamento import GerenciadorSalvamento
+from core.banco_saves import BancoSaves, NOME_BANCO
+
+
+def criar_cidade(nome, dificuldade="Médio", ciclos=0):
+    return auxiliares.criar_cidade(nome, dificuldade, paineis=20, ciclovias=10, tecnologias=(), ciclos=ciclos)
+
+
+def salvar_com_data(banco, cidade, nome, data):
+    dados = banco.montar_dados_save(cidade)
+    dados['metadata']['data_salvamento'] = data
+    assert banco.gravar_save(dados, nome)[0]
+
+
+@pytest.fixture
+def banco(tmp_path):
+    banco = BancoSaves(str(tmp_path))
+    yield banco
+    banco.fechar()
+
+
+class TestBancoSaves:
+    """Testes de gravação, listagem e carregamento pelo banco"""
+
+    def test_salvar_e_carregar(self, banco, tmp_path):
+        cidade = criar_cidade("Alfa", ciclos=6)
+        sucesso, mensagem = banco.salvar_jogo(cidade)
+
+        assert sucesso and mensagem.endswith(".ecob")
+        assert not any(nome.endswith(('.json', '.ecob')) for nome in os.listdir(tmp_path))
+        saves = banco.listar_saves()
+        assert [(s['cidade'], s['tempo_jogo']) for s in saves] == [("Alfa", 6)]
+
+        sucesso, carregada, _ = banco.carregar_jogo(saves[0]['arquivo'])
+        assert sucesso
+        assert [(c.nome, c.nivel) for c in carregada.construcoes] == [(c.nome, c.nivel) for c in cidade.construcoes]
+        assert carregada.recursos.to_dict() == cidade.recursos.to_dict()
+
+    def test_nome_json_guarda_json(self, banco):
+        """O conteúdo segue a extensão do nome, como nos arquivos"""
+        cidade = criar_cidade("Beta")
+        banco.salvar_jogo(cidade, "beta.json")
+
+        sucesso, carregada, _ = banco.carregar_jogo("beta.json")
+        assert sucesso and len(carregada.construcoes) == len(cidade.construcoes)
+
+    def test_carrega_json_do_blob_em_pedacos(self, banco, monkeypatch):
+        """O BLOB é lido em pedaços pequenos, cortando caracteres de vários bytes"""
+        from core import carregamento
+        cidade = criar_cidade("São Ângelo ✓")
+        banco.salvar_jogo(cidade, "sao.json")
+        monkeypatch.setattr(carregamento, 'TAMANHO_LEITURA', 7)
+
+        sucesso, carregada, mensagem = banco.carregar_jogo("sao.json")
+        assert sucesso, mensagem
+        assert carregada.nome == cidade.nome
+        assert [(c.nome, c.nivel) for c in carregada.construcoes] == [(c.nome, c.nivel) for c in cidade.construcoes]
+
+    def test_salvar_de_novo_substitui(self, banco):
+        banco.salvar_jogo(criar_cidade("Alfa", ciclos=1), "alfa.ecob")
+        banco.salvar_jogo(criar_cidade("Alfa", ciclos=4), "alfa.ecob")
+
+        assert [s['tempo_jogo'] for s in banco.listar_saves()] == [4]
+
+    def test_segundo_plano(self, banco):
+        cidade = criar_cidade("Fundo")
+        assert banco.salvar_em_segundo_plano(cidade, "fundo.ecob")
+        assert banco.aguardar_salvamentos() == [(True, "Jogo salvo em fundo.ecob")]
+        assert banco.carregar_jogo("fundo.ecob")[0]
+
+    def test_deletar_e_inexistente(self, banco):
+        banco.salvar_jogo(criar_cidade("Alfa"), "alfa.ecob")
+
+        assert banco.deletar_save("alfa.ecob")[0]
+        assert not banco.deletar_save("alfa.ecob")[0]
+        sucesso, cidade, mensagem = banco.carregar_jogo("alfa.ecob")
+        assert not sucesso and cidade is None and "não encontrado" in mensagem
+
+    def test_persiste_entre_aberturas(self, tmp_path):
+        banco = BancoSaves(str(tmp_path))
+        banco.salvar_jogo(criar_cidade("Alfa"), "alfa.ecob")
+        banco.fechar()
+
+        reaberto = BancoSaves(str(tmp_path))
+        assert [s['arquivo'] for s in reaberto.listar_saves()] == ["alfa.ecob"]
+        reaberto.fechar()
+
+
+class TestConsultas:
+    """Testes de busca e poda"""
+
+    @pytest.fixture
+    def cheio(self, banco):
+        for i in range(6):
+            salvar_com_data(banco, criar_cidade("Alfa", "Fácil", ciclos=i), f"alfa_{i}.ecob",
+                            f"2024-01-0{i + 1}T10:00:00")
+        for i in range(3):
+            salvar_com_data(banco, criar_cidade("Beta", "Difícil", ciclos=10 + i), f"beta_{i}.ecob",
+                            f"2024-02-0{i + 1}T10:00:00")
+        return banco
+
+    def test_buscar_por_filtros(self, cheio):
+        assert [s['arquivo'] for s in cheio.buscar_saves(cidade="Beta")] == ["beta_2.ecob", "beta_1.ecob",
+                                                                             "beta_0.ecob"]
+        assert len(cheio.buscar_saves(dificuldade="Fácil", ciclo_minimo=3)) == 3
+        assert [s['arquivo'] for s in cheio.buscar_saves(desde="2024-01-05", ate="2024-02-01T23")] == [
+            "beta_0.ecob", "alfa_5.ecob", "alfa_4.ecob"]
+        assert [s['arquivo'] for s in cheio.buscar_saves(limite=1)] == ["beta_2.ecob"]
+
+    def test_consultas_usam_indices(self, cheio):
+        plano = " ".join(str(linha) for linha in cheio.conexao.execute(
+            "EXPLAIN QUERY PLAN SELECT arquivo FROM saves WHERE cidade = ? ORDER BY data_salvamento DESC",
+            ("Alfa",)))
+        assert "idx_saves_cidade_data" in plano and "TEMP B-TREE" not in plano
+
+    def test_podar_mantendo_os_mais_recentes(self, cheio):
+        assert cheio.podar_saves(manter_por_cidade=2) == 5
+
+        restantes = [s['arquivo'] for s in cheio.listar_saves()]
+        assert restantes == ["beta_2.ecob", "beta_1.ecob", "alfa_5.ecob", "alfa_4.ecob"]
+
+    def test_podar_por_data_e_cidade(self, cheio):
+        assert cheio.podar_saves(antes_de="2024-01-04", cidade="Alfa") == 3
+        assert cheio.podar_saves(antes_de="2030-01-01", manter_por_cidade=1) == 4
+        assert cheio.podar_saves() == 0
+        assert len(cheio.listar_saves()) == 2
+
+
+class TestMigracao:
+    """Testes da migração de uma pasta de saves"""
+
+    def test_migrar_pasta_json(self, tmp_path):
+        origem = tmp_path / "antigos"
+        pasta = GerenciadorSalvamento(str(origem))
+        cidades = [criar_cidade(f"Cidade {i}", ciclos=i) for i in range(3)]
+        for i, cidade in enumerate(cidades):
+            pasta.salvar_jogo(cidade, f"c{i}.json")
+        pasta.salvar_jogo(cidades[0], "binario.ecob")
+        (origem / "quebrado.json").write_text("{", encoding='utf-8')
+
+        banco = BancoSaves(str(tmp_path / "banco"))
+        resultados = banco.migrar_pasta(str(origem), remover_originais=True)
+
+        assert [(arquivo, sucesso) for arquivo, sucesso, _ in resultados] == [
+            ("binario.ecob", True), ("c0.json", True), ("c1.json", True), ("c2.json", True),
+            ("quebrado.json", False)]
+        assert sorted(s['arquivo'] for s in banco.listar_saves()) == ["binario.ecob", "c0.ecob", "c1.ecob",
+                                                                      "c2.ecob"]
+        sucesso, carregada, _ = banco.carregar_jogo("c2.ecob")
+        assert sucesso and carregada.populacao == cidades[2].populacao
+        assert sorted(os.listdir(origem)) == [".manifesto", "quebrado.json"]
+        banco.fechar()
+
+    def test_versao_futura(self, tmp_path):
+        conexao = sqlite3.connect(tmp_path / NOME_BANCO)
+        conexao.execute("PRAGMA user_version=99")
+        conexao.close()
+
+        with pytest.raises(ValueError, match="Versão"):
+            BancoSaves(str(tmp_path))
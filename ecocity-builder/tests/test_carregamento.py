@@ -0,0 +1,160 @@
+"""
+Testes do carregamento completo e em fluxo de saves
+"""
+
+import pytest
+import sys
+import os
+import io
+import json
+import pickle
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+import auxiliares
+from models.construcao import CATALOGO_CONSTRUCOES
+from core.salvamento import GerenciadorSalvamento
+from core.diario import DiarioSalvamento
+from core import carregamento
+from core.carregamento import FluxoJSON, ler_json_em_fluxo
+
+
+def criar_cidade(quantidade=400):
+    return auxiliares.criar_cidade("Carregada", "Fácil", paineis=quantidade, ciclovias=quantidade // 2, parques=1,
+                                   melhorar_a_cada=4, ciclos=15)
+
+
+def assert_mesma_cidade(carregada, original):
+    assert [(c.nome, c.nivel) for c in carregada.construcoes] == [(c.nome, c.nivel) for c in original.construcoes]
+    assert all(c.prototipo is CATALOGO_CONSTRUCOES[c.nome] for c in carregada.construcoes)
+    assert carregada.tecnologias_desbloqueadas == original.tecnologias_desbloqueadas
+    assert carregada.mascara_tecnologias == original.mascara_tecnologias
+    assert carregada.populacao == original.populacao
+    assert carregada.tempo_jogo == original.tempo_jogo
+    assert carregada.recursos.to_dict() == original.recursos.to_dict()
+    indice, esperado = carregada.indice.to_dict(), original.indice.to_dict()
+    for chave in ('total', 'por_tipo', 'por_nome', 'por_nivel', 'investimento_total'):
+        assert indice[chave] == esperado[chave]
+    assert indice['impacto_emissao'] == pytest.approx(esperado['impacto_emissao'])
+
+
+class TestCarregamento:
+    """Testes de carregar_jogo com reconstrução completa"""
+
+    @pytest.mark.parametrize("arquivo", ["cidade.json", "cidade.ecob"])
+    def test_reconstroi_construcoes_niveis_e_tecnologias(self, tmp_path, arquivo):
+        gerenciador = GerenciadorSalvamento(str(tmp_path))
+        cidade = criar_cidade()
+        gerenciador.salvar_jogo(cidade, arquivo)
+
+        sucesso, carregada, mensagem = gerenciador.carregar_jogo(arquivo)
+
+        assert sucesso, mensagem
+        assert_mesma_cidade(carregada, cidade)
+
+    def test_partida_continua_igual(self, tmp_path):
+        """Carregar e seguir jogando dá o mesmo resultado que não ter salvo"""
+        gerenciador = GerenciadorSalvamento(str(tmp_path))
+        cidade = criar_cidade()
+        gerenciador.salvar_jogo(cidade, "cidade.json")
+        _, carregada, _ = gerenciador.carregar_jogo("cidade.json")
+
+        for jogo in (cidade, carregada):
+            jogo.melhorar_construcao(1)
+            jogo.adicionar_construcao("Ciclovia")
+            for _ in range(50):
+                jogo.atualizar_estado()
+
+        assert carregada.populacao == cidade.populacao
+        assert carregada.recursos.dinheiro == pytest.approx(cidade.recursos.dinheiro)
+        assert carregada.construcoes[1].nivel == cidade.construcoes[1].nivel == 2
+        assert carregada.indice.to_dict()['por_nivel'] == cidade.indice.to_dict()['por_nivel']
+
+    def test_snapshot_de_diario(self, tmp_path):
+        gerenciador = GerenciadorSalvamento(str(tmp_path))
+        cidade = criar_cidade()
+        diario = DiarioSalvamento(gerenciador, cidade)
+        cidade.melhorar_construcao(2)
+        cidade.adicionar_construcao("Parque Eólico")
+        cidade.atualizar_estado()
+        diario.registrar(cidade)
+        diario.fechar()
+
+        sucesso, carregada, _ = gerenciador.carregar_jogo("Carregada_diario.json")
+
+        assert sucesso
+        assert_mesma_cidade(carregada, cidade)
+
+    def test_construcao_fora_do_catalogo(self, tmp_path):
+        """Registros desconhecidos são recriados com os valores do arquivo"""
+        gerenciador = GerenciadorSalvamento(str(tmp_path))
+        dados = gerenciador.montar_dados_save(criar_cidade(10))
+        registros = [{'nome': "Usina Lunar", 'tipo': "Energia Limpa", 'custo': 999,
+                      'impacto_emissao': -50, 'impacto_satisfacao': 1, 'nivel': 2},
+                     {'nome': "Horta Vertical", 'tipo': "Proteção Ambiental", 'custo': 225,
+                      'impacto_emissao': -16.9, 'impacto_satisfacao': 7.2, 'nivel': 3}]
+        dados['cidade']['construcoes'].extend(registros)
+        gerenciador.gravar_save(dados, "lunar.json")
+
+        _, carregada, _ = gerenciador.carregar_jogo("lunar.json")
+
+        assert [c.get_beneficios() for c in carregada.construcoes[-2:]] == registros
+        copias = pickle.loads(pickle.dumps(list(carregada.construcoes[-2:])))
+        assert [c.get_beneficios() for c in copias] == registros
+
+        # Registros iguais compartilham o protótipo
+        dados['cidade']['construcoes'].extend(registros * 50)
+        gerenciador.gravar_save(dados, "lunar.json")
+        _, carregada, _ = gerenciador.carregar_jogo("lunar.json")
+        assert len({id(c.prototipo) for c in carregada.construcoes if c.nome == "Usina Lunar"}) == 1
+
+        # Acima do nível salvo valem as regras de melhoria
+        lunar = carregada.construcoes[-2]
+        assert lunar.melhorar()
+        assert (lunar.custo, lunar.impacto_emissao) == (int(999 * 1.5), pytest.approx(-50 * 1.3))
+
+    def test_save_corrompido(self, tmp_path):
+        gerenciador = GerenciadorSalvamento(str(tmp_path))
+        gerenciador.salvar_jogo(criar_cidade(), "cidade.json")
+        caminho = tmp_path / "cidade.json"
+        caminho.write_bytes(caminho.read_bytes()[:5000])
+
+        sucesso, cidade, mensagem = gerenciador.carregar_jogo("cidade.json")
+        assert not sucesso and cidade is None
+        assert mensagem.startswith("Erro ao carregar")
+
+
+class TestFluxoJSON:
+    """Testes do leitor de JSON em fluxo"""
+
+    def test_igual_ao_json_load_com_leituras_pequenas(self, monkeypatch):
+        """Valores cortados entre leituras (números, strings, escapes) são remontados"""
+        documento = {
+            'cidade': {'nome': "São \"Paulo\" ✓", 'dificuldade': "Médio", 'populacao': 12345678901234567890,
+                       'tempo_jogo': 7,
+                       'construcoes': [{'nome': "Ciclovia", 'nivel': n % 3 + 1} for n in range(50)],
+                       'tecnologias_desbloqueadas': ["Energia Solar Avançada"]},
+            'recursos': {'dinheiro': 1.5e300, 'emissao_carbono': -0.000123, 'satisfacao_populacional': 70},
+            'metadata': {'vazio': {}, 'lista': [], 'nulo': None, 'verdade': True}
+        }
+        texto = json.dumps(documento, indent=2, ensure_ascii=False)
+        monkeypatch.setattr(carregamento, 'TAMANHO_LEITURA', 3)
+
+        dados, construcoes, indice = ler_json_em_fluxo(io.StringIO(texto))
+
+        esperado = json.loads(texto)
+        niveis = [registro['nivel'] for registro in esperado['cidade'].pop('construcoes')]
+        assert dados == esperado
+        assert [c.nivel for c in construcoes] == niveis
+        assert indice.total == 50
+
+    def test_memoria_limitada_pelo_bloco(self, monkeypatch):
+        """O buffer de texto nunca guarda o documento inteiro"""
+        texto = json.dumps({'itens': list(range(20000))})
+        monkeypatch.setattr(carregamento, 'TAMANHO_LEITURA', 1024)
+        fluxo = FluxoJSON(io.StringIO(texto))
+        maior = 0
+        for chave in fluxo.chaves():
+            for _ in fluxo.itens():
+                maior = max(maior, len(fluxo.buffer))
+
+        assert maior <= 2 * 1024
@@ -0,0 +1,275 @@
+"""
+Testes da classe Cidade
+"""
+
+import pytest
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from models.cidade import Cidade
+from models.lista_compartilhada import ListaCompartilhada
+from models.tecnologia import Tecnologia, TipoTecnologia
+
+
+def criar_cidade(satisfacao, populacao=100, construcoes=()):
+    cidade = Cidade("Teste")
+    for nome in construcoes:
+        cidade.adicionar_construcao(nome)
+    cidade.recursos.satisfacao_populacional = satisfacao
+    cidade.populacao = populacao
+    return cidade
+
+
+class TestAvancarCiclos:
+    """Testes do salto de tempo em forma fechada"""
+
+    @pytest.mark.parametrize("satisfacao", [0, 39, 40, 55, 70, 71, 100])
+    @pytest.mark.parametrize("populacao", [0, 1, 57, 99, 100, 101, 250, 12345])
+    def test_igual_a_atualizar_estado(self, satisfacao, populacao):
+        """O salto reproduz ciclo a ciclo, inclusive nas fronteiras 40 e 70"""
+        ciclos = 600
+        referencia = criar_cidade(satisfacao, populacao, ["Painel Solar"])
+        salto = criar_cidade(satisfacao, populacao, ["Painel Solar"])
+
+        for _ in range(ciclos):
+            referencia.atualizar_estado()
+        salto.avancar_ciclos(ciclos)
+
+        assert salto.populacao == referencia.populacao
+        assert salto.tempo_jogo == referencia.tempo_jogo
+        assert salto.recursos.dinheiro == pytest.approx(referencia.recursos.dinheiro, rel=1e-12)
+        assert salto.recursos.emissao_carbono == pytest.approx(referencia.recursos.emissao_carbono, rel=1e-12)
+
+    def test_declinio_ate_zero(self):
+        """Em crise prolongada a população chega a zero e permanece lá"""
+        cidade = criar_cidade(10, populacao=5000)
+        cidade.avancar_ciclos(10000)
+
+        assert cidade.populacao == 0
+        assert cidade.tempo_jogo == 10000
+
+    def test_regra_de_declinio_abaixo_de_cem(self):
+        """A forma fechada assume int(p * 0.99) == p - 1 para 1 <= p <= 100"""
+        assert all(int(p * 0.99) == p - 1 for p in range(1, 101))
+
+    def test_estouro_no_mesmo_ciclo(self):
+        """O salto estoura no mesmo ciclo que atualizar_estado, não antes"""
+        referencia = criar_cidade(90)
+        ciclos = 0
+        with pytest.raises(OverflowError):
+            while True:
+                referencia.atualizar_estado()
+                ciclos += 1
+
+        salto = criar_cidade(90)
+        salto.avancar_ciclos(ciclos)
+        assert salto.populacao == referencia.populacao
+        assert salto.recursos.dinheiro == referencia.recursos.dinheiro == float('inf')
+        with pytest.raises(OverflowError):
+            criar_cidade(90).avancar_ciclos(ciclos + 1)
+
+    def test_zero_ciclos(self):
+        cidade = criar_cidade(80)
+        cidade.avancar_ciclos(0)
+        assert cidade.tempo_jogo == 0
+        assert cidade.populacao == 100
+
+
+class TestIndiceConstrucoes:
+    """Testes dos agregados incrementais de construções"""
+
+    def test_agregados_iguais_a_varredura(self):
+        """O índice coincide com uma varredura completa da lista"""
+        from models.construcao import TipoConstrucao
+
+        cidade = Cidade("Índice", "Fácil")
+        cidade.recursos.dinheiro = 100000
+        for nome in ["Painel Solar", "Ciclovia", "Ciclovia", "Parque Público", "Parque Eólico"]:
+            cidade.adicionar_construcao(nome)
+        cidade.construcoes[1].melhorar()
+        cidade.construcoes[1].melhorar()
+        cidade.construcoes[0].melhorar()
+
+        indice = cidade.indice
+        assert indice.total == len(cidade.construcoes)
+        assert indice.contar_tipo(TipoConstrucao.TRANSPORTE) == 2
+        assert indice.contar_nome("Ciclovia") == 2
+        assert indice.contar_nivel(1) == 3
+        assert indice.contar_nivel(2) == 1
+        assert indice.contar_nivel(3) == 1
+        assert indice.impacto_emissao == pytest.approx(sum(c.impacto_emissao for c in cidade.construcoes))
+        assert indice.impacto_satisfacao == pytest.approx(sum(c.impacto_satisfacao for c in cidade.construcoes))
+        assert indice.investimento_total == 300 + 150 + 150 + 200 + 500
+
+    def test_reconstruir_indice(self):
+        cidade = Cidade("Índice")
+        cidade.adicionar_construcao("Ciclovia")
+        cidade.construcoes = cidade.construcoes * 3
+        cidade.reconstruir_indice()
+
+        assert cidade.indice.total == 3
+        assert cidade.get_estatisticas()['total_construcoes'] == 3
+
+
+class TestCatalogoConstrucoes:
+    """Testes do catálogo com protótipos compartilhados"""
+
+    def test_construcoes_compartilham_prototipo(self):
+        from models.construcao import CATALOGO_CONSTRUCOES
+
+        cidade = Cidade("Catálogo", "Fácil")
+        cidade.adicionar_construcao("Ciclovia")
+        cidade.adicionar_construcao("Ciclovia")
+
+        primeira, segunda = cidade.construcoes
+        assert primeira.prototipo is segunda.prototipo is CATALOGO_CONSTRUCOES["Ciclovia"]
+        assert not hasattr(primeira, "__dict__")
+
+    def test_melhoria_segue_regras_originais(self):
+        """Os valores por nível são os mesmos da melhoria passo a passo"""
+        from models.construcao import obter_prototipo, Construcao
+
+        construcao = Construcao.de_prototipo(obter_prototipo("Parque Eólico"))
+        custo, emissao, satisfacao = 500, -12, 3
+        while construcao.melhorar():
+            custo = int(custo * 1.5)
+            emissao *= 1.3
+            satisfacao *= 1.2
+            assert (construcao.custo, construcao.impacto_emissao, construcao.impacto_satisfacao) == (custo, emissao, satisfacao)
+        assert construcao.nivel == 3
+
+    def test_prototipo_imutavel(self):
+        from models.construcao import obter_prototipo
+
+        with pytest.raises(AttributeError):
+            obter_prototipo("Ciclovia").custo = 1
+        assert obter_prototipo("Castelo") is None
+
+
+class TestConstrucaoEmLote:
+    """Testes da API transacional de construção em lote"""
+
+    def test_lote_igual_a_construcoes_individuais(self):
+        pedidos = [("Painel Solar", 3), ("Parque Público", 5), ("Ciclovia", 2)]
+        lote = Cidade("Lote", "Fácil")
+        lote.recursos.dinheiro = 10000
+        individual = Cidade("Individual", "Fácil")
+        individual.recursos.dinheiro = 10000
+
+        sucesso, relatorio = lote.construir_em_lote(pedidos)
+        for nome, quantidade in pedidos:
+            for _ in range(quantidade):
+                individual.adicionar_construcao(nome)
+
+        assert sucesso
+        assert [item['custo'] for item in relatorio] == [900, 1000, 300]
+        assert lote.get_estatisticas() == {**individual.get_estatisticas(), 'nome': "Lote"}
+        assert lote.indice.to_dict() == individual.indice.to_dict()
+
+    def test_recursos_insuficientes_desfaz_tudo(self):
+        cidade = Cidade("Lote")
+        sucesso, relatorio = cidade.construir_em_lote([("Painel Solar", 2), ("Parque Eólico", 1)])
+
+        assert not sucesso
+        assert all(not item['sucesso'] for item in relatorio)
+        assert "Recursos insuficientes" in relatorio[0]['mensagem']
+        assert cidade.recursos.dinheiro == 1000
+        assert cidade.construcoes == []
+        assert cidade.indice.total == 0
+
+    def test_pedido_invalido_cancela_lote(self):
+        cidade = Cidade("Lote", "Fácil")
+        sucesso, relatorio = cidade.construir_em_lote([("Ciclovia", 1), ("Transporte Elétrico", 1), ("Castelo", 1)])
+
+        assert not sucesso
+        assert relatorio[0]['mensagem'] == "Cancelado: outro pedido do lote falhou"
+        assert relatorio[1]['mensagem'] == "Tecnologia Eletrificação necessária"
+        assert relatorio[2]['mensagem'] == "Construção não encontrada"
+        assert cidade.indice.total == 0
+
+
+class TestBifurcacao:
+    """Testes das bifurcações com cópia na escrita"""
+
+    def criar_cidade_grande(self, quantidade=1000):
+        cidade = Cidade("Original", "Fácil")
+        cidade.recursos.dinheiro = 10 ** 9
+        cidade.construir_em_lote([("Painel Solar", quantidade)])
+        return cidade
+
+    def test_bifurcacao_nao_altera_original(self):
+        """Construir, melhorar e avançar na cópia não muda a original"""
+        original = self.criar_cidade_grande()
+        antes = original.get_estatisticas()
+
+        copia = original.bifurcar()
+        copia.adicionar_construcao("Parque Eólico")
+        copia.melhorar_construcao(0)
+        copia.avancar_ciclos(50)
+
+        assert original.get_estatisticas() == antes
+        assert original.construcoes[0].nivel == 1
+        assert original.indice.contar_nivel(2) == 0
+        assert copia.construcoes[0].nivel == 2
+        assert copia.indice.contar_nivel(2) == 1
+        assert len(copia.construcoes) == len(original.construcoes) + 1
+
+    def test_original_nao_altera_bifurcacao(self):
+        """Melhorias na original depois da bifurcação não vazam para a cópia"""
+        original = self.criar_cidade_grande(10)
+        copia = original.bifurcar()
+        original.melhorar_construcao(3)
+        original.adicionar_construcao("Ciclovia")
+
+        assert copia.construcoes[3].nivel == 1
+        assert len(copia.construcoes) == 10
+        assert original.construcoes[3].nivel == 2
+
+    def test_bifurcacao_compartilha_construcoes(self):
+        """As construções não alteradas são os mesmos objetos"""
+        original = self.criar_cidade_grande(100)
+        copia = original.bifurcar()
+        copia.melhorar_construcao(0)
+
+        assert copia.construcoes[1] is original.construcoes[1]
+        assert copia.construcoes[0] is not original.construcoes[0]
+
+    def test_previsao_igual_a_jogar(self):
+        """A previsão em uma bifurcação é igual a jogar na própria cidade"""
+        original = self.criar_cidade_grande(20)
+        copia = original.bifurcar()
+        copia.adicionar_construcao("Ciclovia")
+        copia.avancar_ciclos(50)
+
+        original.adicionar_construcao("Ciclovia")
+        original.avancar_ciclos(50)
+
+        assert copia.get_estatisticas() == original.get_estatisticas()
+
+    def test_pesquisa_na_bifurcacao_nao_altera_tecnologia(self):
+        """Pesquisas de uma previsão não marcam o objeto Tecnologia"""
+        tecnologia = Tecnologia("Teste", TipoTecnologia.ENERGIA, 100, 5, beneficios={'reducao_emissao': -10})
+        original = Cidade("Original")
+        copia = original.bifurcar()
+        copia.pesquisas.enfileirar(tecnologia)
+        copia.avancar_ciclos(10)
+
+        assert copia.tecnologia_desbloqueada("Teste")
+        assert not original.tecnologia_desbloqueada("Teste")
+        assert not tecnologia.desbloqueada and not tecnologia.pesquisando
+
+    def test_lista_compartilhada(self):
+        """Operações de lista respeitam a cópia na escrita"""
+        lista = ListaCompartilhada([1, 2, 3])
+        copia = lista.bifurcar()
+        copia.append(4)
+        copia[0] = 10
+        del lista[1:]
+
+        assert lista == [1]
+        assert copia == [10, 2, 3, 4]
+        assert copia[-1] == 4
+        assert copia[1:3] == [2, 3]
+        assert copia.pop() == 4
+        assert list(copia) == [10, 2, 3]
@@ -0,0 +1,97 @@
+"""
+Testes do diário de saves (snapshot + log de alterações)
+"""
+
+import pytest
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from models.cidade import Cidade
+from core.salvamento import GerenciadorSalvamento
+from core.diario import DiarioSalvamento, carregar_dados_diario, segmentos_diario, caminho_segmento
+from auxiliares import sem_data
+
+
+def jogar(cidade, diario, ciclos, inicio=0):
+    for ciclo in range(inicio, inicio + ciclos):
+        if ciclo % 7 == 0:
+            cidade.adicionar_construcao("Ciclovia" if ciclo % 2 else "Painel Solar")
+        if ciclo % 25 == 3 and len(cidade.construcoes):
+            cidade.melhorar_construcao(0)
+        if ciclo == 10:
+            cidade.desbloquear_tecnologia("Energia Solar Avançada")
+        cidade.atualizar_estado()
+        diario.registrar(cidade)
+
+
+class TestDiarioSalvamento:
+    """Testes do DiarioSalvamento"""
+
+    def test_snapshot_mais_diario_igual_ao_save_completo(self, tmp_path):
+        gerenciador = GerenciadorSalvamento(str(tmp_path))
+        cidade = Cidade("Diário")
+        diario = DiarioSalvamento(gerenciador, cidade, entradas_por_compactacao=10**6)
+        jogar(cidade, diario, 120)
+        diario.fechar()
+
+        assert sem_data(carregar_dados_diario(gerenciador, "Diário")) == \
+            sem_data(gerenciador.montar_dados_save(cidade))
+
+    def test_compactacao_apaga_segmentos_cobertos(self, tmp_path):
+        gerenciador = GerenciadorSalvamento(str(tmp_path))
+        cidade = Cidade("Diário")
+        diario = DiarioSalvamento(gerenciador, cidade, entradas_por_compactacao=40)
+        jogar(cidade, diario, 100)
+        assert diario.aguardar_compactacao()[0]
+        jogar(cidade, diario, 5, inicio=100)
+        diario.fechar()
+
+        # Duas compactações (40 e 80 entradas): só o segmento atual sobra
+        assert segmentos_diario(str(tmp_path), "Diário") == [diario.segmento]
+        assert sem_data(carregar_dados_diario(gerenciador, "Diário")) == \
+            sem_data(gerenciador.montar_dados_save(cidade))
+
+    def test_carregar_jogo_aplica_o_diario(self, tmp_path):
+        """O snapshot aparece na lista de saves e carregar_jogo chega ao estado atual"""
+        gerenciador = GerenciadorSalvamento(str(tmp_path))
+        cidade = Cidade("Diário")
+        diario = DiarioSalvamento(gerenciador, cidade)
+        jogar(cidade, diario, 60)
+        diario.fechar()
+
+        assert "Diário_diario.json" in [save['arquivo'] for save in gerenciador.listar_saves()]
+        sucesso, carregada, _ = gerenciador.carregar_jogo("Diário_diario.json")
+        assert sucesso
+        assert carregada.tempo_jogo == cidade.tempo_jogo
+        assert carregada.recursos.to_dict() == cidade.recursos.to_dict()
+        assert carregada.tecnologias_desbloqueadas == cidade.tecnologias_desbloqueadas
+
+    def test_linha_incompleta_ignorada(self, tmp_path):
+        """Uma queda no meio da escrita perde no máximo a última entrada"""
+        gerenciador = GerenciadorSalvamento(str(tmp_path))
+        cidade = Cidade("Diário")
+        diario = DiarioSalvamento(gerenciador, cidade)
+        jogar(cidade, diario, 30)
+        diario.fechar()
+        with open(caminho_segmento(str(tmp_path), "Diário", diario.segmento), 'a', encoding='utf-8') as f:
+            f.write('{"t":31,"p":')
+
+        assert carregar_dados_diario(gerenciador, "Diário")['cidade']['tempo_jogo'] == 30
+
+    def test_entrada_nao_cresce_com_a_cidade(self, tmp_path):
+        """O que vai para o diário a cada ciclo depende do que mudou, não do tamanho da cidade"""
+        gerenciador = GerenciadorSalvamento(str(tmp_path))
+        cidade = Cidade("Grande")
+        cidade.recursos.dinheiro = 10**9
+        cidade.construir_em_lote([("Painel Solar", 5000)])
+        diario = DiarioSalvamento(gerenciador, cidade, entradas_por_compactacao=10**6)
+        caminho = caminho_segmento(str(tmp_path), "Grande", diario.segmento)
+
+        for _ in range(10):
+            cidade.atualizar_estado()
+            diario.registrar(cidade)
+        diario.fechar()
+
+        assert os.path.getsize(caminho) < 10 * 200
+        assert os.path.getsize(tmp_path / "Grande_diario.json") > 5000 * 50
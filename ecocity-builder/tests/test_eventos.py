@@ -0,0 +1,232 @@
+"""
+Testes dos eventos climáticos e do sorteio pré-amostrado
+"""
+
+import pytest
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from models.base import Recurso
+from models.eventos import (GerenteEventos, EventoClimatico, TipoEvento, EFEITOS_EVENTOS,
+                            somar_efeitos)
+
+
+class CidadeFalsa:
+    def __init__(self, emissao=50):
+        self.recursos = Recurso(10000, emissao, 70)
+
+
+def horarios_eventos(gerente, cidade, duracao, passo):
+    """Instantes em que verificar_evento dispara, chamando a cada ``passo``"""
+    horarios = []
+    chamadas = int(duracao / passo)
+    for i in range(chamadas + 1):
+        tempo = i * passo
+        if gerente.verificar_evento(cidade, tempo):
+            horarios.append(tempo)
+    return horarios
+
+
+class TestGerenteEventos:
+    """Testes do GerenteEventos"""
+
+    def test_independente_da_frequencia_de_chamada(self):
+        """Chamar por ciclo ou por quadro gera os mesmos eventos"""
+        por_ciclo = horarios_eventos(GerenteEventos(semente=7), CidadeFalsa(), 5000, 1)
+        por_quadro = horarios_eventos(GerenteEventos(semente=7), CidadeFalsa(), 5000, 0.25)
+
+        assert len(por_ciclo) > 0
+        assert por_ciclo == por_quadro
+
+    def test_respeita_tempo_entre_eventos(self):
+        """Dois eventos nunca ocorrem a menos de tempo_entre_eventos"""
+        horarios = horarios_eventos(GerenteEventos(semente=3), CidadeFalsa(), 20000, 1)
+
+        assert len(horarios) > 1
+        assert horarios[0] >= 120
+        for anterior, atual in zip(horarios, horarios[1:]):
+            assert atual - anterior >= 120
+
+    def test_taxa_media(self):
+        """O intervalo médio é o tempo mínimo mais a espera geométrica"""
+        gerente = GerenteEventos(semente=11)
+        esperas = []
+        for _ in range(4000):
+            gerente.tempo_ultimo_evento = 0
+            esperas.append(gerente.sortear_proximo_evento(0, 0) - 120)
+
+        media = sum(esperas) / len(esperas)
+        # Falhas antes do sucesso: (1 - p) / p = 99
+        assert media == pytest.approx(99, rel=0.1)
+
+    def test_faixa_de_emissao_maior_aumenta_frequencia(self):
+        """Acima de 100 de emissão os eventos são mais frequentes que acima de 70"""
+        assert GerenteEventos.calcular_faixa_emissao(50) == 0
+        assert GerenteEventos.calcular_faixa_emissao(80) == 1
+        assert GerenteEventos.calcular_faixa_emissao(150) == 2
+
+        media = {}
+        for faixa in range(3):
+            gerente = GerenteEventos(semente=5)
+            esperas = [gerente.sortear_proximo_evento(0, faixa) - 120 for _ in range(3000)]
+            media[faixa] = sum(esperas) / len(esperas)
+        assert media[0] > media[1] > media[2]
+
+    def test_resorteia_quando_faixa_muda(self):
+        """Mudar a faixa de emissão sorteia um novo instante"""
+        gerente = GerenteEventos(semente=1)
+        cidade = CidadeFalsa(emissao=50)
+        gerente.verificar_evento(cidade, 0)
+        assert gerente.faixa_emissao == 0
+
+        cidade.recursos.emissao_carbono = 120
+        gerente.verificar_evento(cidade, 10)
+        assert gerente.faixa_emissao == 2
+        assert gerente.proximo_evento >= 120
+
+    def test_sem_evento_enquanto_ha_evento_ativo(self):
+        """Não sorteia novo evento enquanto o atual está ativo"""
+        gerente = GerenteEventos(semente=2)
+        cidade = CidadeFalsa()
+        gerente.proximo_evento = 0
+        gerente.faixa_emissao = 0
+        evento = gerente.verificar_evento(cidade, 200)
+        gerente.agendar_evento(evento)
+        gerente.atualizar(cidade, 1)
+
+        assert gerente.verificar_evento(cidade, 10000) is None
+
+    def test_mesma_semente_mesmos_eventos(self):
+        """O gerente usa seu próprio gerador, então a semente reproduz os eventos"""
+        a = GerenteEventos(semente=9)
+        b = GerenteEventos(semente=9)
+        a.proximo_evento = b.proximo_evento = 0
+        a.faixa_emissao = b.faixa_emissao = 0
+        evento_a = a.verificar_evento(CidadeFalsa(), 200)
+        evento_b = b.verificar_evento(CidadeFalsa(), 200)
+
+        assert evento_a.tipo == evento_b.tipo
+        assert evento_a.duracao == evento_b.duracao
+        assert isinstance(evento_a, EventoClimatico)
+        assert evento_a.tipo in TipoEvento
+
+
+class TestEfeitosEventos:
+    """Testes da tabela de efeitos e dos eventos simultâneos"""
+
+    def test_efeitos_vem_da_tabela(self):
+        """Os efeitos de cada tipo são a tabela multiplicada pela intensidade"""
+        for tipo, (dinheiro, satisfacao, emissao) in EFEITOS_EVENTOS.items():
+            evento = EventoClimatico(tipo, 1.5)
+            assert evento.efeitos['dinheiro'] == pytest.approx(dinheiro * 1.5)
+            assert evento.efeitos['satisfacao'] == pytest.approx(satisfacao * 1.5)
+            assert evento.efeitos['emissao'] == pytest.approx(emissao * 1.5)
+            assert evento.efeitos['descricao']
+
+    def test_ativar_aplica_efeitos(self):
+        """ativar continua aplicando o impacto e os limites"""
+        cidade = CidadeFalsa()
+        cidade.recursos.satisfacao_populacional = 10
+        EventoClimatico(TipoEvento.INUNDACAO).ativar(cidade)
+
+        assert cidade.recursos.dinheiro == 9800
+        assert cidade.recursos.satisfacao_populacional == 0
+        assert cidade.recursos.emissao_carbono == 60
+
+    def test_eventos_simultaneos_somados(self):
+        """Centenas de eventos no mesmo ciclo aplicam a soma dos efeitos"""
+        cidade = CidadeFalsa()
+        cidade.recursos.dinheiro = 10_000_000
+        gerente = GerenteEventos(semente=4)
+        tipos = list(TipoEvento)
+        eventos = [EventoClimatico(tipos[i % len(tipos)], 1 + (i % 3) * 0.25, gerente.rng)
+                   for i in range(600)]
+        for evento in eventos:
+            gerente.agendar_evento(evento)
+
+        esperado = [0, 0, 0]
+        for evento in eventos:
+            for i, valor in enumerate(evento.vetor_efeitos()):
+                esperado[i] += valor
+
+        ativados, finalizados = gerente.atualizar(cidade, 1)
+
+        assert len(ativados) == 600
+        assert finalizados == []
+        assert all(evento.ativo for evento in eventos)
+        assert somar_efeitos(eventos) == pytest.approx(tuple(esperado))
+        assert cidade.recursos.dinheiro == pytest.approx(10_000_000 + esperado[0])
+        assert cidade.recursos.emissao_carbono == pytest.approx(50 + esperado[2])
+        assert cidade.recursos.satisfacao_populacional == 0
+
+    def test_eventos_sobrepostos_terminam_separadamente(self):
+        """Cada evento ativo termina na sua própria duração"""
+        cidade = CidadeFalsa()
+        gerente = GerenteEventos()
+        curto = EventoClimatico(TipoEvento.GEADA)
+        longo = EventoClimatico(TipoEvento.SECA)
+        curto.duracao, longo.duracao = 20, 50
+        gerente.agendar_evento(curto)
+        gerente.agendar_evento(longo)
+        gerente.atualizar(cidade, 0)
+
+        assert gerente.atualizar(cidade, 10) == ([], [])
+        assert [e.tempo_restante for e in gerente.get_eventos_ativos()] == [10, 40]
+
+        _, finalizados = gerente.atualizar(cidade, 10)
+        assert finalizados == [curto]
+        assert not curto.ativo and longo.ativo
+
+        _, finalizados = gerente.atualizar(cidade, 30)
+        assert finalizados == [longo]
+        assert gerente.get_eventos_ativos() == []
+
+    def test_limite_de_eventos_sorteados(self):
+        """Com max_eventos_ativos maior, o sorteio continua com evento ativo"""
+        cidade = CidadeFalsa()
+        gerente = GerenteEventos(semente=6)
+        gerente.agendar_evento(EventoClimatico(TipoEvento.SECA))
+        gerente.atualizar(cidade, 0)
+        gerente.proximo_evento = 0
+        gerente.faixa_emissao = 0
+
+        assert gerente.verificar_evento(cidade, 200) is None
+
+        gerente.max_eventos_ativos = 5
+        assert gerente.verificar_evento(cidade, 200) is not None
+
+    def test_limite_conta_evento_ativado_diretamente(self):
+        """Um evento ativado com ativar() (fluxo de main.py) conta para o limite"""
+        cidade = CidadeFalsa()
+        gerente = GerenteEventos(semente=6)
+        gerente.proximo_evento = 0
+        gerente.faixa_emissao = 0
+        evento = gerente.verificar_evento(cidade, 200)
+        evento.ativar(cidade)
+
+        assert gerente.quantidade_eventos_ativos() == 1
+        gerente.proximo_evento = 0
+        assert gerente.verificar_evento(cidade, 400) is None
+
+        gerente.max_eventos_ativos = 2
+        assert gerente.verificar_evento(cidade, 400) is not None
+
+    def test_varios_eventos_sorteados_ativos(self):
+        """Eventos sorteados se sobrepõem até max_eventos_ativos"""
+        cidade = CidadeFalsa(emissao=120)
+        cidade.recursos.dinheiro = 10**9
+        gerente = GerenteEventos(semente=3)
+        gerente.max_eventos_ativos = 5
+        gerente.tempo_entre_eventos = 0
+        gerente.probabilidade_base = 0.2
+        maximo = 0
+        for tempo in range(2000):
+            evento = gerente.verificar_evento(cidade, tempo)
+            if evento:
+                gerente.agendar_evento(evento)
+            gerente.atualizar(cidade, 1)
+            cidade.recursos.emissao_carbono = 120
+            maximo = max(maximo, len(gerente.get_eventos_ativos()))
+
+        assert maximo == 5
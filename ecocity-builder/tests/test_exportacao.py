@@ -0,0 +1,98 @@
+"""
+Testes da exportação em fluxo do histórico por ciclo
+"""
+
+import pytest
+import sys
+import os
+import csv
+import numpy as np
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from models.cidade import Cidade
+from models.construcao import TipoConstrucao
+from core.sessao import SessaoJogo
+from core.replay import RegistroComandos, reproduzir
+from core.exportacao import ExportadorHistorico, COLUNAS
+
+
+def exportar_partida(pasta, ciclos, tamanho_bloco, **kwargs):
+    exportador = ExportadorHistorico(pasta, tamanho_bloco=tamanho_bloco, **kwargs)
+    sessao = SessaoJogo(Cidade("Exportada"), semente=3, exportador=exportador)
+    plano = [(ciclo, 'construir', "Painel Solar" if ciclo % 2 else "Ciclovia") for ciclo in range(0, ciclos, 10)]
+    with exportador:
+        sessao.jogar(plano, ciclos)
+    return exportador, sessao
+
+
+class TestExportadorHistorico:
+    """Testes do ExportadorHistorico"""
+
+    def test_colunas_npy_legiveis_pelo_numpy(self, tmp_path):
+        """Cada coluna é um .npy com uma linha por ciclo, mesmo com blocos parciais"""
+        exportador, sessao = exportar_partida(tmp_path, 1234, tamanho_bloco=100)
+        cidade = sessao.cidade
+
+        assert exportador.linhas == 1234
+        for nome, _ in COLUNAS:
+            coluna = np.load(tmp_path / f"{nome}.npy")
+            assert coluna.shape == (1234,)
+
+        tempos = np.load(tmp_path / "tempo_jogo.npy")
+        assert tempos.dtype == np.int64
+        assert list(tempos[:3]) == [1, 2, 3]
+        assert np.load(tmp_path / "dinheiro.npy")[-1] == cidade.recursos.dinheiro
+        assert np.load(tmp_path / "total_construcoes.npy")[-1] == len(cidade.construcoes)
+        assert np.load(tmp_path / "construcoes_energia.npy")[-1] == \
+            cidade.indice.contar_tipo(TipoConstrucao.ENERGIA)
+
+    def test_csv_igual_aos_npy(self, tmp_path):
+        """O CSV traz as mesmas linhas que as colunas binárias"""
+        exportar_partida(tmp_path, 300, tamanho_bloco=64)
+
+        with open(tmp_path / "historico.csv", newline='', encoding='utf-8') as f:
+            linhas = list(csv.reader(f))
+
+        assert linhas[0] == [nome for nome, _ in COLUNAS]
+        assert len(linhas) == 301
+        for i, (nome, _) in enumerate(COLUNAS):
+            coluna = np.load(tmp_path / f"{nome}.npy")
+            assert [float(linha[i]) for linha in linhas[1:]] == coluna.tolist()
+
+    def test_memoria_constante(self, tmp_path):
+        """Os buffers nunca passam do tamanho do bloco"""
+        exportador = ExportadorHistorico(tmp_path, tamanho_bloco=50, gravar_csv=False)
+        cidade = Cidade("Buffers")
+        maior = 0
+        for _ in range(1000):
+            cidade.atualizar_estado()
+            exportador.registrar(cidade)
+            maior = max(maior, len(exportador.buffers[0]))
+        exportador.fechar()
+
+        assert maior < 50
+        assert exportador.linhas == 1000
+        assert not (tmp_path / "historico.csv").exists()
+        assert len(np.load(tmp_path / "populacao.npy", mmap_mode='r')) == 1000
+
+    def test_exportar_reproducao(self, tmp_path):
+        """Uma partida gravada pode ser exportada ao ser reproduzida, sem interface"""
+        registro = RegistroComandos()
+        sessao = SessaoJogo(Cidade("Gravada"), semente=8, registro=registro)
+        sessao.jogar([(0, 'construir', "Parque Eólico"), (20, 'construir', "Ciclovia")], 200)
+
+        with ExportadorHistorico(tmp_path / "reproducao") as exportador:
+            reproduzir(registro, exportador)
+
+        emissoes = np.load(tmp_path / "reproducao" / "emissao_carbono.npy")
+        assert len(emissoes) == 200
+        assert emissoes[-1] == sessao.cidade.recursos.emissao_carbono
+
+    def test_fechado_nao_aceita_linhas(self, tmp_path):
+        exportador = ExportadorHistorico(tmp_path)
+        exportador.fechar()
+        exportador.fechar()
+
+        with pytest.raises(ValueError):
+            exportador.registrar(Cidade("Fechada"))
+        assert len(np.load(tmp_path / "satisfacao.npy")) == 0
@@ -0,0 +1,140 @@
+"""
+Testes do formato binário de save e do conversor de pastas
+"""
+
+import pytest
+import sys
+import os
+import io
+import json
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+import auxiliares
+from auxiliares import sem_data
+from core.salvamento import GerenciadorSalvamento
+from core.formato_binario import (LeitorBinario, CABECALHO, ler_dados_binario, ler_metadados_binario,
+                                  converter_pasta)
+
+
+def criar_cidade(nome="Binária", quantidade=300):
+    return auxiliares.criar_cidade(nome, paineis=quantidade, parques=7, melhorar_a_cada=5, ciclos=12)
+
+
+def ler_bytes(bruto):
+    leitor = LeitorBinario(io.BytesIO(bruto))
+    for _ in leitor.blocos():
+        pass
+
+
+class TestFormatoBinario:
+    """Testes de leitura e escrita do .ecob"""
+
+    @pytest.mark.parametrize("comprimir", [True, False])
+    def test_ida_e_volta_igual_ao_json(self, tmp_path, comprimir):
+        gerenciador = GerenciadorSalvamento(str(tmp_path), comprimir=comprimir)
+        cidade = criar_cidade()
+        gerenciador.salvar_jogo(cidade, "cidade.json")
+        gerenciador.salvar_jogo(cidade, "cidade.ecob")
+
+        with open(tmp_path / "cidade.json", encoding='utf-8') as f:
+            do_json = json.load(f)
+        do_binario = ler_dados_binario(tmp_path / "cidade.ecob")
+
+        assert sem_data(do_binario) == sem_data(do_json)
+        assert os.path.getsize(tmp_path / "cidade.ecob") < os.path.getsize(tmp_path / "cidade.json") / 10
+
+    def test_blocos_de_tamanho_fixo(self, tmp_path):
+        """Registros saem em arrays por bloco, sem um dicionário por construção"""
+        cidade = criar_cidade(quantidade=3000)
+        GerenciadorSalvamento(str(tmp_path), formato='binario').salvar_jogo(cidade, "c.ecob")
+
+        with open(tmp_path / "c.ecob", 'rb') as f:
+            leitor = LeitorBinario(f)
+            blocos = list(leitor.blocos())
+
+        assert leitor.total == len(cidade.construcoes)
+        niveis = [nivel for _, bloco in blocos for nivel in bloco]
+        assert niveis == [construcao.nivel for construcao in cidade.construcoes]
+        assert all(bloco.itemsize == 1 for _, bloco in blocos)
+
+    def test_metadados_sem_ler_construcoes(self, tmp_path):
+        gerenciador = GerenciadorSalvamento(str(tmp_path))
+        cidade = criar_cidade()
+        gerenciador.salvar_jogo(cidade, "c.ecob")
+
+        dados = ler_metadados_binario(tmp_path / "c.ecob")
+        assert dados['cidade']['nome'] == "Binária"
+        assert dados['cidade']['populacao'] == cidade.populacao
+        assert dados['cidade']['construcoes'] == []
+
+    def test_versao_e_truncamento(self, tmp_path):
+        gerenciador = GerenciadorSalvamento(str(tmp_path))
+        gerenciador.salvar_jogo(criar_cidade(), "c.ecob")
+        bruto = (tmp_path / "c.ecob").read_bytes()
+
+        with pytest.raises(ValueError):
+            ler_bytes(bruto[:len(bruto) // 2])
+
+        futura = bytearray(bruto)
+        futura[4:6] = (99).to_bytes(2, 'little')
+        with pytest.raises(ValueError, match="Versão"):
+            ler_bytes(bytes(futura))
+
+        with pytest.raises(ValueError):
+            ler_bytes(b'{"cidade": {}}' + b' ' * CABECALHO.size)
+
+    def test_gerenciador_lista_e_carrega_binarios(self, tmp_path):
+        gerenciador = GerenciadorSalvamento(str(tmp_path), formato='binario')
+        cidade = criar_cidade()
+        sucesso, mensagem = gerenciador.salvar_jogo(cidade)
+
+        assert sucesso and mensagem.endswith(".ecob")
+        saves = gerenciador.listar_saves()
+        assert [save['cidade'] for save in saves] == ["Binária"]
+
+        sucesso, carregada, _ = gerenciador.carregar_jogo(saves[0]['arquivo'])
+        assert sucesso
+        assert carregada.recursos.to_dict() == cidade.recursos.to_dict()
+        assert carregada.tecnologias_desbloqueadas == cidade.tecnologias_desbloqueadas
+
+    def test_segundo_plano_em_binario(self, tmp_path):
+        gerenciador = GerenciadorSalvamento(str(tmp_path), formato='binario')
+        cidade = criar_cidade()
+        gerenciador.salvar_em_segundo_plano(cidade, "fundo.ecob")
+        assert gerenciador.aguardar_salvamentos()[0][0]
+
+        assert len(ler_dados_binario(tmp_path / "fundo.ecob")['cidade']['construcoes']) == len(cidade.construcoes)
+
+    def test_formato_desconhecido(self, tmp_path):
+        with pytest.raises(ValueError):
+            GerenciadorSalvamento(str(tmp_path), formato='xml')
+
+
+class TestConversor:
+    """Testes da conversão de uma pasta de saves JSON"""
+
+    def test_converter_pasta_em_paralelo(self, tmp_path):
+        origem = tmp_path / "json"
+        gerenciador = GerenciadorSalvamento(str(origem))
+        for i in range(5):
+            gerenciador.salvar_jogo(criar_cidade(f"Cidade {i}", 50 * (i + 1)), f"c{i}.json")
+        (origem / "quebrado.json").write_text("{", encoding='utf-8')
+
+        resultados = converter_pasta(str(origem), str(tmp_path / "bin"), workers=2)
+
+        assert [arquivo for arquivo, _, _ in resultados] == ["c0.json", "c1.json", "c2.json", "c3.json",
+                                                             "c4.json", "quebrado.json"]
+        assert [sucesso for _, sucesso, _ in resultados] == [True] * 5 + [False]
+        for i in range(5):
+            with open(origem / f"c{i}.json", encoding='utf-8') as f:
+                assert ler_dados_binario(tmp_path / "bin" / f"c{i}.ecob") == json.load(f)
+        assert not any(nome.endswith(".tmp") for nome in os.listdir(tmp_path / "bin"))
+
+    def test_remover_originais_e_listar(self, tmp_path):
+        gerenciador = GerenciadorSalvamento(str(tmp_path))
+        gerenciador.salvar_jogo(criar_cidade("A"), "a.json")
+        gerenciador.salvar_jogo(criar_cidade("B"), "b.json")
+
+        converter_pasta(str(tmp_path), workers=1, remover_originais=True)
+
+        assert sorted(save['arquivo'] for save in gerenciador.listar_saves()) == ["a.ecob", "b.ecob"]
@@ -0,0 +1,198 @@
+"""
+Testes do histórico de métricas da cidade
+"""
+
+import pytest
+import sys
+import os
+import math
+import time
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from models.cidade import Cidade
+from models.historico import SerieCircular, HistoricoCidade, reduzir_lttb
+
+
+class TestSerieCircular:
+    """Testes da SerieCircular"""
+
+    def test_ultimos_valores_em_ordem(self):
+        """Antes e depois de dar a volta, os últimos valores saem em ordem"""
+        serie = SerieCircular(5)
+        for valor in range(3):
+            serie.adicionar(valor)
+        assert list(serie.ultimos()) == [0, 1, 2]
+
+        for valor in range(3, 12):
+            serie.adicionar(valor)
+        assert list(serie.ultimos()) == [7, 8, 9, 10, 11]
+        assert list(serie.ultimos(2)) == [10, 11]
+        assert serie.ultimo() == 11
+        assert serie.total == 12
+        assert len(serie) == 5
+
+    def test_leitura_sem_copia(self):
+        """ultimos devolve uma visão do array, sem copiar"""
+        serie = SerieCircular(4)
+        for valor in range(6):
+            serie.adicionar(valor)
+        visao = serie.ultimos()
+
+        assert isinstance(visao, memoryview)
+        assert visao.obj is serie.dados
+
+    def test_memoria_limitada(self):
+        """O array não cresce com o número de valores"""
+        serie = SerieCircular(100)
+        tamanho = len(serie.dados)
+        for valor in range(10000):
+            serie.adicionar(valor)
+
+        assert len(serie.dados) == tamanho == 200
+        assert list(serie.ultimos(3)) == [9997, 9998, 9999]
+
+
+class TestHistoricoCidade:
+    """Testes do histórico alimentado pela Cidade"""
+
+    def test_atualizar_estado_registra_cada_ciclo(self):
+        cidade = Cidade("Histórico")
+        cidade.ativar_historico()
+        cidade.adicionar_construcao("Painel Solar")
+        for _ in range(30):
+            cidade.atualizar_estado()
+
+        historico = cidade.historico
+        assert len(historico) == 30
+        assert list(historico.serie('tempo_jogo', 3)) == [28, 29, 30]
+        assert historico.serie('dinheiro')[-1] == cidade.recursos.dinheiro
+        assert historico.serie('emissao_carbono')[-1] == cidade.recursos.emissao_carbono
+        assert historico.serie('populacao')[-1] == cidade.populacao
+
+    def test_capacidade(self):
+        cidade = Cidade("Histórico")
+        cidade.historico = HistoricoCidade(capacidade=50)
+        for _ in range(200):
+            cidade.atualizar_estado()
+
+        assert len(cidade.historico) == 50
+        assert cidade.historico.serie('tempo_jogo')[0] == 151
+
+    def test_desligado_por_padrao(self):
+        cidade = Cidade("Histórico")
+        cidade.atualizar_estado()
+        assert cidade.historico is None
+
+    def test_bifurcacao_nao_grava(self):
+        """Previsões em bifurcações não tocam no histórico"""
+        cidade = Cidade("Histórico")
+        cidade.ativar_historico()
+        cidade.atualizar_estado()
+        copia = cidade.bifurcar()
+        copia.avancar_ciclos(100)
+
+        assert copia.historico is None
+        assert len(cidade.historico) == 1
+
+
+class CidadeSintetica:
+    """Só o que HistoricoCidade.registrar lê, com emissão em forma de onda"""
+
+    def __init__(self):
+        self.tempo_jogo = 0
+        self.populacao = 100
+        self.recursos = Cidade("Sintética").recursos
+
+    def avancar(self):
+        self.tempo_jogo += 1
+        self.recursos.emissao_carbono = 50 + 40 * math.sin(self.tempo_jogo / 500)
+
+
+def historico_sintetico(ciclos, **kwargs):
+    historico = HistoricoCidade(**kwargs)
+    cidade = CidadeSintetica()
+    for _ in range(ciclos):
+        cidade.avancar()
+        historico.registrar(cidade)
+    return historico
+
+
+class TestAgregadosHistorico:
+    """Testes dos agregados em várias resoluções e do LTTB"""
+
+    def test_agregados_iguais_aos_valores_brutos(self):
+        """Mínimo, máximo e média de cada bloco conferem com os dados brutos"""
+        historico = historico_sintetico(5000)
+        brutos = list(historico.serie('emissao_carbono'))
+
+        for resolucao in HistoricoCidade.RESOLUCOES:
+            minimos, maximos, medias = historico.agregado('emissao_carbono', resolucao)
+            assert len(medias) == 5000 // resolucao
+            for i in range(len(medias)):
+                bloco = brutos[i * resolucao:(i + 1) * resolucao]
+                assert minimos[i] == min(bloco)
+                assert maximos[i] == max(bloco)
+                assert medias[i] == pytest.approx(sum(bloco) / resolucao)
+
+    def test_blocos_por_ciclo_com_saltos(self):
+        """Com atualizar_estado e avancar_ciclos misturados, cada bloco cobre no máximo ``resolucao`` ciclos"""
+        cidade = Cidade("Saltos")
+        historico = cidade.ativar_historico()
+        for rodada in range(6):
+            for _ in range(30):
+                cidade.atualizar_estado()
+            cidade.avancar_ciclos(470 + rodada)
+
+        for resolucao in HistoricoCidade.RESOLUCOES:
+            primeiros, ultimos, _ = historico.agregado('tempo_jogo', resolucao)
+            assert len(primeiros) > 0
+            for primeiro, ultimo in zip(primeiros, ultimos):
+                assert (primeiro - 1) // resolucao == (ultimo - 1) // resolucao
+
+        # Janela em ciclos: só pontos dos últimos 40 ciclos
+        tempos, _ = historico.serie_reduzida('populacao', 100, 40)
+        assert tempos[0] > cidade.tempo_jogo - 40
+
+    def test_lttb(self):
+        """Mantém extremos da janela, respeita o limite e preserva picos"""
+        xs = list(range(1000))
+        ys = [0.0] * 1000
+        ys[500] = 100.0
+        rx, ry = reduzir_lttb(xs, ys, 50)
+
+        assert len(rx) == 50
+        assert rx[0] == 0 and rx[-1] == 999
+        assert rx == sorted(rx)
+        assert 100.0 in ry
+        assert reduzir_lttb(xs[:10], ys[:10], 50) == (xs[:10], ys[:10])
+
+    def test_serie_reduzida_respeita_pontos(self):
+        """Qualquer janela sai com no máximo o número de pontos pedido"""
+        historico = historico_sintetico(60000)
+        for janela in (10, 900, 5000, 40000, None):
+            tempos, valores = historico.serie_reduzida('emissao_carbono', 200, janela)
+            assert 0 < len(valores) <= 200
+            assert len(tempos) == len(valores)
+            assert tempos == sorted(tempos)
+            assert tempos[-1] > 59000
+
+    def test_janela_maior_que_valores_brutos(self):
+        """Janelas além da capacidade bruta usam os agregados"""
+        historico = historico_sintetico(30000, capacidade=1000)
+        tempos, valores = historico.serie_reduzida('emissao_carbono', 100)
+
+        assert tempos[0] < 1000
+        assert min(valores) == pytest.approx(10, abs=1)
+        assert max(valores) == pytest.approx(90, abs=1)
+
+    def test_custo_independe_do_tamanho(self):
+        """Desenhar a partida toda custa o mesmo com 10 mil ou 100 mil ciclos"""
+        tempos_medidos = []
+        for ciclos in (10000, 100000):
+            historico = historico_sintetico(ciclos)
+            inicio = time.perf_counter()
+            for _ in range(20):
+                historico.serie_reduzida('emissao_carbono', 250)
+            tempos_medidos.append(time.perf_counter() - inicio)
+
+        assert tempos_medidos[1] < tempos_medidos[0] * 5 + 0.05
@@ -0,0 +1,100 @@
+"""
+Testes da sessão sem interface e do estimador de risco climático
+"""
+
+import pytest
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from models.cidade import Cidade
+from core.sessao import SessaoJogo
+from core.monte_carlo import estimar_risco_climatico, derivar_sementes, resumir_perdas
+
+PLANO = [
+    (0, 'construir', "Painel Solar"),
+    (2, 'pesquisar', "Energia Solar Avançada"),
+    (20, 'construir', "Parque Eólico"),
+]
+
+
+class TestSessaoJogo:
+    """Testes da SessaoJogo"""
+
+    def test_comandos(self):
+        """Construir, pesquisar e melhorar pela sessão"""
+        sessao = SessaoJogo(Cidade("Teste"), eventos=False)
+
+        assert sessao.executar_comando('construir', "Painel Solar")[0]
+        assert sessao.executar_comando('pesquisar', "Agricultura Vertical")[0]
+        assert sessao.executar_comando('melhorar', 0)[0]
+        assert sessao.cidade.construcoes[0].nivel == 2
+        assert not sessao.executar_comando('melhorar', 5)[0]
+        assert not sessao.executar_comando('pesquisar', "Teletransporte")[0]
+        assert not sessao.executar_comando('demolir', 0)[0]
+
+    def test_jogar_sem_eventos_igual_a_cidade(self):
+        """Sem eventos, jogar o plano equivale a usar a Cidade diretamente"""
+        cidade = SessaoJogo(Cidade("A"), eventos=False).jogar(PLANO, 60)
+
+        esperada = Cidade("B")
+        for ciclo in range(60):
+            if ciclo == 0:
+                esperada.adicionar_construcao("Painel Solar")
+            if ciclo == 20:
+                esperada.adicionar_construcao("Parque Eólico")
+            esperada.atualizar_estado()
+
+        assert cidade.tempo_jogo == 60
+        assert cidade.populacao == esperada.populacao
+        assert cidade.indice.total == 2
+        assert cidade.tecnologia_desbloqueada("Energia Solar Avançada")
+
+    def test_mesma_semente_mesma_partida(self):
+        """A semente define toda a sequência de eventos"""
+        a = SessaoJogo(Cidade("A"), semente=3).jogar(PLANO, 600)
+        b = SessaoJogo(Cidade("B"), semente=3).jogar(PLANO, 600)
+
+        assert a.get_estatisticas()['recursos'] == b.get_estatisticas()['recursos']
+
+
+class TestMonteCarlo:
+    """Testes do estimar_risco_climatico"""
+
+    def test_sementes_derivadas(self):
+        """As sementes dependem só da semente mestra"""
+        assert derivar_sementes(1, 10) == derivar_sementes(1, 10)
+        assert derivar_sementes(1, 10)[:5] == derivar_sementes(1, 5)
+        assert derivar_sementes(1, 10) != derivar_sementes(2, 10)
+
+    def test_resumo(self):
+        """Percentis e CVaR de uma amostra conhecida"""
+        resumo = resumir_perdas(list(range(1, 101)))
+
+        assert resumo['media'] == pytest.approx(50.5)
+        assert resumo['p50'] == pytest.approx(50.5)
+        assert resumo['cvar95'] == pytest.approx(98)
+        assert resumo['maximo'] == 100
+
+    def test_reprodutivel_com_qualquer_numero_de_workers(self):
+        """O resultado é o mesmo em um processo ou em vários"""
+        cidade = Cidade("Teste")
+        serial = estimar_risco_climatico(cidade, PLANO, 300, simulacoes=40, semente=7, workers=1)
+        paralelo = estimar_risco_climatico(cidade, PLANO, 300, simulacoes=40, semente=7,
+                                           workers=2, tamanho_lote=3)
+
+        assert serial['dinheiro'] == paralelo['dinheiro']
+        assert serial['satisfacao'] == paralelo['satisfacao']
+        assert list(serial['perdas_dinheiro']) == list(paralelo['perdas_dinheiro'])
+
+    def test_perdas_contra_partida_sem_eventos(self):
+        """Eventos só tiram dinheiro e satisfação; a cidade original não muda"""
+        cidade = Cidade("Teste")
+        resultado = estimar_risco_climatico(cidade, PLANO, 400, simulacoes=30, semente=1, workers=1)
+
+        assert cidade.tempo_jogo == 0
+        assert cidade.indice.total == 0
+        assert resultado['dinheiro']['minimo'] >= 0
+        assert resultado['dinheiro']['maximo'] > 0
+        assert resultado['dinheiro']['p50'] <= resultado['dinheiro']['p95'] <= resultado['dinheiro']['cvar95']
+        assert resultado['satisfacao']['media'] > 0
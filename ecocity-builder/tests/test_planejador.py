@@ -0,0 +1,66 @@
+"""
+Testes do planejador de ordem de construção
+"""
+
+import pytest
+import sys
+import os
+import time
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from models.cidade import Cidade
+from core.sessao import SessaoJogo, TECNOLOGIAS_POR_NOME
+from core.planejador import PlanejadorConstrucao, EMISSAO, DINHEIRO
+
+
+class TestPlanejadorConstrucao:
+    """Testes do PlanejadorConstrucao"""
+
+    def test_estado_avanca_como_a_cidade(self):
+        """Aplicar e avançar o estado compacto reproduz a Cidade"""
+        planejador = PlanejadorConstrucao()
+        cidade = Cidade("Teste")
+        estado = planejador.estado_de(cidade)
+
+        acao = ('construir', "Painel Solar", 0)
+        estado = planejador.avancar(planejador.aplicar(estado, acao), 40)
+        cidade.adicionar_construcao("Painel Solar")
+        cidade.avancar_ciclos(40)
+
+        assert estado[EMISSAO] == pytest.approx(cidade.recursos.emissao_carbono)
+        assert estado[DINHEIRO] == pytest.approx(cidade.recursos.dinheiro)
+
+    def test_plano_atinge_meta_ao_ser_jogado(self):
+        """O plano encontrado leva a emissão abaixo da meta na partida real"""
+        resultado = PlanejadorConstrucao().planejar(meta_emissao=40, ciclo_limite=200)
+        cidade = SessaoJogo(Cidade("Teste"), eventos=False).jogar(resultado['plano'], 200)
+
+        assert resultado['sucesso']
+        assert cidade.recursos.emissao_carbono < 40
+        assert cidade.recursos.emissao_carbono == pytest.approx(resultado['estado_final']['emissao_carbono'])
+        gasto_pesquisas = sum(TECNOLOGIAS_POR_NOME[alvo].custo
+                              for _, acao, alvo in resultado['plano'] if acao == 'pesquisar')
+        assert resultado['gasto'] == sum(c.custo for c in cidade.construcoes) + gasto_pesquisas
+
+    def test_meta_mais_dificil_custa_mais(self):
+        """Uma meta de emissão menor não sai mais barata"""
+        folgada = PlanejadorConstrucao().planejar(meta_emissao=80, ciclo_limite=150)
+        apertada = PlanejadorConstrucao().planejar(meta_emissao=40, ciclo_limite=150)
+
+        assert folgada['sucesso'] and apertada['sucesso']
+        assert folgada['gasto'] <= apertada['gasto']
+
+    def test_tabela_de_transposicao(self):
+        """Estados equivalentes são descartados em vez de explorados de novo"""
+        planejador = PlanejadorConstrucao()
+        resultado = planejador.planejar(meta_emissao=50, ciclo_limite=100)
+
+        assert resultado['transposicoes'] > 0
+        assert len(planejador.tabela) < resultado['estados_gerados']
+
+    def test_horizonte_de_200_ciclos_em_segundos(self):
+        """Horizonte de 200 ciclos resolvido rapidamente"""
+        inicio = time.perf_counter()
+        PlanejadorConstrucao().planejar(meta_emissao=30, ciclo_limite=200)
+
+        assert time.perf_counter() - inicio < 5
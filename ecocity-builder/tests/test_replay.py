@@ -0,0 +1,81 @@
+"""
+Testes do registro de comandos e da reprodução
+"""
+
+import pytest
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from models.cidade import Cidade
+from core.sessao import SessaoJogo
+from core.replay import RegistroComandos, reproduzir
+
+
+def gravar_partida(semente=5, ciclos=1500):
+    registro = RegistroComandos()
+    sessao = SessaoJogo(Cidade("Gravada"), semente=semente, registro=registro)
+    for ciclo in range(ciclos):
+        if ciclo % 15 == 0:
+            sessao.executar_comando('construir', "Painel Solar" if ciclo % 2 else "Ciclovia")
+        if ciclo == 40:
+            sessao.executar_comando('pesquisar', "Energia Solar Avançada")
+        if ciclo == 60:
+            sessao.executar_comando('salvar', "teste.json")
+        if ciclo % 100 == 99:
+            sessao.executar_comando('melhorar', 0)
+        sessao.avancar_ciclo()
+    sessao.executar_comando('construir', "Parque Público")
+    return registro, sessao
+
+
+class TestRegistroComandos:
+    """Testes do RegistroComandos e de reproduzir"""
+
+    def test_reproducao_identica(self):
+        """A reprodução chega exatamente às mesmas estatísticas"""
+        registro, sessao = gravar_partida()
+        resultado = reproduzir(registro)
+
+        assert resultado['ciclos'] == 1500
+        assert resultado['estatisticas'] == sessao.cidade.get_estatisticas()
+        assert resultado['cidade'].indice.to_dict() == sessao.cidade.indice.to_dict()
+        assert resultado['ticks_por_segundo'] > 0
+
+    def test_registro_grava_comandos_e_semente(self):
+        """Comandos ficam marcados com o ciclo em que foram executados"""
+        registro, sessao = gravar_partida(semente=9, ciclos=50)
+
+        assert registro.semente == 9
+        assert registro.ciclos == 50
+        assert registro.comandos[0] == (0, 'construir', "Ciclovia")
+        assert (40, 'pesquisar', "Energia Solar Avançada") in registro.comandos
+        assert registro.comandos[-1] == (50, 'construir', "Parque Público")
+
+    def test_salvar_e_carregar(self, tmp_path):
+        """O registro em JSON reproduz a mesma partida"""
+        registro, sessao = gravar_partida(semente=12)
+        caminho = tmp_path / "partida.json"
+        registro.salvar(caminho)
+
+        carregado = RegistroComandos.carregar(caminho)
+
+        assert carregado.comandos == registro.comandos
+        assert reproduzir(carregado)['estatisticas'] == sessao.cidade.get_estatisticas()
+
+    def test_semente_sorteada_e_gravada(self):
+        """Sem semente explícita a sessão sorteia uma e a grava"""
+        registro = RegistroComandos()
+        sessao = SessaoJogo(Cidade("Sem semente"), registro=registro)
+        sessao.jogar([(0, 'construir', "Ciclovia")], 800)
+
+        assert registro.semente == sessao.semente
+        assert reproduzir(registro)['estatisticas'] == sessao.cidade.get_estatisticas()
+
+    def test_exige_cidade_nova(self):
+        """Não é possível gravar a partir de uma cidade já jogada"""
+        cidade = Cidade("Usada")
+        cidade.atualizar_estado()
+
+        with pytest.raises(ValueError):
+            SessaoJogo(cidade, registro=RegistroComandos())
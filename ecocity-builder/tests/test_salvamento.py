@@ -0,0 +1,147 @@
+"""
+Testes do GerenciadorSalvamento
+"""
+
+import pytest
+import sys
+import os
+import json
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+import auxiliares
+from core.salvamento import GerenciadorSalvamento, NOME_MANIFESTO
+
+
+def criar_cidade(nome, ciclos=0):
+    return auxiliares.criar_cidade(nome, paineis=1, ciclovias=0, tecnologias=(), ciclos=ciclos)
+
+
+class TestManifestoSaves:
+    """Testes do manifesto usado por listar_saves"""
+
+    def test_salvar_atualiza_manifesto(self, tmp_path):
+        gerenciador = GerenciadorSalvamento(str(tmp_path))
+        gerenciador.salvar_jogo(criar_cidade("Alfa", 5), "alfa.json")
+        gerenciador.salvar_jogo(criar_cidade("Beta", 9), "beta.json")
+
+        entradas = gerenciador.carregar_manifesto()
+        assert set(entradas) == {"alfa.json", "beta.json"}
+        assert entradas["beta.json"]['metadados']['tempo_jogo'] == 9
+        assert entradas["alfa.json"]['tamanho'] == os.path.getsize(tmp_path / "alfa.json")
+
+        saves = gerenciador.listar_saves()
+        assert {save['cidade'] for save in saves} == {"Alfa", "Beta"}
+        assert NOME_MANIFESTO not in {save['arquivo'] for save in saves}
+
+    def test_listagem_nao_abre_saves_inalterados(self, tmp_path):
+        """Com mtime e tamanho iguais, vale o que está no manifesto"""
+        gerenciador = GerenciadorSalvamento(str(tmp_path))
+        gerenciador.salvar_jogo(criar_cidade("Alfa", 5), "alfa.json")
+        caminho = tmp_path / "alfa.json"
+        info = os.stat(caminho)
+
+        # Conteúdo inválido com o mesmo tamanho e mtime: não é relido
+        caminho.write_bytes(b'x' * info.st_size)
+        os.utime(caminho, ns=(info.st_atime_ns, info.st_mtime_ns))
+
+        saves = gerenciador.listar_saves()
+        assert [save['cidade'] for save in saves] == ["Alfa"]
+
+    def test_save_alterado_por_fora_e_relido(self, tmp_path):
+        gerenciador = GerenciadorSalvamento(str(tmp_path))
+        gerenciador.salvar_jogo(criar_cidade("Alfa", 5), "alfa.json")
+        caminho = tmp_path / "alfa.json"
+
+        dados = json.loads(caminho.read_text(encoding='utf-8'))
+        dados['cidade']['nome'] = "Alfa Editada"
+        caminho.write_text(json.dumps(dados), encoding='utf-8')
+
+        assert [save['cidade'] for save in gerenciador.listar_saves()] == ["Alfa Editada"]
+        assert gerenciador.carregar_manifesto()["alfa.json"]['metadados']['cidade'] == "Alfa Editada"
+
+    def test_deletar_e_arquivos_removidos(self, tmp_path):
+        gerenciador = GerenciadorSalvamento(str(tmp_path))
+        for nome in ("a", "b", "c"):
+            gerenciador.salvar_jogo(criar_cidade(nome), f"{nome}.json")
+
+        gerenciador.deletar_save("a.json")
+        assert "a.json" not in gerenciador.carregar_manifesto()
+
+        os.remove(tmp_path / "b.json")
+        assert [save['arquivo'] for save in gerenciador.listar_saves()] == ["c.json"]
+        assert set(gerenciador.carregar_manifesto()) == {"c.json"}
+
+    def test_manifesto_reconstruido(self, tmp_path):
+        """Sem manifesto (saves antigos) ou com manifesto corrompido, a listagem o refaz"""
+        gerenciador = GerenciadorSalvamento(str(tmp_path))
+        gerenciador.salvar_jogo(criar_cidade("Alfa"), "alfa.json")
+        gerenciador.salvar_jogo(criar_cidade("Beta"), "beta.json")
+
+        (tmp_path / NOME_MANIFESTO).write_text("{corrompido", encoding='utf-8')
+        assert len(gerenciador.listar_saves()) == 2
+        assert set(gerenciador.carregar_manifesto()) == {"alfa.json", "beta.json"}
+
+        os.remove(tmp_path / NOME_MANIFESTO)
+        assert len(gerenciador.listar_saves()) == 2
+        assert (tmp_path / NOME_MANIFESTO).exists()
+
+
+class TestSalvamentoSegundoPlano:
+    """Testes do salvamento em segundo plano e da gravação atômica"""
+
+    def test_mesmo_conteudo_que_salvar_jogo(self, tmp_path):
+        gerenciador = GerenciadorSalvamento(str(tmp_path))
+        cidade = criar_cidade("Fundo", 20)
+        gerenciador.salvar_jogo(cidade, "direto.json")
+
+        assert gerenciador.salvar_em_segundo_plano(cidade, "fundo.json")
+        resultados = gerenciador.aguardar_salvamentos()
+
+        assert resultados == [(True, "Jogo salvo em fundo.json")]
+        direto = json.loads((tmp_path / "direto.json").read_text(encoding='utf-8'))
+        fundo = json.loads((tmp_path / "fundo.json").read_text(encoding='utf-8'))
+        del direto['metadata']['data_salvamento'], fundo['metadata']['data_salvamento']
+        assert fundo == direto
+        assert "fundo.json" in gerenciador.carregar_manifesto()
+
+    def test_grava_o_estado_do_momento_do_pedido(self, tmp_path):
+        """Ciclos jogados depois do pedido não entram no save"""
+        gerenciador = GerenciadorSalvamento(str(tmp_path))
+        cidade = criar_cidade("Fundo", 5)
+        gerenciador.salvar_em_segundo_plano(cidade, "fundo.json")
+        for _ in range(50):
+            cidade.atualizar_estado()
+        cidade.adicionar_construcao("Ciclovia")
+        gerenciador.aguardar_salvamentos()
+
+        dados = json.loads((tmp_path / "fundo.json").read_text(encoding='utf-8'))
+        assert dados['cidade']['tempo_jogo'] == 5
+        assert len(dados['cidade']['construcoes']) == 1
+
+    def test_um_salvamento_por_vez(self, tmp_path):
+        gerenciador = GerenciadorSalvamento(str(tmp_path))
+        cidade = criar_cidade("Fundo")
+        gerenciador.salvar_em_segundo_plano(cidade, "a.json")
+        # Recusado se o primeiro ainda estiver gravando; nenhum resultado se perde
+        segundo = gerenciador.salvar_em_segundo_plano(cidade, "b.json")
+        resultados = gerenciador.aguardar_salvamentos()
+
+        assert len(resultados) == (2 if segundo else 1)
+        assert all(sucesso for sucesso, _ in resultados)
+        assert gerenciador.coletar_salvamentos() == []
+        assert os.path.exists(tmp_path / "b.json") == segundo
+
+    def test_falha_nao_deixa_arquivo_pela_metade(self, tmp_path):
+        """Um erro ao serializar não apaga o save anterior nem deixa temporários"""
+        gerenciador = GerenciadorSalvamento(str(tmp_path))
+        cidade = criar_cidade("Fundo")
+        gerenciador.salvar_jogo(cidade, "fundo.json")
+        original = (tmp_path / "fundo.json").read_bytes()
+
+        dados = gerenciador.montar_dados_save(cidade)
+        dados['cidade']['invalido'] = object()
+        sucesso, mensagem = gerenciador.gravar_save(dados, "fundo.json")
+
+        assert not sucesso
+        assert (tmp_path / "fundo.json").read_bytes() == original
+        assert sorted(os.listdir(tmp_path)) == [NOME_MANIFESTO, "fundo.json"]
@@ -0,0 +1,95 @@
+"""
+Testes do motor de simulação vetorizado contra a Cidade de referência
+"""
+
+import pytest
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+np = pytest.importorskip("numpy")
+
+from models.cidade import Cidade
+from core.simulacao_vetorizada import SimuladorVetorizado
+
+
+def criar_cidades_variadas():
+    """Cria cidades cobrindo os três regimes de crescimento populacional"""
+    cidades = []
+    for dificuldade in ["Fácil", "Médio", "Difícil"]:
+        for construcoes in [[], ["Painel Solar"], ["Parque Público", "Ciclovia", "Ciclovia"]]:
+            cidade = Cidade(f"Teste {dificuldade}", dificuldade)
+            for nome in construcoes:
+                cidade.adicionar_construcao(nome)
+            cidades.append(cidade)
+
+    em_crise = Cidade("Crise")
+    em_crise.recursos.satisfacao_populacional = 30
+    em_crise.populacao = 5000
+    cidades.append(em_crise)
+    return cidades
+
+
+def comparar(simulador, cidades):
+    for i, cidade in enumerate(cidades):
+        assert simulador.populacao[i] == cidade.populacao
+        assert simulador.tempo_jogo[i] == cidade.tempo_jogo
+        assert simulador.dinheiro[i] == cidade.recursos.dinheiro
+        assert simulador.emissao_carbono[i] == cidade.recursos.emissao_carbono
+        assert simulador.satisfacao[i] == cidade.recursos.satisfacao_populacional
+        assert simulador.total_construcoes[i] == len(cidade.construcoes)
+
+
+class TestSimuladorVetorizado:
+    """Testes do SimuladorVetorizado"""
+
+    def test_valores_iniciais_por_dificuldade(self):
+        """Os valores iniciais seguem Cidade._ajustar_dificuldade"""
+        for dificuldade in ["Fácil", "Médio", "Difícil"]:
+            simulador = SimuladorVetorizado(3, dificuldade)
+            comparar(simulador, [Cidade("x", dificuldade)] * 3)
+
+    def test_avancar_igual_a_referencia(self):
+        """Avançar ciclos reproduz exatamente Cidade.atualizar_estado"""
+        cidades = criar_cidades_variadas()
+        simulador = SimuladorVetorizado.from_cidades(cidades)
+
+        for _ in range(400):
+            for cidade in cidades:
+                cidade.atualizar_estado()
+        simulador.avancar(400)
+
+        comparar(simulador, cidades)
+
+    def test_construir_igual_a_referencia(self):
+        """Construções em lote seguem Cidade.adicionar_construcao"""
+        cidades = [Cidade(f"C{i}", d) for i, d in enumerate(["Fácil", "Médio", "Difícil"] * 2)]
+        simulador = SimuladorVetorizado.from_cidades(cidades)
+
+        pedidos = ["Parque Eólico", "Parque Público", "Parque Público", "Transporte Elétrico", "Painel Solar"]
+        for ciclo in range(30):
+            nome = pedidos[ciclo % len(pedidos)]
+            resultado = simulador.construir(nome)
+            for i, cidade in enumerate(cidades):
+                sucesso, _ = cidade.adicionar_construcao(nome)
+                assert resultado[i] == sucesso
+            for cidade in cidades:
+                cidade.atualizar_estado()
+            simulador.atualizar_estado()
+
+        comparar(simulador, cidades)
+
+    def test_requisito_de_tecnologia(self):
+        """Construções com requisito só são feitas onde a tecnologia existe"""
+        simulador = SimuladorVetorizado(4, "Fácil")
+        simulador.desbloquear_tecnologia("Eletrificação", [1, 3])
+
+        resultado = simulador.construir("Transporte Elétrico")
+
+        assert resultado.tolist() == [False, True, False, True]
+        assert simulador.dinheiro.tolist() == [1500, 900, 1500, 900]
+
+    def test_construcao_inexistente(self):
+        simulador = SimuladorVetorizado(2)
+        with pytest.raises(ValueError):
+            simulador.construir("Castelo")
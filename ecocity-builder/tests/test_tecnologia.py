@@ -0,0 +1,162 @@
+"""
+Testes da árvore de tecnologias compilada em máscaras de bits
+"""
+
+import pytest
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from models.arvore_tecnologias import ArvoreTecnologias
+from models.cidade import Cidade
+from models.construcao import Construcao, TipoConstrucao
+from models.tecnologia import Tecnologia, TipoTecnologia, TECNOLOGIAS_DISPONIVEIS, ARVORE_TECNOLOGIAS
+
+
+def tecnologia(nome, requisitos=()):
+    return Tecnologia(nome, TipoTecnologia.TECNOLOGIA, 100, 5, requisitos=list(requisitos))
+
+
+class TestArvoreTecnologias:
+    """Testes da ArvoreTecnologias"""
+
+    def test_fechamento_transitivo(self):
+        arvore = ARVORE_TECNOLOGIAS
+        captura = arvore.fechamento[arvore.ids["Captura de Carbono"]]
+
+        assert set(arvore.nomes_da_mascara(captura)) == {
+            "Smart Grid", "Energia Solar Avançada", "Materiais Sustentáveis"
+        }
+
+    def test_pode_pesquisar_com_mascara(self):
+        cidade = Cidade("Árvore", "Fácil")
+        cidade.recursos.dinheiro = 100000
+        smart_grid = next(t for t in TECNOLOGIAS_DISPONIVEIS if t.nome == "Smart Grid")
+
+        sucesso, mensagem = smart_grid.iniciar_pesquisa(cidade)
+        assert not sucesso
+        assert mensagem == "Requisito não atendido: Energia Solar Avançada"
+
+        cidade.tecnologias_desbloqueadas = ["Energia Solar Avançada", "Materiais Sustentáveis"]
+        sucesso, _ = smart_grid.iniciar_pesquisa(cidade)
+        assert sucesso
+        smart_grid.pesquisando = False
+
+    def test_requisito_de_construcao(self):
+        cidade = Cidade("Árvore", "Fácil")
+        assert cidade.adicionar_construcao("Transporte Elétrico") == (False, "Tecnologia Eletrificação necessária")
+
+        assert cidade.desbloquear_tecnologia("Eletrificação")
+        assert not cidade.desbloquear_tecnologia("Eletrificação")
+        assert cidade.tecnologias_desbloqueadas == ["Eletrificação"]
+        assert cidade.adicionar_construcao("Transporte Elétrico")[0]
+
+    def test_nomes_fora_da_arvore_nao_a_alteram(self):
+        arvore = ARVORE_TECNOLOGIAS
+        nomes = list(arvore.nomes)
+        cidade = Cidade("Árvore", "Fácil")
+
+        assert arvore.bit("Teletransporte") == 0
+        assert arvore.mascara_requisitos(["Teletransporte", "Smart Grid"]) == arvore.mascara_requisitos(["Smart Grid"])
+        assert cidade.desbloquear_tecnologia("Teletransporte")
+        assert not cidade.desbloquear_tecnologia("Teletransporte")
+        assert cidade.tecnologia_desbloqueada("Teletransporte")
+        assert cidade.mascara_tecnologias == 0
+        assert arvore.nomes == nomes
+
+    def test_requisito_novo_de_construcao(self):
+        """Um requisito que não é tecnologia do catálogo vira folha da árvore"""
+        teleferico = Construcao("Teleférico", TipoConstrucao.TRANSPORTE, 100, -1, 1, ["Levitação"])
+        cidade = Cidade("Árvore", "Fácil")
+
+        assert ARVORE_TECNOLOGIAS.bit("Levitação")
+        assert teleferico.pode_construir(cidade.recursos, cidade.mascara_tecnologias) == (
+            False, "Tecnologia Levitação necessária")
+        cidade.desbloquear_tecnologia("Levitação")
+        assert teleferico.pode_construir(cidade.recursos, cidade.mascara_tecnologias)[0]
+
+    def test_ciclo_detectado(self):
+        with pytest.raises(ValueError):
+            ArvoreTecnologias([tecnologia("A", ["B"]), tecnologia("B", ["A"])])
+
+    def test_arvore_grande(self):
+        """Uma cadeia de milhares de tecnologias compila sem recursão"""
+        tecnologias = [tecnologia("T0")] + [tecnologia(f"T{i}", [f"T{i - 1}"]) for i in range(1, 5000)]
+        arvore = ArvoreTecnologias(tecnologias)
+
+        ultima = arvore.fechamento[arvore.ids["T4999"]]
+        assert ultima == (1 << 4999) - 1
+        assert arvore.requisitos_faltando(["T4999"], ultima) == ["T4999"]
+
+
+def tecnologias_de_teste():
+    """Tecnologias novas a cada teste, sem estado compartilhado com o catálogo"""
+    return {
+        "Solar": Tecnologia("Solar", TipoTecnologia.ENERGIA, 100, 5, beneficios={'reducao_emissao': -10}),
+        "Rede": Tecnologia("Rede", TipoTecnologia.TECNOLOGIA, 100, 3, requisitos=["Solar"],
+                           beneficios={'bonus_satisfacao': 5}),
+        "Hortas": Tecnologia("Hortas", TipoTecnologia.AGRICULTURA, 100, 4, beneficios={'bonus_satisfacao': 1}),
+    }
+
+
+class TestAgendadorPesquisas:
+    """Testes da fila de pesquisas com laboratórios paralelos"""
+
+    def test_laboratorios_paralelos_e_fila(self):
+        tecs = tecnologias_de_teste()
+        cidade = Cidade("Labs", "Fácil")
+        cidade.pesquisas.slots = 2
+
+        assert cidade.pesquisas.enfileirar(tecs["Solar"]) == (True, "Pesquisa de Solar iniciada!")
+        assert cidade.pesquisas.enfileirar(tecs["Rede"])[0]
+        assert cidade.pesquisas.enfileirar(tecs["Hortas"]) == (True, "Hortas adicionada à fila de pesquisas")
+        assert cidade.pesquisas.enfileirar(tecs["Solar"]) == (False, "Tecnologia já em pesquisa")
+
+        # Rede espera Solar; Hortas espera na fila atrás de Rede
+        assert not cidade.pesquisas.em_pesquisa("Rede")
+
+        for _ in range(5):
+            cidade.atualizar_estado()
+        assert cidade.tecnologia_desbloqueada("Solar")
+        assert cidade.pesquisas.em_pesquisa("Rede")
+
+        for _ in range(3):
+            cidade.atualizar_estado()
+        assert cidade.tecnologias_desbloqueadas == ["Solar", "Rede"]
+        assert cidade.pesquisas.em_pesquisa("Hortas")
+
+    def test_beneficios_aplicados_uma_vez(self):
+        tecs = tecnologias_de_teste()
+        cidade = Cidade("Callbacks", "Fácil")
+        concluidas = []
+        cidade.pesquisas.callbacks.append(lambda c, t: concluidas.append(t.nome))
+        emissao_inicial = cidade.recursos.emissao_carbono
+
+        cidade.pesquisas.enfileirar(tecs["Solar"])
+        for _ in range(50):
+            cidade.pesquisas.atualizar()
+            cidade.tempo_jogo += 1
+
+        assert concluidas == ["Solar"]
+        assert cidade.recursos.emissao_carbono == emissao_inicial - 10
+        assert cidade.recursos.dinheiro == 1500 - 100
+
+    def test_avancar_ciclos_com_pesquisas(self):
+        """O salto de tempo para nas conclusões de pesquisa"""
+        referencia = Cidade("Ref", "Fácil")
+        salto = Cidade("Salto", "Fácil")
+        for cidade in (referencia, salto):
+            tecs = tecnologias_de_teste()
+            cidade.recursos.dinheiro = 150
+            for nome in ["Solar", "Rede", "Hortas"]:
+                cidade.pesquisas.enfileirar(tecs[nome])
+
+        for _ in range(40):
+            referencia.atualizar_estado()
+        salto.avancar_ciclos(40)
+
+        assert salto.tecnologias_desbloqueadas == referencia.tecnologias_desbloqueadas
+        assert salto.populacao == referencia.populacao
+        assert salto.recursos.satisfacao_populacional == referencia.recursos.satisfacao_populacional
+        assert salto.recursos.dinheiro == pytest.approx(referencia.recursos.dinheiro, rel=1e-12)
+        assert salto.recursos.emissao_carbono == pytest.approx(referencia.recursos.emissao_carbono, rel=1e-12)